@@ -46,8 +46,19 @@ from collections import defaultdict
 
 # UPDATED IMPORT: Use the new enhanced engine
 
-from horary_engine.engine import HoraryEngine, serialize_planet_with_solar
-from horary_engine.services.geolocation import LocationError
+from horary_engine.engine import HoraryEngine, chart_flight, serialize_planet_with_solar
+from horary_engine.profiles import get_profile_registry
+from horary_engine.services.geolocation import (
+
+    LocationError,
+
+    geocode_flight,
+
+    get_geocode_cache,
+
+    get_timezone_manager,
+
+)
 
 
 def safe_log(logger, level, message):
@@ -99,6 +110,10 @@ CORS(app)  # Enable CORS for all routes
 
 horary_engine = HoraryEngine()
 
+# Compile every judgment profile before serving (see horary_engine/profiles.py)
+
+get_profile_registry()
+
 
 
 # Simple metrics collection
@@ -275,11 +290,7 @@ def health_check():
 
     try:
 
-        from timezonefinder import TimezoneFinder
-
-        tf = TimezoneFinder()
-
-        test_tz = tf.timezone_at(lat=51.5074, lng=-0.1278)  # London
+        test_tz = get_timezone_manager().timezone_at(51.5074, -0.1278)  # London
 
         health_status['services']['timezone_finder'] = {
 
@@ -465,9 +476,7 @@ def get_timezone():
 
             # Get timezone using enhanced timezone manager
 
-            from horary_engine.services.geolocation import TimezoneManager
-
-            timezone_manager = TimezoneManager()
+            timezone_manager = get_timezone_manager()
 
             timezone_str = timezone_manager.get_timezone_for_location(lat, lon)
 
@@ -595,9 +604,7 @@ def get_current_time():
 
             # Get current time using enhanced timezone manager
 
-            from horary_engine.services.geolocation import TimezoneManager
-
-            timezone_manager = TimezoneManager()
+            timezone_manager = get_timezone_manager()
 
             dt_local, dt_utc, timezone_used = timezone_manager.get_current_time_for_location(lat, lon)
 
@@ -751,6 +758,8 @@ def calculate_chart():
 
         exaltation_confidence_boost = data.get('exaltationConfidenceBoost', 15.0)
 
+        profile = data.get('profile')
+
         
 
         logger.info(f"ENHANCED chart calculation request:")
@@ -835,6 +844,24 @@ def calculate_chart():
 
         
 
+        # Judgment profile (configuration) to use
+
+        if profile is not None and profile not in get_profile_registry():
+
+            return jsonify({
+
+                'error': f'Unknown judgment profile: {profile}',
+
+                'judgment': 'ERROR',
+
+                'confidence': 0,
+
+                'reasoning': ['Unknown judgment profile']
+
+            }), 400
+
+        
+
         # Convert manual houses if provided
 
         houses_list = None
@@ -907,7 +934,9 @@ def calculate_chart():
 
                 "ignore_saturn_7th": ignore_saturn_7th,
 
-                "exaltation_confidence_boost": exaltation_confidence_boost
+                "exaltation_confidence_boost": exaltation_confidence_boost,
+
+                "profile": profile
 
             }
 
@@ -1077,6 +1106,192 @@ def calculate_chart():
 
 
 
+@app.route('/api/chart', methods=['POST'])
+
+@timing_decorator('chart')
+
+def create_chart():
+
+    """Calculate a chart once and return its handle for /api/judge"""
+
+    try:
+
+        data = request.get_json()
+
+        
+
+        if not data:
+
+            return jsonify({'error': 'No JSON data provided'}), 400
+
+        
+
+        location = (data.get('location') or '').strip()
+
+        date_str = data.get('date')
+
+        time_str = data.get('time')
+
+        use_current_time = data.get('useCurrentTime', True)
+
+        
+
+        if not location:
+
+            return jsonify({'error': 'Location is required'}), 400
+
+        if not use_current_time and (not date_str or not time_str):
+
+            return jsonify({'error': 'Date and time are required when not using current time'}), 400
+
+        
+
+        result = horary_engine.create_chart({
+
+            "location": location,
+
+            "date": date_str,
+
+            "time": time_str,
+
+            "timezone": data.get('timezone'),
+
+            "use_current_time": use_current_time,
+
+            "profile": data.get('profile')
+
+        })
+
+        
+
+        if result.get('error'):
+
+            logger.error(f"Chart calculation error: {result['error']}")
+
+            status = 400 if result.get('error_type') in ('LocationError', 'ProfileError') else 500
+
+            return jsonify(result), status
+
+        
+
+        logger.info(f"Chart {result['chart_id']} ready for {location}")
+
+        return jsonify(result)
+
+        
+
+    except Exception as e:
+
+        logger.error(f"Error calculating chart: {str(e)}")
+
+        logger.error(traceback.format_exc())
+
+        return jsonify({'error': f'Error calculating chart: {str(e)}'}), 500
+
+
+
+
+
+@app.route('/api/judge', methods=['POST'])
+
+@timing_decorator('judge')
+
+def judge_chart():
+
+    """Judge a question against a chart from /api/chart"""
+
+    try:
+
+        data = request.get_json()
+
+        
+
+        if not data:
+
+            return jsonify({'error': 'No JSON data provided'}), 400
+
+        
+
+        chart_id = data.get('chartId')
+
+        question = (data.get('question') or '').strip()
+
+        manual_houses = data.get('manualHouses')
+
+        
+
+        if not chart_id:
+
+            return jsonify({'error': 'chartId is required (see /api/chart)'}), 400
+
+        if not question:
+
+            return jsonify({'error': 'Question is required'}), 400
+
+        
+
+        houses_list = None
+
+        if manual_houses:
+
+            try:
+
+                houses_list = [int(h.strip()) for h in manual_houses.split(',') if h.strip()]
+
+            except ValueError:
+
+                houses_list = []
+
+            if len(houses_list) < 2:
+
+                return jsonify({'error': 'Manual houses must be numbers separated by commas, at least querent and quesited (e.g., "1,7")'}), 400
+
+        
+
+        result = horary_engine.judge_chart(chart_id, question, {
+
+            "manual_houses": houses_list,
+
+            "ignore_radicality": data.get('ignoreRadicality', False),
+
+            "ignore_void_moon": data.get('ignoreVoidMoon', False),
+
+            "ignore_combustion": data.get('ignoreCombustion', False),
+
+            "ignore_saturn_7th": data.get('ignoreSaturn7th', False),
+
+            "exaltation_confidence_boost": data.get('exaltationConfidenceBoost')
+
+        })
+
+        
+
+        if result.get('error'):
+
+            logger.error(f"Judgment error for chart {chart_id}: {result['error']}")
+
+            return jsonify(result), 404 if result.get('error_type') == 'ChartNotFound' else 500
+
+        
+
+        logger.info(f"Chart {chart_id} judged - Judgment: {result.get('judgment')} (Confidence: {result.get('confidence')}%)")
+
+        return jsonify(result)
+
+        
+
+    except Exception as e:
+
+        logger.error(f"Error judging chart: {str(e)}")
+
+        logger.error(traceback.format_exc())
+
+        return jsonify({'error': f'Error judging chart: {str(e)}'}), 500
+
+
+
+
+
 @app.route('/api/moon-debug', methods=['POST'])
 
 @timing_decorator('moon_debug')
@@ -1155,12 +1370,36 @@ def get_metrics():
 
     try:
 
+        geocode_cache = get_geocode_cache()
+
         return jsonify({
 
             'status': 'success',
 
             'metrics': metrics.get_stats(),
 
+            'ephemeris_cache': horary_engine.engine.calculator.ephemeris.stats(),
+
+            'geocode_cache': geocode_cache.stats() if geocode_cache is not None else {'enabled': False},
+
+            'timezone_cache': get_timezone_manager().cache_stats(),
+
+            'result_cache': (horary_engine.result_cache.stats()
+
+                             if horary_engine.result_cache is not None else {'enabled': False}),
+
+            'chart_store': horary_engine.chart_store.stats(),
+
+            'profiles': get_profile_registry().describe(),
+
+            'single_flight': {
+
+                'geocode': geocode_flight.stats(),
+
+                'chart': chart_flight.stats(),
+
+            },
+
             'enhanced_engine_stats': {
 
                 'version': '2.0.0',
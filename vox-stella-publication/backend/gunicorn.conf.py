@@ -1,3 +1,5 @@
+import os
+
 bind = "0.0.0.0:5000"
 workers = 2
 threads = 2
@@ -6,3 +8,10 @@ graceful_timeout = 30
 keepalive = 2
 accesslog = "-"
 errorlog = "-"
+
+# Import the app once in the master so the timezone polygons and engine
+# tables are loaded before fork and shared by the workers. The polygon data
+# is read into memory; file-backed TimezoneFinder handles must not be shared
+# across processes.
+preload_app = True
+os.environ.setdefault("HORARY_TIMEZONE_IN_MEMORY", "1")
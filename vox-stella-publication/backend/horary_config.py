@@ -2,15 +2,29 @@
 Horary Engine Configuration Loader
 Loads and caches configuration from YAML file with lazy singleton pattern
 
+The YAML is compiled once into a frozen snapshot: every mapping becomes a
+slotted, read-only ``ConfigNode`` and every list a tuple, defaults for
+optional keys are filled in and type-checked at load time, and the root
+carries a ``content_hash`` of the resolved configuration for use in cache
+keys.
+
 Created for horary_engine.py refactor
 """
 
+import copy
+import hashlib
+import json
+import keyword
 import os
 import yaml
 import logging
 from pathlib import Path
-from types import SimpleNamespace
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, Type
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +34,248 @@ class HoraryError(Exception):
     pass
 
 
+# Optional keys and the values used when the YAML leaves them out.  A key
+# present in the YAML must have the same type as its default.
+DEFAULTS: Dict[str, Any] = {
+    'timing': {
+        'station_index_enabled': True,
+        'station_index_path': 'cache/station_index.json',
+        'station_index_start_year': 1900,
+        'station_index_end_year': 2100,
+        'perfection_horizon_days': 365,
+    },
+    'ephemeris': {
+        'backend': 'swisseph',
+        'chebyshev_path': 'cache/chebyshev_ephemeris.npz',
+        'chebyshev_start_year': 1950,
+        'chebyshev_end_year': 2050,
+    },
+    'result_cache': {
+        'enabled': True,
+        'max_entries': 512,
+        'ttl_seconds': 600,
+        'current_time_bucket_seconds': 60,
+        'coordinate_decimals': 4,
+    },
+    'chart_store': {
+        'max_entries': 256,
+        'ttl_seconds': 3600,
+    },
+    'moon': {
+        'void_penalty': 10,
+        'void_gating': False,
+    },
+    'radicality': {
+        'gating': False,
+        'asc_warning_penalty': 15,
+        'hour_agreement_enabled': False,
+        'hour_agreement_mode': 'ruler',
+    },
+    'retrograde': {
+        'quesited_penalty': 12,
+    },
+    'solar': {
+        'severe_impediment_denial_enabled': False,
+    },
+}
+
+# Moiety used for a planet missing from ``orbs.moieties``
+DEFAULT_MOIETY = 8.0
+TRADITIONAL_PLANETS = ('Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn')
+
+
+class ConfigNode:
+    """Read-only configuration mapping with attribute access.
+
+    Concrete node classes are generated per set of keys with one slot per
+    key, so attribute lookups are plain slot reads.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Configuration is read-only, cannot set '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Configuration is read-only, cannot delete '{name}'")
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, field) for field in self._fields)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ConfigNode):
+            return NotImplemented
+        return self._fields == other._fields and self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash((self._fields, self._values()))
+
+    def __repr__(self) -> str:
+        items = ', '.join(f"{field}={getattr(self, field)!r}" for field in self._fields)
+        return f"ConfigNode({items})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain nested dict/list copy of this node"""
+        return {field: _to_plain(getattr(self, field)) for field in self._fields}
+
+    # Nodes are immutable, so copies can share them
+    def __copy__(self) -> 'ConfigNode':
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'ConfigNode':
+        return self
+
+    def __reduce__(self):
+        return (_compile_node, (self.to_dict(),))
+
+
+class ConfigSnapshot(ConfigNode):
+    """Root of a compiled configuration, identified by its content hash"""
+
+    __slots__ = ('content_hash',)
+
+    def __repr__(self) -> str:
+        return f"ConfigSnapshot(content_hash={self.content_hash!r})"
+
+    def __reduce__(self):
+        return (compile_config, (self.to_dict(),))
+
+
+_node_types: Dict[Tuple[Type[ConfigNode], Tuple[str, ...]], Type[ConfigNode]] = {}
+
+
+def _node_type(base: Type[ConfigNode], fields: Tuple[str, ...]) -> Type[ConfigNode]:
+    """Slotted ``base`` subclass for ``fields``, shared by nodes with the same keys"""
+    node_type = _node_types.get((base, fields))
+    if node_type is None:
+        node_type = type(base.__name__, (base,), {'__slots__': fields, '_fields': fields})
+        _node_types[(base, fields)] = node_type
+    return node_type
+
+
+def _to_plain(value: Any) -> Any:
+    if isinstance(value, ConfigNode):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+def _freeze(value: Any, path: str) -> Any:
+    if isinstance(value, dict):
+        return _compile_node(value, path)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item, f"{path}[{i}]") for i, item in enumerate(value))
+    return value
+
+
+_RESERVED_KEYS = frozenset(dir(ConfigSnapshot))
+
+
+def _check_keys(d: Dict[Any, Any], path: str) -> Tuple[str, ...]:
+    for key in d:
+        if not isinstance(key, str) or not key.isidentifier() or keyword.iskeyword(key):
+            raise HoraryError(f"Configuration key {path + '.' if path else ''}{key!r} is not a valid name")
+        if key in _RESERVED_KEYS:
+            raise HoraryError(f"Configuration key {path + '.' if path else ''}{key} is reserved")
+    return tuple(d)
+
+
+def _compile_node(d: Dict[str, Any], path: str = '',
+                  base: Type[ConfigNode] = ConfigNode) -> ConfigNode:
+    fields = _check_keys(d, path)
+    node = object.__new__(_node_type(base, fields))
+    for key in fields:
+        object.__setattr__(node, key, _freeze(d[key], f"{path}.{key}" if path else key))
+    return node
+
+
+def _apply_defaults(d: Dict[str, Any], defaults: Dict[str, Any], path: str = '') -> None:
+    for key, default in defaults.items():
+        key_path = f"{path}.{key}" if path else key
+        if key not in d:
+            d[key] = copy.deepcopy(default)
+        elif isinstance(default, dict):
+            if not isinstance(d[key], dict):
+                raise HoraryError(f"Configuration key {key_path} must be a mapping")
+            _apply_defaults(d[key], default, key_path)
+        elif not _same_type(d[key], default):
+            raise HoraryError(
+                f"Configuration key {key_path} must be of type {type(default).__name__}, "
+                f"got {d[key]!r}"
+            )
+
+
+def _same_type(value: Any, default: Any) -> bool:
+    if isinstance(default, bool) or isinstance(value, bool):
+        return isinstance(value, bool) and isinstance(default, bool)
+    if isinstance(default, (int, float)):
+        return isinstance(value, (int, float))
+    return isinstance(value, type(default))
+
+
+def resolve_config(config_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of ``config_dict`` with defaults filled in and checked"""
+    resolved = copy.deepcopy(config_dict)
+    _apply_defaults(resolved, DEFAULTS)
+
+    orbs = resolved.get('orbs')
+    if isinstance(orbs, dict):
+        moieties = orbs.get('moieties')
+        if moieties is None:
+            # Moiety orbs disabled: aspects fall back to the fixed orbs
+            orbs['moieties'] = None
+        elif isinstance(moieties, dict):
+            for planet in TRADITIONAL_PLANETS:
+                moieties.setdefault(planet, DEFAULT_MOIETY)
+        else:
+            raise HoraryError("Configuration key orbs.moieties must be a mapping")
+    return resolved
+
+
+def config_hash(config_dict: Dict[str, Any]) -> str:
+    """SHA-256 of the canonical JSON form of a configuration dict"""
+    canonical = json.dumps(config_dict, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def compile_config(config_dict: Dict[str, Any]) -> ConfigSnapshot:
+    """Resolve defaults and compile a configuration dict into a frozen snapshot"""
+    if not isinstance(config_dict, dict):
+        raise HoraryError("Configuration root must be a mapping")
+    resolved = resolve_config(config_dict)
+    snapshot = _compile_node(resolved, base=ConfigSnapshot)
+    object.__setattr__(snapshot, 'content_hash', config_hash(resolved))
+    return snapshot
+
+
+def load_config_file(config_file: Path) -> ConfigSnapshot:
+    """Read a YAML configuration file and compile it into a snapshot"""
+    config_file = Path(config_file)
+    try:
+        if not config_file.exists():
+            raise HoraryError(f"Configuration file not found: {config_file}")
+        
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config_dict = yaml.load(f, Loader=YamlLoader)
+        
+        if not config_dict:
+            raise HoraryError(f"Empty or invalid configuration file: {config_file}")
+        
+        return compile_config(config_dict)
+        
+    except yaml.YAMLError as e:
+        raise HoraryError(f"Invalid YAML in configuration file {config_file}: {e}")
+    except Exception as e:
+        raise HoraryError(f"Failed to load configuration from {config_file}: {e}")
+
+
 class HoraryConfig:
     """Lazy singleton configuration loader for horary constants"""
     
     _instance: Optional['HoraryConfig'] = None
-    _config: Optional[SimpleNamespace] = None
+    _config: Optional[ConfigSnapshot] = None
     
     def __new__(cls) -> 'HoraryConfig':
         if cls._instance is None:
@@ -47,42 +298,23 @@ class HoraryConfig:
             # Default to horary_constants.yaml in same directory as this file
             config_file = Path(__file__).parent / 'horary_constants.yaml'
         
-        try:
-            if not config_file.exists():
-                raise HoraryError(f"Configuration file not found: {config_file}")
-            
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_dict = yaml.safe_load(f)
-            
-            if not config_dict:
-                raise HoraryError(f"Empty or invalid configuration file: {config_file}")
-            
-            # Convert nested dict to nested SimpleNamespace for dot notation access
-            self._config = self._dict_to_namespace(config_dict)
-            
-            logger.info(f"Loaded horary configuration from {config_file}")
-            
-        except yaml.YAMLError as e:
-            raise HoraryError(f"Invalid YAML in configuration file {config_file}: {e}")
-        except Exception as e:
-            raise HoraryError(f"Failed to load configuration from {config_file}: {e}")
-    
-    def _dict_to_namespace(self, d: Dict[str, Any]) -> SimpleNamespace:
-        """Convert nested dictionary to nested SimpleNamespace"""
-        if isinstance(d, dict):
-            return SimpleNamespace(**{k: self._dict_to_namespace(v) for k, v in d.items()})
-        elif isinstance(d, list):
-            return [self._dict_to_namespace(item) for item in d]
-        else:
-            return d
+        # Compile to a frozen snapshot for dot notation access
+        type(self)._config = load_config_file(config_file)
+        
+        logger.info(f"Loaded horary configuration from {config_file}")
     
     @property
-    def config(self) -> SimpleNamespace:
-        """Get the configuration namespace"""
+    def config(self) -> ConfigSnapshot:
+        """Get the compiled configuration snapshot"""
         if self._config is None:
             self._load_config()
         return self._config
     
+    @property
+    def content_hash(self) -> str:
+        """Content hash of the loaded configuration"""
+        return self.config.content_hash
+    
     def get(self, key_path: str, default: Any = None) -> Any:
         """
         Get configuration value using dot notation path
@@ -163,8 +395,11 @@ def get_config() -> HoraryConfig:
 
 
 # Convenience function for quick access
-def cfg() -> SimpleNamespace:
-    """Get configuration namespace directly"""
+def cfg() -> ConfigSnapshot:
+    """Get configuration snapshot directly"""
+    config = HoraryConfig._config
+    if config is not None:
+        return config
     return get_config().config
 
 
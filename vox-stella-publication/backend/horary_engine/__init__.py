@@ -1,19 +1,28 @@
 """Horary engine package."""
 
 from .engine import HoraryEngine
+from .profiles import ProfileRegistry, get_profile_registry
 from .serialization import (
     serialize_planet_with_solar,
     serialize_chart_for_frontend,
     serialize_lunar_aspect,
 )
-from .services.geolocation import TimezoneManager, LocationError, safe_geocode
+from .services.geolocation import (
+    TimezoneManager,
+    LocationError,
+    get_timezone_manager,
+    safe_geocode,
+)
 
 __all__ = [
     "HoraryEngine",
+    "ProfileRegistry",
+    "get_profile_registry",
     "serialize_planet_with_solar",
     "serialize_chart_for_frontend",
     "serialize_lunar_aspect",
     "TimezoneManager",
+    "get_timezone_manager",
     "LocationError",
     "safe_geocode",
 ]
@@ -0,0 +1,83 @@
+"""Aspect lookups for a chart.
+
+The judgment rules keep asking the same questions of ``chart.aspects``:
+the aspect between two planets, every aspect a planet makes, the applying
+aspects of the significators.  An ``AspectIndex`` answers each of them
+from tables built once per chart - by unordered pair, by planet and by
+applying/separating state - instead of a scan of the whole aspect list,
+and hands back aspects in the chart's own order so rules that take the
+first match still find the same one.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence
+
+from models import AspectInfo, Planet
+
+
+INDEX_ATTRIBUTE = "_aspect_index"
+
+
+class AspectIndex:
+    """Aspects of one chart by pair, by planet and by applying state."""
+
+    def __init__(self, aspects: Sequence[AspectInfo]) -> None:
+        self.aspects = aspects
+        self._size = len(aspects)
+        self._by_pair: Dict[FrozenSet[Planet], AspectInfo] = {}
+        self._by_planet: Dict[Planet, List[int]] = {}
+        for position, aspect in enumerate(aspects):
+            # The aspect calculation finds at most one aspect per pair
+            self._by_pair.setdefault(frozenset((aspect.planet1, aspect.planet2)), aspect)
+            self._by_planet.setdefault(aspect.planet1, []).append(position)
+            self._by_planet.setdefault(aspect.planet2, []).append(position)
+
+    def is_current(self, aspects: Sequence[AspectInfo]) -> bool:
+        """Whether the index was built from ``aspects`` as they stand."""
+        return aspects is self.aspects and len(aspects) == self._size
+
+    def between(self, planet1: Planet, planet2: Planet,
+                applying: Optional[bool] = None) -> Optional[AspectInfo]:
+        """The aspect between two planets (either order), if any."""
+        aspect = self._by_pair.get(frozenset((planet1, planet2)))
+        if aspect is None or (applying is not None and aspect.applying != applying):
+            return None
+        return aspect
+
+    def involving(self, *planets: Planet, applying: Optional[bool] = None) -> List[AspectInfo]:
+        """Aspects made by any of ``planets``, in chart order."""
+        if len(planets) == 1:
+            positions: Iterable[int] = self._by_planet.get(planets[0], ())
+        else:
+            positions = sorted({p for planet in planets for p in self._by_planet.get(planet, ())})
+        return [
+            self.aspects[p] for p in positions
+            if applying is None or self.aspects[p].applying == applying
+        ]
+
+    def applying(self, *planets: Planet) -> List[AspectInfo]:
+        """Applying aspects, of ``planets`` if given, in chart order."""
+        if planets:
+            return self.involving(*planets, applying=True)
+        return [aspect for aspect in self.aspects if aspect.applying]
+
+    def separating(self, *planets: Planet) -> List[AspectInfo]:
+        """Separating aspects, of ``planets`` if given, in chart order."""
+        if planets:
+            return self.involving(*planets, applying=False)
+        return [aspect for aspect in self.aspects if not aspect.applying]
+
+
+def attach_aspect_index(chart: Any, index: Optional[AspectIndex] = None) -> AspectIndex:
+    """Index ``chart.aspects`` (or attach ``index``) on the chart."""
+    if index is None:
+        index = AspectIndex(chart.aspects)
+    setattr(chart, INDEX_ATTRIBUTE, index)
+    return index
+
+
+def chart_aspect_index(chart: Any) -> AspectIndex:
+    """Index attached to ``chart``, rebuilt if its aspect list has been replaced."""
+    index = getattr(chart, INDEX_ATTRIBUTE, None)
+    if index is None or not index.is_current(chart.aspects):
+        index = attach_aspect_index(chart)
+    return index
@@ -3,21 +3,29 @@
 from __future__ import annotations
 
 import datetime
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import swisseph as swe
 
 from horary_config import cfg
 from models import Aspect, AspectInfo, LunarAspect, Planet, PlanetPosition
+from .calculation.aspect_kernel import aspect_kernel
 from .calculation.helpers import days_to_sign_exit
+from .lunar_timeline import LunarTimeline
 
 
 def calculate_moon_last_aspect(
     planets: Dict[Planet, PlanetPosition],
     jd_ut: float,
     get_moon_speed: Callable[[float], float],
+    timeline: Optional[LunarTimeline] = None,
 ) -> Optional[LunarAspect]:
-    """Calculate Moon's last separating aspect"""
+    """Calculate Moon's last separating aspect
+
+    With a lunar ``timeline`` the separation and time since exact come from
+    the solved event; otherwise from the Moon's current speed.
+    """
 
     moon_pos = planets[Planet.MOON]
     moon_speed = get_moon_speed(jd_ut)
@@ -41,24 +49,31 @@ def calculate_moon_last_aspect(
 
             # Wider orb for recently separating
             if orb_diff <= max_orb * 1.5:
+                degrees_since_exact = orb_diff
+                if timeline is not None:
+                    event = timeline.last_event(planet, aspect_type)
+                    if event is None:
+                        continue
+                    time_since_exact = -event.days
                 # Check if separating (Moon was closer recently)
-                if is_moon_separating_from_aspect(
+                elif is_moon_separating_from_aspect(
                     moon_pos, planet_pos, aspect_type, moon_speed
                 ):
-                    degrees_since_exact = orb_diff
-                    time_since_exact = degrees_since_exact / moon_speed
-
-                    separating_aspects.append(
-                        LunarAspect(
-                            planet=planet,
-                            aspect=aspect_type,
-                            orb=orb_diff,
-                            degrees_difference=degrees_since_exact,
-                            perfection_eta_days=time_since_exact,
-                            perfection_eta_description=f"{time_since_exact:.1f} days ago",
-                            applying=False,
-                        )
+                    time_since_exact = orb_diff / moon_speed
+                else:
+                    continue
+
+                separating_aspects.append(
+                    LunarAspect(
+                        planet=planet,
+                        aspect=aspect_type,
+                        orb=orb_diff,
+                        degrees_difference=degrees_since_exact,
+                        perfection_eta_days=time_since_exact,
+                        perfection_eta_description=f"{time_since_exact:.1f} days ago",
+                        applying=False,
                     )
+                )
 
     # Return most recent (smallest time_since_exact)
     if separating_aspects:
@@ -71,8 +86,13 @@ def calculate_moon_next_aspect(
     planets: Dict[Planet, PlanetPosition],
     jd_ut: float,
     get_moon_speed: Callable[[float], float],
+    timeline: Optional[LunarTimeline] = None,
 ) -> Optional[LunarAspect]:
-    """Calculate Moon's next applying aspect"""
+    """Calculate Moon's next applying aspect
+
+    With a lunar ``timeline`` the application and time to exact come from
+    the solved event; otherwise from the current relative speed.
+    """
 
     moon_pos = planets[Planet.MOON]
     moon_speed = get_moon_speed(jd_ut)
@@ -95,31 +115,38 @@ def calculate_moon_next_aspect(
             max_orb = aspect_type.orb
 
             if orb_diff <= max_orb:
+                degrees_to_exact = orb_diff
+                if timeline is not None:
+                    event = timeline.next_event(planet, aspect_type)
+                    if event is None:
+                        continue
+                    time_to_exact = event.days
                 # Check if applying
-                if is_moon_applying_to_aspect(
+                elif is_moon_applying_to_aspect(
                     moon_pos, planet_pos, aspect_type, moon_speed
                 ):
-                    degrees_to_exact = orb_diff
                     relative_speed = moon_speed - planet_pos.speed
                     time_to_exact = (
                         degrees_to_exact / abs(relative_speed)
                         if relative_speed != 0
                         else float("inf")
                     )
-
-                    applying_aspects.append(
-                        LunarAspect(
-                            planet=planet,
-                            aspect=aspect_type,
-                            orb=orb_diff,
-                            degrees_difference=degrees_to_exact,
-                            perfection_eta_days=time_to_exact,
-                            perfection_eta_description=format_timing_description(
-                                time_to_exact
-                            ),
-                            applying=True,
-                        )
+                else:
+                    continue
+
+                applying_aspects.append(
+                    LunarAspect(
+                        planet=planet,
+                        aspect=aspect_type,
+                        orb=orb_diff,
+                        degrees_difference=degrees_to_exact,
+                        perfection_eta_days=time_to_exact,
+                        perfection_eta_description=format_timing_description(
+                            time_to_exact
+                        ),
+                        applying=True,
                     )
+                )
 
     # Return soonest (smallest time_to_exact)
     if applying_aspects:
@@ -204,17 +231,28 @@ def format_timing_description(days: float) -> str:
 
 
 def calculate_enhanced_aspects(
-    planets: Dict[Planet, PlanetPosition], jd_ut: float
+    planets: Dict[Planet, PlanetPosition], jd_ut: float, config=None
 ) -> List[AspectInfo]:
-    """Enhanced aspect calculation with configuration"""
+    """
+    Enhanced aspect calculation with configuration (the loaded one by default)
+
+    A single chart is checked pair by pair: for seven planets that is faster
+    than the per-call overhead of the array kernel, which
+    ``calculate_enhanced_aspects_batch`` uses for many charts at once.
+    """
+    if config is None:
+        config = cfg()
     aspects: List[AspectInfo] = []
     planet_list = list(planets.keys())
-    config = cfg()
+    orb_table = aspect_orb_table(tuple(planet_list), config)
 
+    pair = 0
     for i, planet1 in enumerate(planet_list):
         for planet2 in planet_list[i + 1 :]:
             pos1 = planets[planet1]
             pos2 = planets[planet2]
+            max_orbs = orb_table[pair]
+            pair += 1
 
             # Calculate angular separation
             angle_diff = abs(pos1.longitude - pos2.longitude)
@@ -222,30 +260,16 @@ def calculate_enhanced_aspects(
                 angle_diff = 360 - angle_diff
 
             # Check each traditional aspect
-            for aspect_type in Aspect:
+            for aspect_type, max_orb in zip(Aspect, max_orbs):
                 orb_diff = abs(angle_diff - aspect_type.degrees)
 
-                # ENHANCED: Traditional moiety-based orb calculation
-                max_orb = calculate_moiety_based_orb(
-                    planet1, planet2, aspect_type, config
-                )
-
-                # Fallback to configured orbs if moiety system disabled
-                if max_orb == 0:
-                    max_orb = aspect_type.orb
-                    # Luminary bonuses (legacy)
-                    if Planet.SUN in [planet1, planet2]:
-                        max_orb += config.orbs.sun_orb_bonus
-                    if Planet.MOON in [planet1, planet2]:
-                        max_orb += config.orbs.moon_orb_bonus
-
                 if orb_diff <= max_orb:
                     # Determine if applying
-                    applying = is_applying_enhanced(pos1, pos2, aspect_type, jd_ut)
+                    applying = is_applying_enhanced(pos1, pos2, aspect_type, jd_ut, config)
 
                     # Calculate degrees to exact and timing
                     degrees_to_exact, exact_time = calculate_enhanced_degrees_to_exact(
-                        pos1, pos2, aspect_type, jd_ut
+                        pos1, pos2, aspect_type, jd_ut, config
                     )
 
                     aspects.append(
@@ -264,17 +288,128 @@ def calculate_enhanced_aspects(
     return aspects
 
 
+def calculate_enhanced_aspects_batch(
+    planet_sets: Sequence[Dict[Planet, PlanetPosition]],
+    jds: Sequence[float],
+    config=None,
+) -> List[List[AspectInfo]]:
+    """
+    Aspects of many charts at once with the vectorized aspect kernel.
+
+    Charts holding the same planets (in the same order) are evaluated in one
+    kernel call; a chart with no such companions uses the scalar loop.  Each result is identical to ``calculate_enhanced_aspects``
+    for that chart.
+
+    Args:
+        planet_sets: Planet positions of each chart
+        jds: Julian Day (UT) of each chart
+        config: Configuration snapshot (the loaded one by default)
+
+    Returns:
+        One aspect list per chart, in input order
+    """
+    if len(planet_sets) != len(jds):
+        raise ValueError("planet_sets and jds must have the same length")
+    if config is None:
+        config = cfg()
+    groups: Dict[Tuple[Planet, ...], List[int]] = {}
+    for i, planets in enumerate(planet_sets):
+        groups.setdefault(tuple(planets), []).append(i)
+
+    aspect_types = list(Aspect)
+    max_future_days = config.timing.max_future_days
+    results: List[List[AspectInfo]] = [[] for _ in planet_sets]
+    for planet_list, indices in groups.items():
+        if len(planet_list) < 2:
+            continue
+        if len(indices) == 1:
+            # A single chart is cheaper on the scalar loop than through numpy
+            i = indices[0]
+            results[i] = calculate_enhanced_aspects(planet_sets[i], jds[i], config)
+            continue
+        longitudes = np.array(
+            [[planet_sets[i][p].longitude for p in planet_list] for i in indices], dtype=float
+        )
+        speeds = np.array(
+            [[planet_sets[i][p].speed for p in planet_list] for i in indices], dtype=float
+        )
+        kernel = aspect_kernel(
+            longitudes,
+            speeds,
+            np.array(aspect_orb_table(planet_list, config), dtype=float),
+            [aspect.degrees for aspect in aspect_types],
+            config.timing.timing_precision_days,
+        )
+
+        rows, pairs = np.nonzero(kernel.aspect_index >= 0)
+        for row, pair in zip(rows.tolist(), pairs.tolist()):
+            orb = float(kernel.orb[row, pair])
+            days = float(kernel.days_to_exact[row, pair])
+            exact_time = None
+            if days < max_future_days:
+                exact_time = _exact_datetime(jds[indices[row]] + days)
+            results[indices[row]].append(
+                AspectInfo(
+                    planet1=planet_list[kernel.first[pair]],
+                    planet2=planet_list[kernel.second[pair]],
+                    aspect=aspect_types[kernel.aspect_index[row, pair]],
+                    orb=orb,
+                    applying=bool(kernel.applying[row, pair]),
+                    exact_time=exact_time,
+                    degrees_to_exact=0.1 if orb < 0.1 else orb,
+                )
+            )
+    return results
+
+
+_orb_tables: Dict[Tuple[Tuple[Planet, ...], str], Tuple[Tuple[float, ...], ...]] = {}
+
+
+def aspect_orb_table(
+    planet_list: Tuple[Planet, ...], config
+) -> Tuple[Tuple[float, ...], ...]:
+    """Allowed orb of every aspect for every planet pair, pairs in loop order"""
+    key = (planet_list, config.content_hash)
+    table = _orb_tables.get(key)
+    if table is None:
+        table = tuple(
+            tuple(max_aspect_orb(planet1, planet2, aspect_type, config) for aspect_type in Aspect)
+            for i, planet1 in enumerate(planet_list)
+            for planet2 in planet_list[i + 1 :]
+        )
+        _orb_tables[key] = table
+    return table
+
+
+def max_aspect_orb(planet1: Planet, planet2: Planet, aspect_type: Aspect, config) -> float:
+    """Largest orb at which ``aspect_type`` between the two planets counts"""
+
+    # ENHANCED: Traditional moiety-based orb calculation
+    max_orb = calculate_moiety_based_orb(planet1, planet2, aspect_type, config)
+
+    # Fallback to configured orbs if moiety system disabled
+    if max_orb == 0:
+        max_orb = aspect_type.orb
+        # Luminary bonuses (legacy)
+        if Planet.SUN in [planet1, planet2]:
+            max_orb += config.orbs.sun_orb_bonus
+        if Planet.MOON in [planet1, planet2]:
+            max_orb += config.orbs.moon_orb_bonus
+    return max_orb
+
+
 def calculate_moiety_based_orb(
     planet1: Planet, planet2: Planet, aspect_type: Aspect, config
 ) -> float:
     """Calculate traditional moiety-based orb for two planets (ENHANCED)"""
 
-    if not hasattr(config.orbs, "moieties"):
+    moieties = config.orbs.moieties
+    if moieties is None:
         return 0  # Fallback to legacy system
 
-    # Get planetary moieties
-    moiety1 = getattr(config.orbs.moieties, planet1.value, 8.0)  # Default 8.0 if not found
-    moiety2 = getattr(config.orbs.moieties, planet2.value, 8.0)
+    # Get planetary moieties (missing planets default to 8.0 at config load)
+    moiety1 = getattr(moieties, planet1.value)
+    moiety2 = getattr(moieties, planet2.value)
 
     # Combined moiety orb
     combined_moiety = moiety1 + moiety2
@@ -293,7 +428,7 @@ def calculate_moiety_based_orb(
 
 
 def is_applying_enhanced(
-    pos1: PlanetPosition, pos2: PlanetPosition, aspect: Aspect, jd_ut: float
+    pos1: PlanetPosition, pos2: PlanetPosition, aspect: Aspect, jd_ut: float, config=None
 ) -> bool:
     """Enhanced applying check with directional sign-exit check"""
 
@@ -342,7 +477,7 @@ def is_applying_enhanced(
         return False
 
     # Calculate future position to confirm applying
-    time_increment = cfg().timing.timing_precision_days
+    time_increment = (config if config is not None else cfg()).timing.timing_precision_days
     future_separation = separation + (faster.speed - slower.speed) * time_increment
 
     # Normalize future separation
@@ -357,7 +492,7 @@ def is_applying_enhanced(
 
 
 def calculate_enhanced_degrees_to_exact(
-    pos1: PlanetPosition, pos2: PlanetPosition, aspect: Aspect, jd_ut: float
+    pos1: PlanetPosition, pos2: PlanetPosition, aspect: Aspect, jd_ut: float, config=None
 ) -> Tuple[float, Optional[datetime.datetime]]:
     """Enhanced degrees and time calculation"""
 
@@ -374,20 +509,24 @@ def calculate_enhanced_degrees_to_exact(
     if abs(pos1.speed - pos2.speed) > 0:
         days_to_exact = orb_from_exact / abs(pos1.speed - pos2.speed)
 
-        max_future_days = cfg().timing.max_future_days
+        max_future_days = (config if config is not None else cfg()).timing.max_future_days
         if days_to_exact < max_future_days:
-            try:
-                exact_jd = jd_ut + days_to_exact
-                # Convert back to datetime
-                year, month, day, hour = swe.jdut1_to_utc(exact_jd, 1)  # Flag 1 for Gregorian
-                exact_time = datetime.datetime(
-                    int(year), int(month), int(day), int(hour), int((hour % 1) * 60)
-                )
-            except Exception:
-                exact_time = None
+            exact_time = _exact_datetime(jd_ut + days_to_exact)
 
     # If already very close, return small value
     if orb_from_exact < 0.1:
         return 0.1, exact_time
 
     return orb_from_exact, exact_time
+
+
+def _exact_datetime(exact_jd: float) -> Optional[datetime.datetime]:
+    """Datetime of an aspect's perfection, ``None`` if it cannot be converted"""
+    try:
+        # Convert back to datetime
+        year, month, day, hour = swe.jdut1_to_utc(exact_jd, 1)  # Flag 1 for Gregorian
+        return datetime.datetime(
+            int(year), int(month), int(day), int(hour), int((hour % 1) * 60)
+        )
+    except Exception:
+        return None
@@ -13,6 +13,8 @@ from .helpers import (
     normalize_longitude,
     degrees_to_dms,
 )
+from .placement import HouseTable, house_of, house_table, sign_of
+from .solver import EphemerisSampler, SolverResult, find_next_ingress, find_next_station
 
 __all__ = [
     "calculate_next_station_time",
@@ -26,4 +28,12 @@ __all__ = [
     "check_aspect_separation_order",
     "normalize_longitude",
     "degrees_to_dms",
+    "HouseTable",
+    "house_of",
+    "house_table",
+    "sign_of",
+    "EphemerisSampler",
+    "SolverResult",
+    "find_next_ingress",
+    "find_next_station",
 ]
@@ -0,0 +1,156 @@
+"""
+Vectorized Aspect Kernel
+
+Array form of the aspect tests in ``horary_engine.aspects``: the separation
+of every planet pair, the first aspect within its orb, whether the aspect is
+applying (including the directional sign-exit check) and the days to exact,
+for a whole batch of charts in one call.  Inputs are ``(batch, planets)``
+arrays of longitudes and speeds; pairs are taken in the order of the scalar
+loops (``(0, 1), (0, 2), ..., (1, 2), ...``).
+
+Every step uses the same floating-point operations, in the same order, as
+the scalar functions, so results match them exactly rather than to within a
+tolerance.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+
+# Speeds below this (degrees/day) count as stationary for sign-exit timing
+STATIONARY_SPEED = 0.001
+
+
+class AspectKernelResult(NamedTuple):
+    """Per-pair results, each of shape ``(batch, pairs)``."""
+
+    first: "np.ndarray"            # index of each pair's planet1
+    second: "np.ndarray"           # index of each pair's planet2
+    aspect_index: "np.ndarray"     # first aspect within orb, -1 for none
+    orb: "np.ndarray"              # distance from the exact aspect
+    applying: "np.ndarray"         # bool
+    days_to_exact: "np.ndarray"    # orb / relative speed, inf when equal speeds
+
+
+@lru_cache(maxsize=None)
+def pair_indices(count: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Index arrays of the pairs ``i < j`` in scalar loop order."""
+    return np.triu_indices(count, 1)
+
+
+def _fold_separation(separation):
+    """Normalize to -180..+180 like the scalar ``while`` loops."""
+    while (separation > 180).any():
+        separation = np.where(separation > 180, separation - 360, separation)
+    while (separation < -180).any():
+        separation = np.where(separation < -180, separation + 360, separation)
+    return separation
+
+
+def _divide(numerator, denominator):
+    """``numerator / denominator``, infinite where the denominator is zero."""
+    return np.divide(numerator, denominator, out=np.full(np.shape(numerator), np.inf),
+                     where=denominator > 0)
+
+
+def days_to_sign_exit(longitudes, speeds):
+    """Array form of ``helpers.days_to_sign_exit``; NaN where stationary."""
+    longitudes = np.asarray(longitudes, dtype=float)
+    speeds = np.asarray(speeds, dtype=float)
+    current = longitudes % 360
+    sign_start = np.floor_divide(current, 30) * 30
+    direct = speeds > 0
+
+    forward = sign_start + 30
+    forward = np.where(forward >= 360, 0.0, forward)
+    backward = np.where(current == sign_start, sign_start - 30, sign_start)
+    backward = np.where(backward < 0, 330.0, backward)
+    boundary = np.where(direct, forward, backward)
+
+    degrees = np.where(
+        direct,
+        np.where(boundary > longitudes, boundary - longitudes, (360 - longitudes) + boundary),
+        np.where(boundary < longitudes, longitudes - boundary, longitudes + (360 - boundary)),
+    )
+    pace = np.abs(speeds)
+    return np.where(pace < STATIONARY_SPEED, np.nan, _divide(degrees, pace))
+
+
+def aspect_kernel(longitudes, speeds, max_orbs, aspect_degrees: Sequence[float],
+                  time_increment: float) -> AspectKernelResult:
+    """
+    Detect aspects for a batch of charts.
+
+    Args:
+        longitudes: ``(batch, planets)`` ecliptic longitudes
+        speeds: ``(batch, planets)`` speeds in degrees per day
+        max_orbs: ``(pairs, aspects)`` allowed orb of each aspect for each pair
+        aspect_degrees: Exact angle of each aspect, in the order they are tried
+        time_increment: Look-ahead (days) used to confirm an applying aspect
+
+    Returns:
+        AspectKernelResult with one entry per chart and pair
+    """
+    longitudes = np.atleast_2d(np.asarray(longitudes, dtype=float))
+    speeds = np.atleast_2d(np.asarray(speeds, dtype=float))
+    degrees = np.asarray(aspect_degrees, dtype=float)
+    first, second = pair_indices(longitudes.shape[1])
+
+    lon1, lon2 = longitudes[:, first], longitudes[:, second]
+    speed1, speed2 = speeds[:, first], speeds[:, second]
+
+    # Angular separation folded into 0..180 and the first aspect within orb
+    angle = np.abs(lon1 - lon2)
+    angle = np.where(angle > 180, 360 - angle, angle)
+    within = np.abs(angle[..., None] - degrees) <= max_orbs
+    found = within.any(axis=-1)
+    aspect_index = np.where(found, within.argmax(axis=-1), -1)
+    target = degrees[within.argmax(axis=-1)]
+    orb = np.abs(angle - target)
+
+    # Faster planet applies to slower planet (ties go to planet2)
+    first_faster = np.abs(speed1) > np.abs(speed2)
+    fast_lon = np.where(first_faster, lon1, lon2)
+    slow_lon = np.where(first_faster, lon2, lon1)
+    fast_speed = np.where(first_faster, speed1, speed2)
+    slow_speed = np.where(first_faster, speed2, speed1)
+
+    separation = _fold_separation(fast_lon - slow_lon)
+
+    # Closest of +/-target and, except for 0 and 180, their 360-degree
+    # complements; the earlier candidate wins ties
+    closest = target
+    best = np.abs(separation - target)
+    wraps = (target != 0) & (target != 180)
+    for candidate, allowed in ((-target, True), (target - 360, wraps), (-target + 360, wraps)):
+        distance = np.abs(separation - candidate)
+        better = (distance < best) & allowed
+        closest = np.where(better, candidate, closest)
+        best = np.where(better, distance, best)
+    current_orb = np.abs(separation - closest)
+
+    # Aspect does not apply if either planet leaves its sign first
+    relative = fast_speed - slow_speed
+    exit_days = days_to_sign_exit(longitudes, speeds)
+    exit1, exit2 = exit_days[:, first], exit_days[:, second]
+    fast_exit = np.where(first_faster, exit1, exit2)
+    slow_exit = np.where(first_faster, exit2, exit1)
+    days_to_perfect = _divide(current_orb, np.abs(relative))
+    days_to_exact = _divide(orb, np.abs(speed1 - speed2))
+    exits_first = ((fast_exit != 0) & (days_to_perfect > fast_exit)) | (
+        (slow_exit != 0) & (days_to_perfect > slow_exit)
+    )
+
+    future_separation = _fold_separation(separation + relative * time_increment)
+    applying = found & ~exits_first & (np.abs(future_separation - closest) < current_orb)
+
+    return AspectKernelResult(
+        first=first,
+        second=second,
+        aspect_index=aspect_index,
+        orb=orb,
+        applying=applying,
+        days_to_exact=days_to_exact,
+    )
@@ -0,0 +1,77 @@
+"""
+Ephemeris Access Layer
+
+A thin, thread-safe LRU cache in front of ``swe.calc_ut``.  A single chart
+asks Swiss Ephemeris for the same body at the same instant many times over
+(the Moon's speed alone is fetched by the lunar aspect scan, the Moon story
+and the timing estimate), so every stage that needs ephemeris data goes
+through one shared ``EphemerisCache`` and only the first request reaches
+Swiss Ephemeris (or whichever ``calc_ut``-compatible source the cache was
+given, such as the Chebyshev backend).
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import swisseph as swe
+
+
+DEFAULT_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+class EphemerisCache:
+    """LRU cache of ``swe.calc_ut`` results keyed on (body, jd, flags)."""
+
+    def __init__(self, maxsize: int = 4096,
+                 source: Optional[Callable[[float, int, int], Tuple]] = None):
+        self.maxsize = maxsize
+        self.source = source or swe.calc_ut
+        self._entries: "OrderedDict[Tuple[int, float, int], Tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def calc_ut(self, jd_ut: float, body: int, flags: int = DEFAULT_FLAGS) -> Tuple:
+        """Drop-in replacement for ``swe.calc_ut`` (same arguments and result)."""
+        key = (body, jd_ut, flags)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        # Computed outside the lock; errors propagate and are never cached.
+        result = self.source(jd_ut, body, flags)
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def longitude(self, jd_ut: float, body: int) -> float:
+        return self.calc_ut(jd_ut, body)[0][0]
+
+    def speed(self, jd_ut: float, body: int) -> float:
+        return self.calc_ut(jd_ut, body)[0][3]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
@@ -18,86 +18,40 @@ import datetime
 from typing import Tuple, Optional, Dict, Any
 import swisseph as swe
 
+from .ephemeris import EphemerisCache
+from .solver import NON_STATIONING_BODIES
+from .stations import get_station_index, search_next_station
+
 
 def calculate_next_station_time(planet_id: int, jd_start: float, 
-                               max_days: int = 365) -> Optional[float]:
+                               max_days: int = 365,
+                               ephemeris: Optional[EphemerisCache] = None) -> Optional[float]:
     """
     Calculate when a planet will next station (turn retrograde/direct)
     using Swiss Ephemeris.
     
+    Answers from the precomputed station index when the search window falls
+    inside it, otherwise brackets the speed sign change directly.
+    
     Args:
         planet_id: Swiss Ephemeris planet ID
         jd_start: Starting Julian Day 
         max_days: Maximum days to search ahead
+        ephemeris: Shared ephemeris cache for the fallback search
     
     Returns:
         Julian Day of next station, or None if not found
     
     Classical source: Lilly III Chap. XXI - "Of the frustration of Planets"
     """
-    step_size = 0.1  # Check every 0.1 days
-    
-    try:
-        # Get initial speed
-        initial_data, _ = swe.calc_ut(jd_start, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-        initial_speed = initial_data[3]
-        
-        # Search forward in time
-        current_jd = jd_start + step_size
-        max_jd = jd_start + max_days
-        
-        previous_speed = initial_speed
-        
-        while current_jd < max_jd:
-            try:
-                planet_data, _ = swe.calc_ut(current_jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-                current_speed = planet_data[3]
-                
-                # Check for sign change in speed (station)
-                if (previous_speed > 0 and current_speed < 0) or (previous_speed < 0 and current_speed > 0):
-                    # Found a station, refine the timing
-                    return _refine_station_time(planet_id, current_jd - step_size, current_jd)
-                
-                previous_speed = current_speed
-                current_jd += step_size
-                
-            except Exception:
-                # Skip errors and continue
-                current_jd += step_size
-                continue
+    if planet_id in NON_STATIONING_BODIES:
+        return None
     
-    except Exception:
-        pass
+    index = get_station_index()
+    if index is not None and index.covers(planet_id, jd_start, max_days):
+        return index.next_station(planet_id, jd_start, max_days)
     
-    return None
-
-
-def _refine_station_time(planet_id: int, jd_before: float, jd_after: float) -> float:
-    """Refine station time to higher precision using binary search"""
-    tolerance = 0.001  # About 1.5 minutes
-    
-    while (jd_after - jd_before) > tolerance:
-        jd_mid = (jd_before + jd_after) / 2
-        
-        try:
-            data_before, _ = swe.calc_ut(jd_before, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            data_mid, _ = swe.calc_ut(jd_mid, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            
-            speed_before = data_before[3]
-            speed_mid = data_mid[3]
-            
-            # Check which side of midpoint the station is on
-            if (speed_before > 0 and speed_mid > 0) or (speed_before < 0 and speed_mid < 0):
-                # Station is after midpoint
-                jd_before = jd_mid
-            else:
-                # Station is before midpoint
-                jd_after = jd_mid
-                
-        except Exception:
-            break
-    
-    return (jd_before + jd_after) / 2
+    return search_next_station(planet_id, jd_start, max_days, ephemeris=ephemeris)
 
 
 def calculate_future_longitude(longitude: float, speed: float, days: float, 
@@ -231,7 +185,8 @@ def is_planet_oriental(planet_longitude: float, sun_longitude: float) -> bool:
 
 
 def sun_altitude_at_civil_twilight(latitude: float, longitude: float, 
-                                  jd_ut: float) -> float:
+                                  jd_ut: float,
+                                  ephemeris: Optional[EphemerisCache] = None) -> float:
     """
     Calculate Sun's altitude at civil twilight for visibility calculations.
     
@@ -239,6 +194,7 @@ def sun_altitude_at_civil_twilight(latitude: float, longitude: float,
         latitude: Observer latitude in degrees
         longitude: Observer longitude in degrees  
         jd_ut: Julian Day (UT)
+        ephemeris: Shared ephemeris cache (the chart's Sun is usually cached)
     
     Returns:
         Sun's altitude in degrees (negative below horizon)
@@ -247,7 +203,8 @@ def sun_altitude_at_civil_twilight(latitude: float, longitude: float,
     """
     try:
         # Calculate ecliptic position of the Sun
-        sun_data, _ = swe.calc_ut(jd_ut, swe.SUN, swe.FLG_SWIEPH)
+        calc_ut = ephemeris.calc_ut if ephemeris is not None else swe.calc_ut
+        sun_data, _ = calc_ut(jd_ut, swe.SUN, swe.FLG_SWIEPH | swe.FLG_SPEED)
         sun_longitude = sun_data[0]
         sun_latitude = sun_data[1]
         sun_distance = sun_data[2]
@@ -270,12 +227,14 @@ def sun_altitude_at_civil_twilight(latitude: float, longitude: float,
         return -8.0
 
 
-def calculate_moon_variable_speed(jd_ut: float) -> float:
+def calculate_moon_variable_speed(jd_ut: float,
+                                  ephemeris: Optional[EphemerisCache] = None) -> float:
     """
     Get Moon's current speed from ephemeris for variable timing calculations.
     
     Args:
         jd_ut: Julian Day (UT)
+        ephemeris: Shared ephemeris cache
     
     Returns:
         Moon's speed in degrees per day
@@ -283,7 +242,8 @@ def calculate_moon_variable_speed(jd_ut: float) -> float:
     Classical source: Lilly III Chap. XXV - Moon's variable motion in timing
     """
     try:
-        moon_data, _ = swe.calc_ut(jd_ut, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        calc_ut = ephemeris.calc_ut if ephemeris is not None else swe.calc_ut
+        moon_data, _ = calc_ut(jd_ut, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
         return abs(moon_data[3])  # Return absolute speed
     except Exception:
         return 13.0  # Classical average fallback
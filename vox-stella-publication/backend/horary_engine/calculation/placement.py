@@ -0,0 +1,115 @@
+"""
+Sign and House Placement
+
+The sign of a longitude is its 30° slot, found by integer division.  The
+house of a longitude is found in a ``HouseTable``: the chart's twelve
+cusps sorted by longitude once, so that every placement is one ``bisect``
+instead of a walk round the cusps with wrap-around checks.  Tables are
+cached by cusp values, so the engine, the dignity scoring and the
+reception calculator all share the one built for a chart.
+
+Placements use the same comparisons as the cusp walk they replace (a
+longitude on a cusp belongs to the house that cusp opens), and charts
+whose cusps are not in zodiacal order fall back to that walk.
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from models import Sign
+
+
+SIGNS: Tuple[Sign, ...] = tuple(Sign)
+
+# Distinct cusp sets kept; a batch over many places needs one per chart
+HOUSE_TABLE_CACHE_SIZE = 1024
+
+
+def sign_index(longitude: float) -> int:
+    """Index (0 = Aries) of the sign ``longitude`` falls in."""
+    # ``x % 360`` can round up to 360.0 for tiny negative x
+    return min(int((longitude % 360) // 30), 11)
+
+
+def sign_of(longitude: float) -> Sign:
+    """Zodiac sign of ``longitude``."""
+    return SIGNS[sign_index(longitude)]
+
+
+def sign_indices(longitudes):
+    """Vectorized ``sign_index`` for a sequence or array of longitudes."""
+    values = np.mod(np.asarray(longitudes, dtype=float), 360.0)
+    return np.minimum((values // 30).astype(np.int64), 11)
+
+
+class HouseTable:
+    """House placement against one set of twelve cusps."""
+
+    __slots__ = ("cusps", "_bounds", "_houses", "_ordered")
+
+    def __init__(self, cusps: Sequence[float]) -> None:
+        if len(cusps) != 12:
+            raise ValueError("A house table needs twelve cusps")
+        self.cusps = tuple(cusps)
+        wrapped = [cusp % 360 for cusp in self.cusps]
+        order = sorted(range(12), key=wrapped.__getitem__)
+        # Sorting starts the cycle at the cusp nearest 0° Aries; the
+        # cusps are usable when that is a rotation of house order with no
+        # empty houses
+        start = order[0]
+        self._ordered = (
+            order == [(start + k) % 12 for k in range(12)]
+            and len(set(wrapped)) == 12
+        )
+        self._bounds = [wrapped[i] for i in order]
+        self._houses = [i + 1 for i in order]
+
+    def house_of(self, longitude: float) -> int:
+        """House (1-12) that ``longitude`` falls in."""
+        longitude = longitude % 360
+        if not self._ordered:
+            return _walk_cusps(longitude, self.cusps)
+        # Left of the lowest cusp is the house that wraps through 0°
+        return self._houses[bisect_right(self._bounds, longitude) - 1]
+
+    def houses_of(self, longitudes):
+        """Vectorized ``house_of`` for a sequence or array of longitudes."""
+        if not self._ordered:
+            return [self.house_of(longitude) for longitude in longitudes]
+        values = np.mod(np.asarray(longitudes, dtype=float), 360.0)
+        slots = np.searchsorted(np.asarray(self._bounds), values, side="right") - 1
+        return np.asarray(self._houses)[slots]
+
+
+@lru_cache(maxsize=HOUSE_TABLE_CACHE_SIZE)
+def _cached_table(cusps: Tuple[float, ...]) -> HouseTable:
+    return HouseTable(cusps)
+
+
+def house_table(cusps: Sequence[float]) -> HouseTable:
+    """The (shared) house table for ``cusps``."""
+    return _cached_table(tuple(cusps))
+
+
+def house_of(longitude: float, cusps: Sequence[float]) -> int:
+    """House (1-12) that ``longitude`` falls in, given the twelve cusps."""
+    return house_table(cusps).house_of(longitude)
+
+
+def _walk_cusps(longitude: float, cusps: Sequence[float]) -> int:
+    """Walk round the cusps; for cusps out of zodiacal order."""
+    for i in range(12):
+        current_cusp = cusps[i] % 360
+        next_cusp = cusps[(i + 1) % 12] % 360
+
+        if current_cusp > next_cusp:  # Crosses 0°
+            if longitude >= current_cusp or longitude < next_cusp:
+                return i + 1
+        else:
+            if current_cusp <= longitude < next_cusp:
+                return i + 1
+
+    return 1
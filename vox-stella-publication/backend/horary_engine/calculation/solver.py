@@ -0,0 +1,241 @@
+"""
+Planetary Event Solver
+
+Finds stations (sign changes in a planet's speed) and ingresses (crossings
+of a sign boundary) without stepping through time at a fixed rate.  Each
+search scans forward with a step tuned to the planet, brackets the event
+and then refines it with Brent's method.  Every ephemeris sample is kept in
+an ``EphemerisSampler`` so refinement, repeated searches and later queries
+on the same planet reuse what has already been computed, and the sampler
+counts the ephemeris calls actually made.
+
+Classical source: Lilly III Chap. XXI - "Of the frustration of Planets"
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+import swisseph as swe
+
+
+# Fastest direct motion in degrees per day.  No planet can reach a point
+# further away than this allows, which gives a safe step for ingress scans.
+MAX_DAILY_MOTION: Dict[int, float] = {
+    swe.SUN: 1.02,
+    swe.MOON: 15.4,
+    swe.MERCURY: 2.2,
+    swe.VENUS: 1.27,
+    swe.MARS: 0.8,
+    swe.JUPITER: 0.25,
+    swe.SATURN: 0.14,
+}
+
+# The luminaries are never retrograde, so they never station.
+NON_STATIONING_BODIES = frozenset({swe.SUN, swe.MOON})
+
+# Station scan step per planet (days).  Each step is comfortably shorter than
+# the planet's shortest retrograde period, so a single step can never hide
+# two stations (or an ingress undone by retrograde motion).
+STATION_SCAN_STEP_DAYS: Dict[int, float] = {
+    swe.MERCURY: 4.0,   # retrograde ~20-24 days
+    swe.VENUS: 8.0,     # retrograde ~40-43 days
+    swe.MARS: 10.0,     # retrograde ~58-81 days
+    swe.JUPITER: 15.0,  # retrograde ~120 days
+    swe.SATURN: 15.0,   # retrograde ~138 days
+}
+
+DEFAULT_TOLERANCE_DAYS = 0.001  # About 1.5 minutes
+
+_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+@dataclass
+class SolverResult:
+    """Event time (None if not found) and the ephemeris calls spent finding it."""
+    jd: Optional[float]
+    calls: int
+
+
+class EphemerisSampler:
+    """Memoised longitude/speed samples for one planet."""
+
+    def __init__(self, planet_id: int,
+                 calc_ut: Optional[Callable[[float, int, int], Tuple]] = None):
+        self.planet_id = planet_id
+        self._calc_ut = calc_ut or swe.calc_ut
+        self._samples: Dict[float, Tuple[float, float]] = {}
+        self.calls = 0
+
+    def sample(self, jd: float) -> Tuple[float, float]:
+        """Return (longitude, speed) at ``jd``, computing it at most once."""
+        cached = self._samples.get(jd)
+        if cached is None:
+            data, _ = self._calc_ut(jd, self.planet_id, _FLAGS)
+            cached = (data[0], data[3])
+            self._samples[jd] = cached
+            self.calls += 1
+        return cached
+
+    def longitude(self, jd: float) -> float:
+        return self.sample(jd)[0]
+
+    def speed(self, jd: float) -> float:
+        return self.sample(jd)[1]
+
+
+def _signed_arc(angle: float) -> float:
+    """Wrap an angle into (-180, 180]."""
+    angle = angle % 360
+    return angle - 360 if angle > 180 else angle
+
+
+def brent_root(func: Callable[[float], float], a: float, b: float,
+               fa: float, fb: float, tolerance: float = DEFAULT_TOLERANCE_DAYS,
+               max_iterations: int = 60) -> float:
+    """
+    Refine a bracketed root with Brent's method.
+
+    ``fa`` and ``fb`` are the already-known values at the bracket ends, so the
+    caller's samples are not recomputed.  Converges superlinearly on smooth
+    functions and never does worse than bisection.
+    """
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(max_iterations):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2e-12 * abs(b) + 0.5 * tolerance
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or fb == 0:
+            return b
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secant step
+                p = 2 * m * s
+                q = 1 - s
+            else:
+                # Inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if m > 0 else -tol)
+        fb = func(b)
+
+    return b
+
+
+def find_next_station(planet_id: int, jd_start: float, max_days: float = 365,
+                      tolerance: float = DEFAULT_TOLERANCE_DAYS,
+                      sampler: Optional[EphemerisSampler] = None) -> SolverResult:
+    """
+    Find when a planet next turns retrograde or direct.
+
+    Args:
+        planet_id: Swiss Ephemeris planet ID
+        jd_start: Starting Julian Day
+        max_days: Maximum days to search ahead
+        tolerance: Precision of the returned time in days
+        sampler: Sample store to reuse across searches for the same planet
+
+    Returns:
+        SolverResult with the Julian Day of the station (or None)
+    """
+    if planet_id in NON_STATIONING_BODIES:
+        return SolverResult(None, 0)
+
+    sampler = sampler or EphemerisSampler(planet_id)
+    calls_before = sampler.calls
+    step = STATION_SCAN_STEP_DAYS.get(planet_id, 1.0)
+    max_jd = jd_start + max_days
+
+    jd_before = jd_start
+    speed_before = sampler.speed(jd_before)
+    while jd_before < max_jd:
+        jd_after = min(jd_before + step, max_jd)
+        speed_after = sampler.speed(jd_after)
+        if speed_before * speed_after < 0:
+            station = brent_root(sampler.speed, jd_before, jd_after,
+                                 speed_before, speed_after, tolerance)
+            return SolverResult(station, sampler.calls - calls_before)
+        jd_before, speed_before = jd_after, speed_after
+
+    return SolverResult(None, sampler.calls - calls_before)
+
+
+def find_next_ingress(planet_id: int, jd_start: float, max_days: float = 365,
+                      tolerance: float = DEFAULT_TOLERANCE_DAYS,
+                      sampler: Optional[EphemerisSampler] = None) -> SolverResult:
+    """
+    Find when a planet next crosses a sign boundary, in either direction.
+
+    The scan jumps ahead by the time the planet would need at its fastest
+    to reach the nearest boundary, so far from a cusp it takes long strides
+    and close to one it slows down.  Steps are capped at the planet's
+    station step so a retrograde loop cannot cross and recross unseen.
+
+    Args:
+        planet_id: Swiss Ephemeris planet ID
+        jd_start: Starting Julian Day
+        max_days: Maximum days to search ahead
+        tolerance: Precision of the returned time in days
+        sampler: Sample store to reuse across searches for the same planet
+
+    Returns:
+        SolverResult with the Julian Day of the ingress (or None)
+    """
+    sampler = sampler or EphemerisSampler(planet_id)
+    calls_before = sampler.calls
+    max_motion = MAX_DAILY_MOTION.get(planet_id, 1.0)
+    max_step = STATION_SCAN_STEP_DAYS.get(planet_id, 30.0 / (4 * max_motion))
+    min_step = min(max_step, 0.05 * 30.0 / max_motion)
+    max_jd = jd_start + max_days
+
+    jd_before = jd_start
+    lon_before = sampler.longitude(jd_before)
+    while jd_before < max_jd:
+        in_sign = lon_before % 30
+        nearest_boundary = min(in_sign, 30 - in_sign)
+        step = min(max(nearest_boundary / max_motion, min_step), max_step)
+        jd_after = min(jd_before + step, max_jd)
+        lon_after = sampler.longitude(jd_after)
+
+        if int(lon_before // 30) != int(lon_after // 30):
+            motion = _signed_arc(lon_after - lon_before)
+            boundary = (lon_before // 30 + (1 if motion > 0 else 0)) * 30
+
+            def offset(jd: float) -> float:
+                return _signed_arc(sampler.longitude(jd) - boundary)
+
+            ingress = brent_root(offset, jd_before, jd_after,
+                                 _signed_arc(lon_before - boundary),
+                                 _signed_arc(lon_after - boundary), tolerance)
+            return SolverResult(ingress, sampler.calls - calls_before)
+
+        jd_before, lon_before = jd_after, lon_after
+
+    return SolverResult(None, sampler.calls - calls_before)
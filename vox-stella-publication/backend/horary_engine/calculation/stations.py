@@ -0,0 +1,219 @@
+"""
+Planetary Station Index
+
+A station - the moment a planet turns retrograde or direct - is a fixed
+astronomical event, so there is no need to rediscover it for every chart.
+This module precomputes the stations of the traditional planets once over a
+configurable date range, persists them to disk and answers "when does this
+planet next station?" with a binary search.  Dates outside the indexed range
+fall back to the event solver in ``solver.py``.
+
+Classical source: Lilly III Chap. XXI - "Of the frustration of Planets"
+"""
+
+import bisect
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import swisseph as swe
+
+from horary_config import cfg
+from .ephemeris import EphemerisCache
+from .solver import (
+    STATION_SCAN_STEP_DAYS,
+    EphemerisSampler,
+    find_next_station,
+)
+
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+
+STATION_TOLERANCE_DAYS = 0.001  # About 1.5 minutes
+
+
+def search_next_station(planet_id: int, jd_start: float, max_days: float = 365,
+                        tolerance: float = STATION_TOLERANCE_DAYS,
+                        ephemeris: Optional[EphemerisCache] = None) -> Optional[float]:
+    """
+    Find the next station directly with the event solver.
+
+    Args:
+        planet_id: Swiss Ephemeris planet ID
+        jd_start: Starting Julian Day
+        max_days: Maximum days to search ahead
+        tolerance: Precision of the returned time in days
+        ephemeris: Shared ephemeris cache to sample through
+
+    Returns:
+        Julian Day of next station, or None if not found
+    """
+    calc_ut = ephemeris.calc_ut if ephemeris is not None else None
+    try:
+        sampler = EphemerisSampler(planet_id, calc_ut)
+        return find_next_station(planet_id, jd_start, max_days, tolerance, sampler).jd
+    except Exception as exc:
+        logger.warning("Station search failed for planet %s: %s", planet_id, exc)
+        return None
+
+
+class StationIndex:
+    """Sorted station times per planet over a fixed Julian Day range."""
+
+    def __init__(self, start_jd: float, end_jd: float, stations: Dict[int, List[float]]):
+        self.start_jd = start_jd
+        self.end_jd = end_jd
+        self.stations = {planet_id: sorted(times) for planet_id, times in stations.items()}
+
+    @classmethod
+    def build(cls, start_jd: float, end_jd: float,
+              planet_ids: Iterable[int] = tuple(STATION_SCAN_STEP_DAYS)) -> "StationIndex":
+        """Scan the range once and record every station of each planet."""
+        stations: Dict[int, List[float]] = {}
+        for planet_id in planet_ids:
+            sampler = EphemerisSampler(planet_id)
+            times: List[float] = []
+            jd = start_jd
+            while jd < end_jd:
+                station = find_next_station(planet_id, jd, end_jd - jd,
+                                            tolerance=STATION_TOLERANCE_DAYS / 10,
+                                            sampler=sampler).jd
+                if station is None:
+                    break
+                times.append(station)
+                jd = station + STATION_TOLERANCE_DAYS
+            stations[planet_id] = times
+        return cls(start_jd, end_jd, stations)
+
+    @classmethod
+    def load(cls, path: Path) -> "StationIndex":
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+        if data.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported station index version: {data.get('version')}")
+        stations = {int(planet_id): times for planet_id, times in data["stations"].items()}
+        return cls(data["start_jd"], data["end_jd"], stations)
+
+    def save(self, path: Path) -> None:
+        """Write the index atomically so concurrent workers never read a partial file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": INDEX_FORMAT_VERSION,
+            "start_jd": self.start_jd,
+            "end_jd": self.end_jd,
+            "stations": {str(planet_id): times for planet_id, times in self.stations.items()},
+        }
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(data, handle)
+        os.replace(tmp_path, path)
+
+    def covers(self, planet_id: int, jd_start: float, max_days: float) -> bool:
+        """Whether the index alone can answer a query for this window."""
+        if planet_id not in self.stations:
+            return False
+        if not (self.start_jd <= jd_start <= self.end_jd):
+            return False
+        if jd_start + max_days <= self.end_jd:
+            return True
+        # The window runs past the index, but a station inside the index
+        # still settles the query.
+        return self._first_after(planet_id, jd_start) is not None
+
+    def spans(self, planet_id: int, start_jd: float, end_jd: float) -> bool:
+        """Whether the index holds every station of the planet in ``start_jd``-``end_jd``."""
+        return planet_id in self.stations and self.start_jd <= start_jd and end_jd <= self.end_jd
+
+    def stations_between(self, planet_id: int, start_jd: float, end_jd: float) -> List[float]:
+        """Indexed stations after ``start_jd`` up to ``end_jd``, in time order."""
+        times = self.stations.get(planet_id, [])
+        return times[bisect.bisect_right(times, start_jd):bisect.bisect_right(times, end_jd)]
+
+    def next_station(self, planet_id: int, jd_start: float, max_days: float = 365) -> Optional[float]:
+        """Next indexed station after ``jd_start`` within ``max_days``."""
+        station = self._first_after(planet_id, jd_start)
+        if station is not None and station - jd_start <= max_days:
+            return station
+        return None
+
+    def _first_after(self, planet_id: int, jd: float) -> Optional[float]:
+        times = self.stations.get(planet_id, [])
+        pos = bisect.bisect_right(times, jd)
+        return times[pos] if pos < len(times) else None
+
+
+_index_lock = threading.Lock()
+_station_index: Optional[StationIndex] = None
+_index_loaded = False
+
+
+def _configured_index_path() -> Path:
+    path = Path(cfg().timing.station_index_path)
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parents[2] / path
+    return path
+
+
+def get_station_index() -> Optional[StationIndex]:
+    """
+    Return the process-wide station index, loading or building it on first use.
+
+    The index is read from ``timing.station_index_path``; if the file is
+    missing or covers a different range it is rebuilt and saved back.
+    Returns None when the index is disabled in configuration.
+    """
+    global _station_index, _index_loaded
+
+    if _index_loaded:
+        return _station_index
+
+    with _index_lock:
+        if _index_loaded:
+            return _station_index
+
+        timing = cfg().timing
+        if not timing.station_index_enabled:
+            _index_loaded = True
+            return None
+
+        start_jd = swe.julday(int(timing.station_index_start_year), 1, 1, 0.0)
+        end_jd = swe.julday(int(timing.station_index_end_year), 1, 1, 0.0)
+        path = _configured_index_path()
+
+        index = None
+        if path.exists():
+            try:
+                index = StationIndex.load(path)
+                if index.start_jd != start_jd or index.end_jd != end_jd:
+                    logger.info("Station index at %s covers a different range, rebuilding", path)
+                    index = None
+            except (OSError, ValueError, KeyError) as exc:
+                logger.warning("Could not read station index %s: %s", path, exc)
+                index = None
+
+        if index is None:
+            logger.info("Building station index for JD %.1f-%.1f", start_jd, end_jd)
+            index = StationIndex.build(start_jd, end_jd)
+            try:
+                index.save(path)
+            except OSError as exc:
+                logger.warning("Could not save station index to %s: %s", path, exc)
+
+        _station_index = index
+        _index_loaded = True
+        return _station_index
+
+
+def reset_station_index() -> None:
+    """Forget the cached index (used by tests and after config reloads)."""
+    global _station_index, _index_loaded
+    with _index_lock:
+        _station_index = None
+        _index_loaded = False
+
@@ -0,0 +1,134 @@
+"""
+Sampled Longitude Tracks
+
+A body's ecliptic longitude over a window, rebuilt from a few ephemeris
+samples: between samples the longitude follows the cubic Hermite curve
+through the sampled longitudes and speeds.  With the sample steps used by
+the event timelines (two days for the Moon and Mercury, up to eight for
+the outer planets) a track stays within about ten arc-seconds of the
+ephemeris, and any number of events can then be solved on it without
+further ephemeris calls.
+
+Longitudes are unwrapped, so a track runs continuously through 0 Aries
+and differences between tracks never jump by 360 degrees.
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from typing import Callable, Iterator, Optional, Sequence, Tuple
+
+import swisseph as swe
+
+from .solver import brent_root
+
+
+DEFAULT_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+EXACT_TOLERANCE_DAYS = 1e-5  # Under a second
+
+
+class LongitudeTrack:
+    """A body's unwrapped longitude between equally spaced samples."""
+
+    def __init__(self, start: float, step: float,
+                 longitudes: Sequence[float], speeds: Sequence[float]) -> None:
+        self.start = start
+        self.step = step
+        self.speeds = list(speeds)
+        self.longitudes = [longitudes[0]]
+        for longitude in longitudes[1:]:
+            arc = (longitude - self.longitudes[-1]) % 360
+            if arc > 180:
+                arc -= 360
+            self.longitudes.append(self.longitudes[-1] + arc)
+
+    @property
+    def end(self) -> float:
+        return self.start + (len(self.longitudes) - 1) * self.step
+
+    def _segment(self, jd: float):
+        i = min(max(int((jd - self.start) // self.step), 0), len(self.longitudes) - 2)
+        s = (jd - self.start - i * self.step) / self.step
+        return i, s
+
+    def __call__(self, jd: float) -> float:
+        i, s = self._segment(jd)
+        h = self.step
+        y0, y1 = self.longitudes[i], self.longitudes[i + 1]
+        m0, m1 = self.speeds[i] * h, self.speeds[i + 1] * h
+        s2, s3 = s * s, s * s * s
+        return ((2 * s3 - 3 * s2 + 1) * y0 + (s3 - 2 * s2 + s) * m0
+                + (-2 * s3 + 3 * s2) * y1 + (s3 - s2) * m1)
+
+    def speed(self, jd: float) -> float:
+        """Longitude speed (degrees per day) along the curve."""
+        i, s = self._segment(jd)
+        h = self.step
+        y0, y1 = self.longitudes[i], self.longitudes[i + 1]
+        m0, m1 = self.speeds[i] * h, self.speeds[i + 1] * h
+        s2 = s * s
+        return ((6 * s2 - 6 * s) * y0 + (3 * s2 - 4 * s + 1) * m0
+                + (-6 * s2 + 6 * s) * y1 + (3 * s2 - 2 * s) * m1) / h
+
+
+def sample_track(calc_ut: Callable, body: int, start: float, step: float,
+                 count: int, flags: int = DEFAULT_FLAGS) -> LongitudeTrack:
+    """Sample ``body`` ``count`` times from ``start`` at ``step`` days."""
+    longitudes, speeds = [], []
+    for k in range(count):
+        data, _ = calc_ut(start + k * step, body, flags)
+        longitudes.append(data[0])
+        speeds.append(data[3])
+    return LongitudeTrack(start, step, longitudes, speeds)
+
+
+def crossings(func: Callable[[float], float], grid: Sequence[float],
+              values: Sequence[float], level: float,
+              period: Optional[float] = None) -> Iterator[float]:
+    """
+    Times at which a continuous ``func`` passes ``level`` (or, with a
+    ``period``, any ``level + k * period``), in grid order.
+
+    ``values`` are ``func`` at the ``grid`` points.  Each grid interval is
+    bracketed by its end values, so a level passed twice within a single
+    interval is not reported; grids are kept finer than the shortest
+    turnaround of the bodies involved.
+    """
+    if period is not None:
+        level %= period
+    for jd, _ in level_crossings(func, grid, values, (level,), period):
+        yield jd
+
+
+def level_crossings(func: Callable[[float], float], grid: Sequence[float],
+                    values: Sequence[float], levels: Sequence[float],
+                    period: Optional[float] = None) -> Iterator[Tuple[float, float]]:
+    """
+    As ``crossings`` for several levels in one pass over the grid, yielding
+    ``(time, level)`` pairs in grid order.  With a ``period`` the levels
+    should lie in ``[0, period)``.
+    """
+    ordered = sorted(levels)
+    for i in range(len(grid) - 1):
+        a, b = values[i], values[i + 1]
+        if a == b:
+            continue
+        low, high = min(a, b), max(a, b)
+        # A level reached exactly at a grid point belongs to the interval
+        # ending there: (a, b] when rising, [b, a) when falling
+        find = bisect_right if a < b else bisect_left
+        if period is None:
+            hits = [(level, level) for level in ordered[find(ordered, low):find(ordered, high)]]
+        else:
+            hits = []
+            base = math.floor(low / period) * period
+            while base <= high:
+                window = ordered[find(ordered, low - base):find(ordered, high - base)]
+                hits.extend((base + level, level) for level in window)
+                base += period
+        # Levels are met in the order the function passes them
+        if a > b:
+            hits.reverse()
+        for target, level in hits:
+            yield brent_root(lambda jd: func(jd) - target, grid[i], grid[i + 1],
+                             a - target, b - target, EXACT_TOLERANCE_DAYS), level
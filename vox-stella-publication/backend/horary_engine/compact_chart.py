@@ -0,0 +1,433 @@
+"""Compact chart storage.
+
+A ``HoraryChart`` is a tree of small objects - a dict of
+``PlanetPosition``, a list of ``AspectInfo``, a dict of ``SolarAnalysis``,
+the house cusps and rulers - each with its own instance dict and boxed
+floats.  That is fine for one judgment, but batch jobs and caches holding
+thousands of charts pay for it many times over.
+
+``CompactChart`` packs the same content into a single ``bytes`` buffer:
+small integer codes (houses, sign, planet and aspect indices, flags)
+followed by the doubles (longitudes, latitudes, speeds, dignities, cusps,
+orbs...).  It reads through the chart attribute API -
+``chart.planets[Planet.MARS].house``, ``chart.aspects``, ``chart.houses``,
+``chart.solar_analyses`` - by handing out ``__slots__`` row views over the
+buffer, and ``to_chart()`` rebuilds a full ``HoraryChart`` when a
+judgment needs one.
+"""
+
+import struct
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from models import (
+    Aspect,
+    AspectInfo,
+    HoraryChart,
+    LunarAspect,
+    Planet,
+    PlanetPosition,
+    Sign,
+    SolarAnalysis,
+    SolarCondition,
+)
+
+from .aspect_index import attach_aspect_index
+
+PLANETS: Tuple[Planet, ...] = tuple(Planet)
+ASPECTS: Tuple[Aspect, ...] = tuple(Aspect)
+SIGNS: Tuple[Sign, ...] = tuple(Sign)
+CONDITIONS: Tuple[SolarCondition, ...] = tuple(SolarCondition)
+
+_PLANET_CODE = {planet: i for i, planet in enumerate(PLANETS)}
+_ASPECT_CODE = {aspect: i for i, aspect in enumerate(ASPECTS)}
+_SIGN_CODE = {sign: i for i, sign in enumerate(SIGNS)}
+_CONDITION_CODE = {condition: i for i, condition in enumerate(CONDITIONS)}
+
+_DOUBLE = struct.Struct("<d")
+_CUSPS = struct.Struct("<12d")
+
+# The buffer holds the codes, then the doubles.
+# Codes: planet count, aspect count, chart flags, 12 house rulers
+_CODE_HEADER = 15
+_CODE_RULERS = 3
+# Doubles: julian day, ascendant, midheaven, latitude, longitude, 12 cusps
+_REAL_HEADER = 17
+_REAL_CUSPS = 5
+
+# Per planet: longitude, latitude, speed, distance from the Sun (and the
+# dignity, unless every dignity fits a code) / planet, house, sign,
+# retrograde, solar condition, planet flags, dignity + 128
+_PLANET_REALS = 4
+_PLANET_CODES = 7
+# Per aspect: orb, degrees to exact / planet1, planet2, aspect, applying
+_ASPECT_REALS = 2
+_ASPECT_CODES = 4
+# Per lunar aspect: orb, degrees difference, days to perfection /
+# planet, aspect, applying
+_LUNAR_REALS = 3
+_LUNAR_CODES = 3
+
+# Chart flags
+_HAS_SOLAR = 1
+_HAS_LAST = 2
+_HAS_NEXT = 4
+_CODED_DIGNITIES = 8
+# Planet flags
+_EXACT_CAZIMI = 1
+_TRADITIONAL_EXCEPTION = 2
+_INTEGRAL_DIGNITY = 4
+
+
+class _Row:
+    """Read-only view of one record in a compact chart."""
+    __slots__ = ("_chart", "_real", "_code")
+
+    def __init__(self, chart: "CompactChart", real: int, code: int) -> None:
+        self._chart = chart
+        self._real = real
+        self._code = code
+
+    def _r(self, offset: int) -> float:
+        return self._chart._real(self._real + offset)
+
+    def _c(self, offset: int) -> int:
+        return self._chart._data[self._code + offset]
+
+    def __eq__(self, other: Any) -> bool:
+        fields = getattr(type(self), "FIELDS", ())
+        try:
+            return all(getattr(self, name) == getattr(other, name) for name in fields)
+        except AttributeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+
+class PlanetRow(_Row):
+    """A planet's position, read like ``PlanetPosition``."""
+    __slots__ = ()
+    FIELDS = ("planet", "longitude", "latitude", "house", "sign",
+              "dignity_score", "retrograde", "speed")
+
+    planet = property(lambda self: PLANETS[self._c(0)])
+    longitude = property(lambda self: self._r(0))
+    latitude = property(lambda self: self._r(1))
+    speed = property(lambda self: self._r(2))
+    house = property(lambda self: self._c(1))
+    sign = property(lambda self: SIGNS[self._c(2)])
+    retrograde = property(lambda self: bool(self._c(3)))
+    degree_in_sign = property(lambda self: self._r(0) % 30)
+
+    @property
+    def dignity_score(self):
+        if self._chart._data[2] & _CODED_DIGNITIES:
+            return self._c(6) - 128
+        score = self._r(4)
+        return int(score) if self._c(5) & _INTEGRAL_DIGNITY else score
+
+
+class SolarRow(_Row):
+    """A planet's solar condition, read like ``SolarAnalysis``."""
+    __slots__ = ()
+    FIELDS = ("planet", "distance_from_sun", "condition",
+              "exact_cazimi", "traditional_exception")
+
+    planet = PlanetRow.planet
+    distance_from_sun = property(lambda self: self._r(3))
+    condition = property(lambda self: CONDITIONS[self._c(4)])
+    exact_cazimi = property(lambda self: bool(self._c(5) & _EXACT_CAZIMI))
+    traditional_exception = property(lambda self: bool(self._c(5) & _TRADITIONAL_EXCEPTION))
+
+
+class AspectRow(_Row):
+    """An aspect between two planets, read like ``AspectInfo``."""
+    __slots__ = ("_index",)
+    FIELDS = ("planet1", "planet2", "aspect", "orb", "applying",
+              "exact_time", "degrees_to_exact")
+
+    def __init__(self, chart: "CompactChart", real: int, code: int, index: int) -> None:
+        super().__init__(chart, real, code)
+        self._index = index
+
+    planet1 = property(lambda self: PLANETS[self._c(0)])
+    planet2 = property(lambda self: PLANETS[self._c(1)])
+    aspect = property(lambda self: ASPECTS[self._c(2)])
+    applying = property(lambda self: bool(self._c(3)))
+    orb = property(lambda self: self._r(0))
+    degrees_to_exact = property(lambda self: self._r(1))
+
+    @property
+    def exact_time(self):
+        times = self._chart._exact_times
+        return times[self._index] if times is not None else None
+
+
+class _PlanetTable(Mapping):
+    """``chart.planets`` / ``chart.solar_analyses`` over the packed rows."""
+    __slots__ = ("_chart", "_row_type")
+
+    def __init__(self, chart: "CompactChart", row_type: type) -> None:
+        self._chart = chart
+        self._row_type = row_type
+
+    def _rows(self) -> Iterator[Tuple[Planet, int]]:
+        chart = self._chart
+        for row in range(chart._data[0]):
+            code = _CODE_HEADER + row * _PLANET_CODES
+            yield PLANETS[chart._data[code]], row
+
+    def __getitem__(self, planet: Planet) -> _Row:
+        for candidate, row in self._rows():
+            if candidate == planet:
+                return self._row_type(self._chart,
+                                      _REAL_HEADER + row * self._chart._planet_reals(),
+                                      _CODE_HEADER + row * _PLANET_CODES)
+        raise KeyError(planet)
+
+    def __iter__(self) -> Iterator[Planet]:
+        return (planet for planet, _ in self._rows())
+
+    def __len__(self) -> int:
+        return self._chart._data[0]
+
+
+class CompactChart:
+    """A horary chart packed into one buffer.
+
+    Build one with ``CompactChart.from_chart``; read it through the same
+    attributes as ``HoraryChart`` or expand it with ``to_chart``.  Views
+    are read-only - the engine's judgment runs on the expanded chart.
+    """
+    __slots__ = ("date_time", "date_time_utc", "timezone_info", "location_name",
+                 "_data", "_exact_times", "_last_description", "_next_description")
+
+    def __init__(self, date_time, date_time_utc, timezone_info: str, location_name: str,
+                 data: bytes, exact_times: Optional[Tuple] = None,
+                 last_description: Optional[str] = None,
+                 next_description: Optional[str] = None) -> None:
+        self.date_time = date_time
+        self.date_time_utc = date_time_utc
+        self.timezone_info = timezone_info
+        self.location_name = location_name
+        self._data = data
+        self._exact_times = exact_times
+        self._last_description = last_description
+        self._next_description = next_description
+
+    @classmethod
+    def from_chart(cls, chart: HoraryChart) -> "CompactChart":
+        """Pack ``chart``; the original is left untouched."""
+        if len(chart.houses) != 12:
+            raise ValueError("A compact chart needs twelve house cusps")
+        solar = chart.solar_analyses
+        lunar = (chart.moon_last_aspect, chart.moon_next_aspect)
+        coded_dignities = all(
+            isinstance(position.dignity_score, int) and -128 <= position.dignity_score < 128
+            for position in chart.planets.values())
+        flags = ((_HAS_SOLAR if solar is not None else 0)
+                 | (_HAS_LAST if lunar[0] is not None else 0)
+                 | (_HAS_NEXT if lunar[1] is not None else 0)
+                 | (_CODED_DIGNITIES if coded_dignities else 0))
+
+        reals = [chart.julian_day, chart.ascendant, chart.midheaven,
+                 chart.location[0], chart.location[1]]
+        reals.extend(chart.houses)
+        codes = [len(chart.planets), len(chart.aspects), flags]
+        codes.extend(_PLANET_CODE[chart.house_rulers[house]] for house in range(1, 13))
+
+        for planet, position in chart.planets.items():
+            analysis = solar.get(planet) if solar is not None else None
+            planet_flags = 0
+            if isinstance(position.dignity_score, int):
+                planet_flags |= _INTEGRAL_DIGNITY
+            if analysis is not None:
+                planet_flags |= ((_EXACT_CAZIMI if analysis.exact_cazimi else 0)
+                                 | (_TRADITIONAL_EXCEPTION if analysis.traditional_exception else 0))
+            reals.extend((position.longitude, position.latitude, position.speed,
+                          analysis.distance_from_sun if analysis is not None else 0.0))
+            if not coded_dignities:
+                reals.append(position.dignity_score)
+            codes.extend((_PLANET_CODE[planet], position.house, _SIGN_CODE[position.sign],
+                          int(bool(position.retrograde)),
+                          _CONDITION_CODE[analysis.condition if analysis is not None
+                                          else SolarCondition.FREE],
+                          planet_flags,
+                          position.dignity_score + 128 if coded_dignities else 0))
+
+        for aspect in chart.aspects:
+            reals.extend((aspect.orb, aspect.degrees_to_exact))
+            codes.extend((_PLANET_CODE[aspect.planet1], _PLANET_CODE[aspect.planet2],
+                          _ASPECT_CODE[aspect.aspect], int(bool(aspect.applying))))
+
+        for lunar_aspect in lunar:
+            if lunar_aspect is not None:
+                reals.extend((lunar_aspect.orb, lunar_aspect.degrees_difference,
+                              lunar_aspect.perfection_eta_days))
+                codes.extend((_PLANET_CODE[lunar_aspect.planet], _ASPECT_CODE[lunar_aspect.aspect],
+                              int(bool(lunar_aspect.applying))))
+
+        exact_times = tuple(aspect.exact_time for aspect in chart.aspects)
+        if not any(time is not None for time in exact_times):
+            exact_times = None
+        last_description, next_description = (
+            lunar_aspect.perfection_eta_description if lunar_aspect is not None else None
+            for lunar_aspect in lunar)
+
+        data = bytes(codes) + struct.pack(f"<{len(reals)}d", *reals)
+        return cls(chart.date_time, chart.date_time_utc, chart.timezone_info,
+                   chart.location_name, data, exact_times, last_description,
+                   next_description)
+
+    # Chart attributes -------------------------------------------------
+
+    julian_day = property(lambda self: self._real(0))
+    ascendant = property(lambda self: self._real(1))
+    midheaven = property(lambda self: self._real(2))
+    location = property(lambda self: (self._real(3), self._real(4)))
+
+    @property
+    def houses(self) -> List[float]:
+        return list(_CUSPS.unpack_from(self._data, self._reals_at + 8 * _REAL_CUSPS))
+
+    @property
+    def house_rulers(self) -> Dict[int, Planet]:
+        rulers = self._data[_CODE_RULERS:_CODE_RULERS + 12]
+        return {house: PLANETS[code] for house, code in enumerate(rulers, 1)}
+
+    @property
+    def planets(self) -> Mapping[Planet, PlanetRow]:
+        return _PlanetTable(self, PlanetRow)
+
+    @property
+    def solar_analyses(self) -> Optional[Mapping[Planet, SolarRow]]:
+        if not self._data[2] & _HAS_SOLAR:
+            return None
+        return _PlanetTable(self, SolarRow)
+
+    @property
+    def aspects(self) -> List[AspectRow]:
+        real, code = self._aspect_offsets()
+        return [
+            AspectRow(self, real + i * _ASPECT_REALS, code + i * _ASPECT_CODES, i)
+            for i in range(self._data[1])
+        ]
+
+    @property
+    def moon_last_aspect(self) -> Optional[LunarAspect]:
+        return self._lunar_aspect(0)
+
+    @property
+    def moon_next_aspect(self) -> Optional[LunarAspect]:
+        return self._lunar_aspect(1)
+
+    # Expansion ----------------------------------------------------------
+
+    def to_chart(self) -> HoraryChart:
+        """A full ``HoraryChart`` equal to the one this was packed from."""
+        planets = {
+            planet: PlanetPosition(
+                planet=row.planet,
+                longitude=row.longitude,
+                latitude=row.latitude,
+                house=row.house,
+                sign=row.sign,
+                dignity_score=row.dignity_score,
+                retrograde=row.retrograde,
+                speed=row.speed,
+            )
+            for planet, row in self.planets.items()
+        }
+        solar = self.solar_analyses
+        solar_analyses = None
+        if solar is not None:
+            solar_analyses = {
+                planet: SolarAnalysis(
+                    planet=row.planet,
+                    distance_from_sun=row.distance_from_sun,
+                    condition=row.condition,
+                    exact_cazimi=row.exact_cazimi,
+                    traditional_exception=row.traditional_exception,
+                )
+                for planet, row in solar.items()
+            }
+        aspects = [
+            AspectInfo(
+                planet1=row.planet1,
+                planet2=row.planet2,
+                aspect=row.aspect,
+                orb=row.orb,
+                applying=row.applying,
+                exact_time=row.exact_time,
+                degrees_to_exact=row.degrees_to_exact,
+            )
+            for row in self.aspects
+        ]
+        chart = HoraryChart(
+            date_time=self.date_time,
+            date_time_utc=self.date_time_utc,
+            timezone_info=self.timezone_info,
+            location=self.location,
+            location_name=self.location_name,
+            planets=planets,
+            aspects=aspects,
+            houses=self.houses,
+            house_rulers=self.house_rulers,
+            ascendant=self.ascendant,
+            midheaven=self.midheaven,
+            solar_analyses=solar_analyses,
+            julian_day=self.julian_day,
+            moon_last_aspect=self.moon_last_aspect,
+            moon_next_aspect=self.moon_next_aspect,
+        )
+        attach_aspect_index(chart)
+        return chart
+
+    def nbytes(self) -> int:
+        """Size of the packed buffer, in bytes."""
+        return len(self._data)
+
+    # Internals ----------------------------------------------------------
+
+    @property
+    def _reals_at(self) -> int:
+        data = self._data
+        lunar = bool(data[2] & _HAS_LAST) + bool(data[2] & _HAS_NEXT)
+        return (_CODE_HEADER + data[0] * _PLANET_CODES + data[1] * _ASPECT_CODES
+                + lunar * _LUNAR_CODES)
+
+    def _real(self, index: int) -> float:
+        return _DOUBLE.unpack_from(self._data, self._reals_at + 8 * index)[0]
+
+    def _planet_reals(self) -> int:
+        return _PLANET_REALS if self._data[2] & _CODED_DIGNITIES else _PLANET_REALS + 1
+
+    def _aspect_offsets(self) -> Tuple[int, int]:
+        planets = self._data[0]
+        return (_REAL_HEADER + planets * self._planet_reals(),
+                _CODE_HEADER + planets * _PLANET_CODES)
+
+    def _lunar_aspect(self, which: int) -> Optional[LunarAspect]:
+        data = self._data
+        flags = data[2]
+        if not flags & (_HAS_LAST, _HAS_NEXT)[which]:
+            return None
+        real, code = self._aspect_offsets()
+        real += data[1] * _ASPECT_REALS
+        code += data[1] * _ASPECT_CODES
+        if which == 1 and flags & _HAS_LAST:
+            real += _LUNAR_REALS
+            code += _LUNAR_CODES
+        return LunarAspect(
+            planet=PLANETS[data[code]],
+            aspect=ASPECTS[data[code + 1]],
+            orb=self._real(real),
+            degrees_difference=self._real(real + 1),
+            perfection_eta_days=self._real(real + 2),
+            perfection_eta_description=(self._last_description, self._next_description)[which],
+            applying=bool(data[code + 2]),
+        )
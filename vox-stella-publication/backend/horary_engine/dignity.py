@@ -0,0 +1,228 @@
+"""Compiled essential-dignity tables.
+
+Every essential dignity a planet can hold at a zodiacal position - rulership,
+exaltation, triplicity, term, face, detriment and fall - is compiled once
+per configuration profile into a flat ``bytearray`` indexed by planet, sect
+and degree, alongside the essential score those flags add up to.  Dignity
+scoring and reception both read from the table instead of rebuilding
+dictionaries and walking the config's term and face lists on every call.
+
+Terms and faces come from ``reception.terms`` / ``reception.faces``.  When
+all their boundaries fall on whole degrees the table has one cell per
+degree, otherwise one per arc-minute.
+"""
+
+import threading
+from array import array
+from typing import Dict
+
+from horary_config import cfg
+
+from models import Planet, Sign
+
+
+# Dignity flags.  The first five double as the reception dignity bits.
+DOMICILE = 1
+EXALTATION = 2
+RECEPTION_TRIPLICITY = 4
+TERM = 8
+FACE = 16
+DETRIMENT = 32
+FALL = 64
+TRIPLICITY = 128
+
+RECEPTION_MASK = DOMICILE | EXALTATION | RECEPTION_TRIPLICITY | TERM | FACE
+
+EXALTATIONS: Dict[Planet, Sign] = {
+    Planet.SUN: Sign.ARIES,
+    Planet.MOON: Sign.TAURUS,
+    Planet.MERCURY: Sign.VIRGO,
+    Planet.VENUS: Sign.PISCES,
+    Planet.MARS: Sign.CAPRICORN,
+    Planet.JUPITER: Sign.CANCER,
+    Planet.SATURN: Sign.LIBRA,
+}
+
+# Traditional falls (opposite to exaltations)
+FALLS: Dict[Planet, Sign] = {
+    Planet.SUN: Sign.LIBRA,
+    Planet.MOON: Sign.SCORPIO,
+    Planet.MERCURY: Sign.PISCES,
+    Planet.VENUS: Sign.VIRGO,
+    Planet.MARS: Sign.CANCER,
+    Planet.JUPITER: Sign.CAPRICORN,
+    Planet.SATURN: Sign.ARIES,
+}
+
+# Detriment - opposite to rulership
+DETRIMENTS = {
+    Planet.SUN: [Sign.AQUARIUS],
+    Planet.MOON: [Sign.CAPRICORN],
+    Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
+    Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
+    Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
+    Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
+    Planet.SATURN: [Sign.CANCER, Sign.LEO],
+}
+
+# Traditional house joys
+HOUSE_JOYS: Dict[Planet, int] = {
+    Planet.MERCURY: 1, Planet.MOON: 3, Planet.VENUS: 5,
+    Planet.MARS: 6, Planet.SUN: 9, Planet.JUPITER: 11, Planet.SATURN: 12,
+}
+
+
+def _triplicities(water_day: Planet, water_night: Planet) -> Dict[Sign, Dict[str, Planet]]:
+    rulers = {
+        (Sign.ARIES, Sign.LEO, Sign.SAGITTARIUS): (Planet.SUN, Planet.JUPITER),
+        (Sign.TAURUS, Sign.VIRGO, Sign.CAPRICORN): (Planet.VENUS, Planet.MOON),
+        (Sign.GEMINI, Sign.LIBRA, Sign.AQUARIUS): (Planet.SATURN, Planet.MERCURY),
+        (Sign.CANCER, Sign.SCORPIO, Sign.PISCES): (water_day, water_night),
+    }
+    return {
+        sign: {"day": day, "night": night}
+        for signs, (day, night) in rulers.items()
+        for sign in signs
+    }
+
+
+# Triplicity rulers used for essential dignity scoring
+TRIPLICITY_RULERS = _triplicities(Planet.VENUS, Planet.MARS)
+# Triplicity rulers used for reception (Mars rules water by day)
+RECEPTION_TRIPLICITY_RULERS = _triplicities(Planet.MARS, Planet.VENUS)
+
+
+def _bound_rulers(table, sign: Sign):
+    """(start, end, ruler) bounds of one sign's terms or faces, empty if not configured."""
+    try:
+        bounds = getattr(table, sign.sign_name)
+    except AttributeError:
+        return []
+    return [(bound.start, bound.end, Planet[bound.ruler.upper()]) for bound in bounds]
+
+
+class DignityTable:
+    """Essential dignity flags and scores for planet x sect x position."""
+
+    def __init__(self, config) -> None:
+        try:
+            terms = config.reception.terms
+        except AttributeError:
+            terms = None
+        try:
+            faces = config.reception.faces
+        except AttributeError:
+            faces = None
+
+        bounds = {
+            sign: (_bound_rulers(terms, sign), _bound_rulers(faces, sign)) for sign in Sign
+        }
+        whole_degrees = all(
+            float(start).is_integer() and float(end).is_integer()
+            for term_bounds, face_bounds in bounds.values()
+            for start, end, _ in term_bounds + face_bounds
+        )
+        self.cells_per_degree = 1 if whole_degrees else 60
+        self.cells = 360 * self.cells_per_degree
+        self.planets = {planet: i for i, planet in enumerate(Planet)}
+
+        dignity = config.dignity
+        weights = (
+            (DOMICILE, dignity.rulership),
+            (EXALTATION, dignity.exaltation),
+            (TRIPLICITY, dignity.triplicity),
+            (DETRIMENT, dignity.detriment),
+            (FALL, dignity.fall),
+        )
+
+        size = len(self.planets) * 2 * self.cells
+        self.flags = bytearray(size)
+        self.scores = array("h", bytes(2 * size))
+        signs = list(Sign)
+        cells_per_sign = 30 * self.cells_per_degree
+
+        # Term and face ruler of every cell within each sign
+        cell_rulers = {}
+        for sign in signs:
+            term_bounds, face_bounds = bounds[sign]
+            rulers = []
+            for cell in range(cells_per_sign):
+                sign_degree = cell / self.cells_per_degree
+                term = next((r for start, end, r in term_bounds if start <= sign_degree < end), None)
+                face = next((r for start, end, r in face_bounds if start <= sign_degree < end), None)
+                rulers.append((term, face))
+            cell_rulers[sign] = rulers
+
+        for planet, p in self.planets.items():
+            for is_day in (False, True):
+                sect = "day" if is_day else "night"
+                base = (p * 2 + is_day) * self.cells
+                for sign in signs:
+                    sign_flag = 0
+                    if sign.ruler == planet:
+                        sign_flag |= DOMICILE
+                    if EXALTATIONS.get(planet) == sign:
+                        sign_flag |= EXALTATION
+                    if RECEPTION_TRIPLICITY_RULERS[sign][sect] == planet:
+                        sign_flag |= RECEPTION_TRIPLICITY
+                    if TRIPLICITY_RULERS[sign][sect] == planet:
+                        sign_flag |= TRIPLICITY
+                    if sign in DETRIMENTS.get(planet, ()):
+                        sign_flag |= DETRIMENT
+                    if FALLS.get(planet) == sign:
+                        sign_flag |= FALL
+                    score = sum(weight for bit, weight in weights if sign_flag & bit)
+
+                    start = base + int(sign.start_degree) * self.cells_per_degree
+                    for offset, (term, face) in enumerate(cell_rulers[sign]):
+                        flag = sign_flag
+                        if term == planet:
+                            flag |= TERM
+                        if face == planet:
+                            flag |= FACE
+                        self.flags[start + offset] = flag
+                        self.scores[start + offset] = score
+
+        sign_bits = DOMICILE | EXALTATION | DETRIMENT | FALL
+        self._sign_scores = {
+            (planet, sign): sum(
+                weight for bit, weight in weights
+                if bit & sign_bits and self.flags_at(planet, sign.start_degree, False) & bit
+            )
+            for planet in self.planets
+            for sign in signs
+        }
+
+    def index(self, planet: Planet, longitude: float, is_day: bool) -> int:
+        cell = int((longitude % 360.0) * self.cells_per_degree) % self.cells
+        return (self.planets[planet] * 2 + bool(is_day)) * self.cells + cell
+
+    def flags_at(self, planet: Planet, longitude: float, is_day: bool) -> int:
+        """Dignity flags ``planet`` holds at ``longitude``."""
+        return self.flags[self.index(planet, longitude, is_day)]
+
+    def score_at(self, planet: Planet, longitude: float, is_day: bool) -> int:
+        """Essential dignity score: rulership, exaltation, triplicity, detriment and fall."""
+        return self.scores[self.index(planet, longitude, is_day)]
+
+    def sign_score(self, planet: Planet, sign: Sign) -> int:
+        """Sign-level score (rulership, exaltation, detriment and fall, no triplicity)."""
+        return self._sign_scores[planet, sign]
+
+
+_lock = threading.Lock()
+_tables: Dict[str, DignityTable] = {}
+
+
+def get_dignity_table(config=None) -> DignityTable:
+    """Return the dignity table for ``config`` (the loaded configuration by
+    default), compiling it on first use."""
+    if config is None:
+        config = cfg()
+    table = _tables.get(config.content_hash)
+    if table is None:
+        with _lock:
+            table = _tables.get(config.content_hash)
+            if table is None:
+                table = _tables[config.content_hash] = DignityTable(config)
+    return table
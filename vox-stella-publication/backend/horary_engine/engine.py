@@ -10,22 +10,23 @@ Refactored with comprehensive configuration system and enhanced lunar calculatio
 """
 
 import os
+import copy
 import datetime
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Any, Sequence, Tuple
 
 # Configuration system
-from horary_config import get_config, cfg, HoraryError
+from horary_config import get_config, cfg, ConfigSnapshot, HoraryError
 
 # Timezone handling
 import swisseph as swe
 
 # Import our computational helpers
 from .calculation.helpers import (
-    calculate_next_station_time,
     calculate_future_longitude,
     calculate_sign_boundary_longitude,
-    days_to_sign_exit,
     calculate_elongation,
     is_planet_oriental,
     sun_altitude_at_civil_twilight,
@@ -34,11 +35,18 @@ from .calculation.helpers import (
     normalize_longitude,
     degrees_to_dms,
 )
+from .calculation.chebyshev import get_chebyshev_ephemeris
+from .calculation.placement import house_of, house_table, sign_of
+from .calculation.ephemeris import EphemerisCache
+from .calculation.stations import get_station_index
 from .services.geolocation import (
-    TimezoneManager,
+    get_timezone_manager,
     LocationError,
     safe_geocode,
 )
+from .services.chart_store import ChartStore, chart_handle
+from .services.result_cache import ResultCache, result_cache_key
+from .services.singleflight import SingleFlight
 
 # Setup module logger
 logger = logging.getLogger(__name__)
@@ -58,12 +66,37 @@ from models import (
 )
 from question_analyzer import TraditionalHoraryQuestionAnalyzer
 from .reception import TraditionalReceptionCalculator
+from .dignity import EXALTATIONS, FALLS, HOUSE_JOYS, TRIPLICITY, get_dignity_table
+from .evaluation_context import (
+    attach_evaluation_context,
+    chart_config,
+    get_evaluation_context,
+    memoize_on_chart,
+)
 from .aspects import (
-    calculate_enhanced_aspects,
+    calculate_enhanced_aspects_batch,
     calculate_moon_last_aspect,
     calculate_moon_next_aspect,
 )
+from .aspect_index import attach_aspect_index, chart_aspect_index
+from .compact_chart import CompactChart
+from .event_timeline import EventTimeline, build_event_timeline
+from .lunar_timeline import (
+    LunarTimeline,
+    attach_lunar_timeline,
+    build_lunar_timeline,
+    chart_lunar_timeline,
+)
+from .profiles import get_profile_registry
 from .radicality import check_enhanced_radicality
+from .rule_pipeline import (
+    COST_EXPENSIVE,
+    COST_MODERATE,
+    JudgmentState,
+    RuleFact,
+    RulePipeline,
+    RuleStage,
+)
 from .serialization import (
     serialize_chart_for_frontend,
     serialize_lunar_aspect,
@@ -71,15 +104,97 @@ from .serialization import (
 )
 
 
+# Number of recent instants whose planets and aspects are kept for reuse
+INSTANT_CACHE_SIZE = 32
+
+# Concurrent judgments for the same chart inputs share one calculate_chart call
+chart_flight = SingleFlight("chart")
+
+
+class InstantState(NamedTuple):
+    """Everything about a chart that is the same for every observer"""
+    jd_ut: float
+    planets: Dict[Planet, PlanetPosition]
+    aspects: List[AspectInfo]
+    moon_last_aspect: Optional[LunarAspect]
+    moon_next_aspect: Optional[LunarAspect]
+    lunar_timeline: LunarTimeline
+
+
+class ChartMoment(NamedTuple):
+    """Where and when a question is asked, resolved from the request"""
+    lat: float
+    lon: float
+    location_name: str
+    dt_local: datetime.datetime
+    dt_utc: datetime.datetime
+    timezone: str
+    
+    @classmethod
+    def of_chart(cls, chart: HoraryChart) -> "ChartMoment":
+        """The place and time a chart was cast for"""
+        return cls(chart.location[0], chart.location[1], chart.location_name,
+                   chart.date_time, chart.date_time_utc, chart.timezone_info)
+
+
+class StoredChart(NamedTuple):
+    """A chart kept in the chart store for judging against later"""
+    chart: HoraryChart                  # Carries its evaluation context
+    profile: str
+    view: Dict[str, Any]                # ``chart_view`` of the chart
+
+
+def copy_chart(chart: HoraryChart) -> HoraryChart:
+    """A copy of ``chart`` whose positions, aspects and houses are its own
+    
+    The attached lunar timeline and evaluation context are shared: they
+    hold solved facts about the chart and are never changed.
+    """
+    clone = copy.copy(chart)
+    clone.planets = {planet: copy.copy(pos) for planet, pos in chart.planets.items()}
+    clone.aspects = [copy.copy(aspect) for aspect in chart.aspects]
+    clone.houses = list(chart.houses)
+    clone.house_rulers = dict(chart.house_rulers)
+    if chart.solar_analyses is not None:
+        clone.solar_analyses = {planet: copy.copy(analysis)
+                                for planet, analysis in chart.solar_analyses.items()}
+    clone.moon_last_aspect = copy.copy(chart.moon_last_aspect)
+    clone.moon_next_aspect = copy.copy(chart.moon_next_aspect)
+    attach_aspect_index(clone)
+    return clone
+
+
 class EnhancedTraditionalAstrologicalCalculator:
     """Enhanced Traditional astrological calculations with configuration system"""
     
-    def __init__(self):
+    def __init__(self, ephemeris: Optional[EphemerisCache] = None,
+                 ephemeris_backend: Optional[str] = None):
         # Set Swiss Ephemeris path
         swe.set_ephe_path('')
         
+        # Ephemeris backend: "swisseph" (default) or "chebyshev"
+        if ephemeris_backend is None:
+            ephemeris_backend = cfg().ephemeris.backend
+        self.chebyshev = None
+        if ephemeris_backend == "chebyshev":
+            self.chebyshev = get_chebyshev_ephemeris()
+        elif ephemeris_backend != "swisseph":
+            raise HoraryError(f"Unknown ephemeris backend: {ephemeris_backend}")
+        self.ephemeris_backend = "chebyshev" if self.chebyshev else "swisseph"
+        
+        # Shared ephemeris cache used by every calculation stage
+        if ephemeris is None:
+            ephemeris = EphemerisCache(source=self.chebyshev.calc_ut if self.chebyshev else None)
+        self.ephemeris = ephemeris
+        
+        # Observer-independent data for recent instants (see _instant_state)
+        self._instant_cache: "OrderedDict[Tuple[float, str], InstantState]" = OrderedDict()
+        self._instant_lock = threading.Lock()
+        # Event timelines for recent instants (see event_timeline)
+        self._event_timeline_cache: "OrderedDict[Tuple[float, float], EventTimeline]" = OrderedDict()
+        
         # Initialize timezone manager
-        self.timezone_manager = TimezoneManager()
+        self.timezone_manager = get_timezone_manager()
         
         # Traditional planets only
         self.planets_swe = {
@@ -92,27 +207,9 @@ class EnhancedTraditionalAstrologicalCalculator:
             Planet.SATURN: swe.SATURN
         }
         
-        # Traditional exaltations
-        self.exaltations = {
-            Planet.SUN: Sign.ARIES,
-            Planet.MOON: Sign.TAURUS,
-            Planet.MERCURY: Sign.VIRGO,
-            Planet.VENUS: Sign.PISCES,
-            Planet.MARS: Sign.CAPRICORN,
-            Planet.JUPITER: Sign.CANCER,
-            Planet.SATURN: Sign.LIBRA
-        }
-        
-        # Traditional falls (opposite to exaltations)
-        self.falls = {
-            Planet.SUN: Sign.LIBRA,
-            Planet.MOON: Sign.SCORPIO,
-            Planet.MERCURY: Sign.PISCES,
-            Planet.VENUS: Sign.VIRGO,
-            Planet.MARS: Sign.CANCER,
-            Planet.JUPITER: Sign.CAPRICORN,
-            Planet.SATURN: Sign.ARIES
-        }
+        # Traditional exaltations and falls (see horary_engine.dignity)
+        self.exaltations = EXALTATIONS
+        self.falls = FALLS
         
         # Planets that have traditional exceptions to combustion
         self.combustion_resistant = {
@@ -120,10 +217,33 @@ class EnhancedTraditionalAstrologicalCalculator:
             Planet.VENUS: "Venus as morning/evening star"
         }
     
+    def calculate_positions(self, jds) -> Dict[Planet, Any]:
+        """
+        Positions of the traditional planets at many epochs at once.
+        
+        Args:
+            jds: Sequence of Julian Days (UT)
+        
+        Returns:
+            Dict of Planet -> array of shape (len(jds), 6) holding longitude,
+            latitude, distance and their speeds (a list of tuples when the
+            Swiss Ephemeris backend is used)
+        """
+        if self.chebyshev is not None:
+            return {
+                planet_enum: self.chebyshev.positions(planet_id, jds)
+                for planet_enum, planet_id in self.planets_swe.items()
+            }
+        
+        return {
+            planet_enum: [swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)[0] for jd in jds]
+            for planet_enum, planet_id in self.planets_swe.items()
+        }
+    
     def get_real_moon_speed(self, jd_ut: float) -> float:
         """Get actual Moon speed from ephemeris in degrees per day"""
         try:
-            moon_data, ret_flag = swe.calc_ut(jd_ut, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
+            moon_data, ret_flag = self.ephemeris.calc_ut(jd_ut, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
             return abs(moon_data[3])  # degrees per day
         except Exception as e:
             logger.warning(f"Failed to get Moon speed from ephemeris: {e}")
@@ -131,12 +251,17 @@ class EnhancedTraditionalAstrologicalCalculator:
             return cfg().timing.default_moon_speed_fallback
     
     def calculate_chart(self, dt_local: datetime.datetime, dt_utc: datetime.datetime, 
-                       timezone_info: str, lat: float, lon: float, location_name: str) -> HoraryChart:
-        """Enhanced Calculate horary chart with configuration system"""
+                       timezone_info: str, lat: float, lon: float, location_name: str,
+                       config: Optional[ConfigSnapshot] = None) -> HoraryChart:
+        """Enhanced Calculate horary chart with configuration system
+        
+        ``config`` is the judgment profile's configuration snapshot (the
+        loaded configuration when omitted); it sets the orbs and dignity
+        scores the chart is built with.
+        """
         
         # Convert UTC datetime to Julian Day for Swiss Ephemeris
-        jd_ut = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, 
-                          dt_utc.hour + dt_utc.minute/60.0 + dt_utc.second/3600.0)
+        jd_ut = self._julian_day(dt_utc)
         
         logger.info(f"Calculating chart for:")
         logger.info(f"  Local time: {dt_local} ({timezone_info})")
@@ -149,18 +274,113 @@ class EnhancedTraditionalAstrologicalCalculator:
             safe_location = location_name.encode('ascii', 'replace').decode('ascii')
             logger.info(f"  Location: {safe_location} ({lat:.4f}, {lon:.4f})")
         
-        # Calculate traditional planets only
+        return self._assemble_chart(self._instant_state(jd_ut, config=config), dt_local, dt_utc,
+                                    timezone_info, lat, lon, location_name, config)
+    
+    def calculate_charts_for_instant(self, dt_local: datetime.datetime, dt_utc: datetime.datetime,
+                                     timezone_info: str,
+                                     locations: Sequence[Tuple[float, float, str]],
+                                     config: Optional[ConfigSnapshot] = None) -> List[HoraryChart]:
+        """
+        Fan one instant out to many places.
+        
+        Planet positions, aspects and the Moon's last/next aspect do not depend
+        on the observer, so they are computed once; houses, house rulers,
+        placements, solar conditions and dignities are derived per location.
+        Each chart is identical to what ``calculate_chart`` returns for the
+        same inputs.
+        
+        Args:
+            dt_local: Local datetime (as passed to ``calculate_chart``)
+            dt_utc: The shared UTC instant
+            timezone_info: Timezone name recorded on every chart
+            locations: Sequence of (latitude, longitude, location_name)
+            config: Configuration snapshot (as passed to ``calculate_chart``)
+        
+        Returns:
+            Charts in the same order as ``locations``
+        """
+        state = self._instant_state(self._julian_day(dt_utc), config=config)
+        return [
+            self._assemble_chart(state, dt_local, dt_utc, timezone_info, lat, lon, name, config)
+            for lat, lon, name in locations
+        ]
+    
+    def calculate_charts(self, inputs: Iterable[Tuple[datetime.datetime, float, float]],
+                         location_names: Optional[Sequence[str]] = None,
+                         config: Optional[ConfigSnapshot] = None,
+                         compact: bool = False) -> List[HoraryChart]:
+        """
+        Batch chart calculation for many (datetime, latitude, longitude) inputs.
+        
+        Planet positions, aspects and lunar aspects are computed once per
+        distinct instant (positions in a single vectorized call when the
+        Chebyshev backend is active); houses and everything that depends on
+        them are computed per input.
+        
+        Args:
+            inputs: Iterable of (datetime, latitude, longitude). Naive
+                datetimes are taken as UTC; aware ones are converted.
+            location_names: Optional names matching ``inputs`` one to one
+            config: Configuration snapshot (as passed to ``calculate_chart``)
+            compact: Return each chart packed as a ``CompactChart``, for
+                batches and caches that hold many charts at once
+        
+        Returns:
+            Charts in the same order as ``inputs``
+        """
+        requests = []
+        for dt, lat, lon in inputs:
+            dt_local = dt if dt.tzinfo is not None else dt.replace(tzinfo=datetime.timezone.utc)
+            dt_utc = dt_local.astimezone(datetime.timezone.utc)
+            requests.append((dt_local, dt_utc, self._julian_day(dt_utc), lat, lon))
+        
+        if location_names is not None and len(location_names) != len(requests):
+            raise HoraryError("location_names must match inputs one to one")
+        
+        unique_jds = list(dict.fromkeys(jd for _, _, jd, _, _ in requests))
+        planet_rows = None
+        if self.chebyshev is not None:
+            positions = self.calculate_positions(unique_jds)
+            planet_rows = [
+                {p: rows[i] for p, rows in positions.items()} for i in range(len(unique_jds))
+            ]
+        states = self._instant_states(unique_jds, planet_rows, config)
+        
+        logger.info(f"Batch of {len(requests)} charts over {len(unique_jds)} distinct instants")
+        
+        charts = []
+        for i, (dt_local, dt_utc, jd_ut, lat, lon) in enumerate(requests):
+            tzinfo = dt_local.tzinfo
+            timezone_info = getattr(tzinfo, "key", None) or getattr(tzinfo, "zone", None) or str(tzinfo)
+            name = location_names[i] if location_names is not None else f"{lat:.4f}, {lon:.4f}"
+            chart = self._assemble_chart(states[jd_ut], dt_local, dt_utc, timezone_info,
+                                         lat, lon, name, config)
+            charts.append(CompactChart.from_chart(chart) if compact else chart)
+        return charts
+    
+    @staticmethod
+    def _julian_day(dt_utc: datetime.datetime) -> float:
+        return swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, 
+                          dt_utc.hour + dt_utc.minute/60.0 + dt_utc.second/3600.0)
+    
+    def _calculate_planets(self, jd_ut: float,
+                           planet_data: Optional[Dict[Planet, Sequence[float]]] = None) -> Dict[Planet, PlanetPosition]:
+        """Planet positions at one instant (house and dignity are filled in later)"""
         planets = {}
         for planet_enum, planet_id in self.planets_swe.items():
             try:
-                planet_data, ret_flag = swe.calc_ut(jd_ut, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+                if planet_data is not None:
+                    data = planet_data[planet_enum]
+                else:
+                    data, ret_flag = self.ephemeris.calc_ut(jd_ut, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
                 
-                longitude = planet_data[0]
-                latitude = planet_data[1]
-                speed = planet_data[3]  # degrees/day
+                longitude = float(data[0])
+                latitude = float(data[1])
+                speed = float(data[3])  # degrees/day
                 retrograde = speed < 0
                 
-                sign = self._get_sign(longitude)
+                sign = sign_of(longitude)
                 
                 planets[planet_enum] = PlanetPosition(
                     planet=planet_enum,
@@ -185,6 +405,102 @@ class EnhancedTraditionalAstrologicalCalculator:
                     dignity_score=0,
                     speed=0.0
                 )
+        return planets
+    
+    def _instant_state(self, jd_ut: float,
+                       planet_data: Optional[Dict[Planet, Sequence[float]]] = None,
+                       config: Optional[ConfigSnapshot] = None) -> "InstantState":
+        """Observer-independent chart data for one instant, shared through a small LRU"""
+        planet_rows = [planet_data] if planet_data is not None else None
+        return self._instant_states([jd_ut], planet_rows, config)[jd_ut]
+    
+    def _instant_states(self, jds: Sequence[float],
+                        planet_rows: Optional[Sequence[Dict[Planet, Sequence[float]]]] = None,
+                        config: Optional[ConfigSnapshot] = None) -> Dict[float, "InstantState"]:
+        """
+        ``_instant_state`` for many instants; aspects of the instants not yet
+        cached are found in one batched aspect-kernel call.
+        
+        Args:
+            jds: Julian Days (UT)
+            planet_rows: Optional precomputed planet data matching ``jds``
+            config: Configuration snapshot (the loaded one by default)
+        """
+        if config is None:
+            config = cfg()
+        # Aspect orbs depend on the profile, so states are kept per configuration
+        states = {}
+        missing = []
+        with self._instant_lock:
+            for i, jd_ut in enumerate(jds):
+                key = (jd_ut, config.content_hash)
+                state = self._instant_cache.get(key)
+                if state is not None:
+                    self._instant_cache.move_to_end(key)
+                    states[jd_ut] = state
+                elif jd_ut not in states:
+                    states[jd_ut] = None
+                    missing.append(i)
+        if not missing:
+            return states
+        
+        missing_jds = [jds[i] for i in missing]
+        planet_sets = [
+            self._calculate_planets(jds[i], planet_rows[i] if planet_rows is not None else None)
+            for i in missing
+        ]
+        aspect_sets = calculate_enhanced_aspects_batch(planet_sets, missing_jds, config)
+        
+        computed = []
+        for jd_ut, planets, aspects in zip(missing_jds, planet_sets, aspect_sets):
+            timeline = build_lunar_timeline(jd_ut, self.planets_swe, self.ephemeris.calc_ut)
+            state = InstantState(
+                jd_ut=jd_ut,
+                planets=planets,
+                aspects=aspects,
+                moon_last_aspect=calculate_moon_last_aspect(
+                    planets, jd_ut, self.get_real_moon_speed, timeline),
+                moon_next_aspect=calculate_moon_next_aspect(
+                    planets, jd_ut, self.get_real_moon_speed, timeline),
+                lunar_timeline=timeline,
+            )
+            states[jd_ut] = state
+            computed.append(state)
+        
+        with self._instant_lock:
+            for state in computed:
+                self._instant_cache[(state.jd_ut, config.content_hash)] = state
+            while len(self._instant_cache) > INSTANT_CACHE_SIZE:
+                self._instant_cache.popitem(last=False)
+        return states
+    
+    def event_timeline(self, jd_ut: float, horizon_days: float) -> EventTimeline:
+        """Perfections, stations and ingresses ahead of an instant, shared through a small LRU"""
+        key = (jd_ut, horizon_days)
+        station_index = get_station_index()
+        with self._instant_lock:
+            timeline = self._event_timeline_cache.get(key)
+            if timeline is None:
+                timeline = build_event_timeline(jd_ut, self.planets_swe, horizon_days,
+                                                self.ephemeris.calc_ut, station_index)
+                self._event_timeline_cache[key] = timeline
+                while len(self._event_timeline_cache) > INSTANT_CACHE_SIZE:
+                    self._event_timeline_cache.popitem(last=False)
+            else:
+                self._event_timeline_cache.move_to_end(key)
+        return timeline
+    
+    def _assemble_chart(self, state: "InstantState", dt_local: datetime.datetime,
+                        dt_utc: datetime.datetime, timezone_info: str, lat: float,
+                        lon: float, location_name: str,
+                        config: Optional[ConfigSnapshot] = None) -> HoraryChart:
+        """Location-dependent part of the chart: houses, placements, dignities"""
+        if config is None:
+            config = cfg()
+        
+        jd_ut = state.jd_ut
+        # Each chart gets its own copies; house and dignity are set per location
+        planets = {planet: copy.copy(pos) for planet, pos in state.planets.items()}
         
         # Calculate houses (Regiomontanus - traditional for horary)
         try:
@@ -201,13 +517,13 @@ class EnhancedTraditionalAstrologicalCalculator:
         # Calculate house positions and house rulers
         house_rulers = {}
         for i, cusp in enumerate(houses, 1):
-            sign = self._get_sign(cusp)
+            sign = sign_of(cusp)
             house_rulers[i] = sign.ruler
         
         # Update planet house positions
+        table = house_table(houses)
         for planet_pos in planets.values():
-            house = self._calculate_house_position(planet_pos.longitude, houses)
-            planet_pos.house = house
+            planet_pos.house = table.house_of(planet_pos.longitude)
         
         # Enhanced solar condition analysis
         sun_pos = planets[Planet.SUN]
@@ -215,23 +531,17 @@ class EnhancedTraditionalAstrologicalCalculator:
         
         for planet_enum, planet_pos in planets.items():
             solar_analysis = self._analyze_enhanced_solar_condition(
-                planet_enum, planet_pos, sun_pos, lat, lon, jd_ut)
+                planet_enum, planet_pos, sun_pos, lat, lon, jd_ut, config)
             solar_analyses[planet_enum] = solar_analysis
             
             # Calculate comprehensive traditional dignity with all factors
             planet_pos.dignity_score = self._calculate_comprehensive_traditional_dignity(
-                planet_pos.planet, planet_pos, houses, planets[Planet.SUN], solar_analysis)
+                planet_pos.planet, planet_pos, houses, planets[Planet.SUN], solar_analysis, config)
         
-        # Calculate enhanced traditional aspects
-        aspects = calculate_enhanced_aspects(planets, jd_ut)
-
-        # NEW: Calculate last and next lunar aspects
-        moon_last_aspect = calculate_moon_last_aspect(
-            planets, jd_ut, self.get_real_moon_speed
-        )
-        moon_next_aspect = calculate_moon_next_aspect(
-            planets, jd_ut, self.get_real_moon_speed
-        )
+        # Aspects and lunar aspects depend only on the instant
+        aspects = [copy.copy(aspect) for aspect in state.aspects]
+        moon_last_aspect = copy.copy(state.moon_last_aspect)
+        moon_next_aspect = copy.copy(state.moon_next_aspect)
         
         chart = HoraryChart(
             date_time=dt_local,
@@ -250,6 +560,8 @@ class EnhancedTraditionalAstrologicalCalculator:
             moon_last_aspect=moon_last_aspect,
             moon_next_aspect=moon_next_aspect
         )
+        attach_lunar_timeline(chart, state.lunar_timeline)
+        attach_aspect_index(chart)
         
         return chart
     
@@ -259,8 +571,11 @@ class EnhancedTraditionalAstrologicalCalculator:
     
     def _analyze_enhanced_solar_condition(self, planet: Planet, planet_pos: PlanetPosition, 
                                         sun_pos: PlanetPosition, lat: float, lon: float,
-                                        jd_ut: float) -> SolarAnalysis:
+                                        jd_ut: float,
+                                        config: Optional[ConfigSnapshot] = None) -> SolarAnalysis:
         """Enhanced solar condition analysis with configuration"""
+        if config is None:
+            config = cfg()
         
         # Don't analyze the Sun itself
         if planet == Planet.SUN:
@@ -275,9 +590,9 @@ class EnhancedTraditionalAstrologicalCalculator:
         elongation = calculate_elongation(planet_pos.longitude, sun_pos.longitude)
         
         # Get configured orbs
-        cazimi_orb = cfg().orbs.cazimi_orb_arcmin / 60.0  # Convert arcminutes to degrees
-        combustion_orb = cfg().orbs.combustion_orb
-        under_beams_orb = cfg().orbs.under_beams_orb
+        cazimi_orb = config.orbs.cazimi_orb_arcmin / 60.0  # Convert arcminutes to degrees
+        combustion_orb = config.orbs.combustion_orb
+        under_beams_orb = config.orbs.under_beams_orb
         
         # Enhanced visibility check for Venus and Mercury
         traditional_exception = False
@@ -354,7 +669,7 @@ class EnhancedTraditionalAstrologicalCalculator:
         is_oriental = is_planet_oriental(planet_pos.longitude, sun_pos.longitude)
         
         # Get Sun altitude at civil twilight
-        sun_altitude = sun_altitude_at_civil_twilight(lat, lon, jd_ut)
+        sun_altitude = sun_altitude_at_civil_twilight(lat, lon, jd_ut, ephemeris=self.ephemeris)
         
         # Classical visibility conditions
         if planet == Planet.MERCURY:
@@ -379,49 +694,18 @@ class EnhancedTraditionalAstrologicalCalculator:
         return False
     
     def _calculate_enhanced_dignity(self, planet: Planet, sign: Sign, house: int, 
-                                  solar_analysis: Optional[SolarAnalysis] = None) -> int:
+                                  solar_analysis: Optional[SolarAnalysis] = None,
+                                  config: Optional[ConfigSnapshot] = None) -> int:
         """Enhanced dignity calculation with configuration"""
         score = 0
-        config = cfg()
-        
-        # Rulership
-        if sign.ruler == planet:
-            score += config.dignity.rulership
-        
-        # Exaltation
-        if planet in self.exaltations and self.exaltations[planet] == sign:
-            score += config.dignity.exaltation
-        
-        # Detriment - opposite to rulership
-        detriment_signs = {
-            Planet.SUN: [Sign.AQUARIUS],
-            Planet.MOON: [Sign.CAPRICORN],
-            Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
-            Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
-            Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
-            Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
-            Planet.SATURN: [Sign.CANCER, Sign.LEO]
-        }
-        
-        if planet in detriment_signs and sign in detriment_signs[planet]:
-            score += config.dignity.detriment
+        if config is None:
+            config = cfg()
         
-        # Fall
-        if planet in self.falls and self.falls[planet] == sign:
-            score += config.dignity.fall
+        # Rulership, exaltation, detriment and fall
+        score += get_dignity_table(config).sign_score(planet, sign)
         
         # House considerations - traditional joys
-        house_joys = {
-            Planet.MERCURY: 1,  # 1st house
-            Planet.MOON: 3,     # 3rd house
-            Planet.VENUS: 5,    # 5th house
-            Planet.MARS: 6,     # 6th house
-            Planet.SUN: 9,      # 9th house
-            Planet.JUPITER: 11, # 11th house
-            Planet.SATURN: 12   # 12th house
-        }
-        
-        if planet in house_joys and house_joys[planet] == house:
+        if HOUSE_JOYS.get(planet) == house:
             score += config.dignity.joy
         
         # ENHANCED: Use 5° rule for angularity determination
@@ -457,54 +741,25 @@ class EnhancedTraditionalAstrologicalCalculator:
     
     def _calculate_comprehensive_traditional_dignity(self, planet: Planet, planet_pos: PlanetPosition, 
                                                    houses: List[float], sun_pos: PlanetPosition,
-                                                   solar_analysis: Optional[SolarAnalysis] = None) -> int:
+                                                   solar_analysis: Optional[SolarAnalysis] = None,
+                                                   config: Optional[ConfigSnapshot] = None) -> int:
         """Comprehensive traditional dignity scoring with all classical factors (ENHANCED)"""
         score = 0
-        config = cfg()
-        sign = self._get_sign(planet_pos.longitude)
+        if config is None:
+            config = cfg()
         house = planet_pos.house
         
         # === ESSENTIAL DIGNITIES ===
         
-        # Rulership (+5)
-        if sign.ruler == planet:
-            score += config.dignity.rulership
-        
-        # Exaltation (+4)
-        if planet in self.exaltations and self.exaltations[planet] == sign:
-            score += config.dignity.exaltation
-        
-        # Triplicity (+3) - traditional day/night rulers
-        triplicity_score = self._calculate_triplicity_dignity(planet, sign, sun_pos)
-        score += triplicity_score
-        
-        # Detriment (-5)
-        detriment_signs = {
-            Planet.SUN: [Sign.AQUARIUS],
-            Planet.MOON: [Sign.CAPRICORN], 
-            Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
-            Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
-            Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
-            Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
-            Planet.SATURN: [Sign.CANCER, Sign.LEO]
-        }
-        
-        if planet in detriment_signs and sign in detriment_signs[planet]:
-            score += config.dignity.detriment
-        
-        # Fall (-4)
-        if planet in self.falls and self.falls[planet] == sign:
-            score += config.dignity.fall
+        # Rulership (+5), exaltation (+4), triplicity (+3) by day/night,
+        # detriment (-5) and fall (-4) from the compiled dignity table
+        is_day = sun_pos.house in [7, 8, 9, 10, 11, 12]  # Houses below horizon = day
+        score += get_dignity_table(config).score_at(planet, planet_pos.longitude, is_day)
         
         # === ACCIDENTAL DIGNITIES ===
         
         # House joys (+2)
-        house_joys = {
-            Planet.MERCURY: 1, Planet.MOON: 3, Planet.VENUS: 5,
-            Planet.MARS: 6, Planet.SUN: 9, Planet.JUPITER: 11, Planet.SATURN: 12
-        }
-        
-        if planet in house_joys and house_joys[planet] == house:
+        if HOUSE_JOYS.get(planet) == house:
             score += config.dignity.joy
         
         # Angularity with 5° rule
@@ -520,7 +775,7 @@ class EnhancedTraditionalAstrologicalCalculator:
         # === ADVANCED TRADITIONAL FACTORS ===
         
         # Speed considerations
-        speed_bonus = self._calculate_speed_dignity(planet, planet_pos.speed)
+        speed_bonus = self._calculate_speed_dignity(planet, planet_pos.speed, config)
         score += speed_bonus
         
         # Retrograde penalty
@@ -528,7 +783,7 @@ class EnhancedTraditionalAstrologicalCalculator:
             score += config.retrograde.dignity_penalty
         
         # Hayz (sect/time) bonus for planets in proper sect
-        hayz_bonus = self._calculate_hayz_dignity(planet, sun_pos, houses)
+        hayz_bonus = self._calculate_hayz_dignity(planet, sun_pos, houses, config)
         score += hayz_bonus
         
         # Solar conditions
@@ -549,48 +804,26 @@ class EnhancedTraditionalAstrologicalCalculator:
         
         return score
     
-    def _calculate_triplicity_dignity(self, planet: Planet, sign: Sign, sun_pos: PlanetPosition) -> int:
+    def _calculate_triplicity_dignity(self, planet: Planet, sign: Sign, sun_pos: PlanetPosition,
+                                      config: Optional[ConfigSnapshot] = None) -> int:
         """Calculate traditional triplicity dignity (ENHANCED)"""
-        # Traditional triplicity rulers by element and day/night (CORRECTED)
-        triplicity_rulers = {
-            # Fire signs (Aries, Leo, Sagittarius) 
-            Sign.ARIES: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.LEO: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.SAGITTARIUS: {"day": Planet.SUN, "night": Planet.JUPITER},
-            
-            # Earth signs (Taurus, Virgo, Capricorn)
-            Sign.TAURUS: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.VIRGO: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.CAPRICORN: {"day": Planet.VENUS, "night": Planet.MOON},
-            
-            # Air signs (Gemini, Libra, Aquarius)
-            Sign.GEMINI: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.LIBRA: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.AQUARIUS: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            
-            # Water signs (Cancer, Scorpio, Pisces)
-            Sign.CANCER: {"day": Planet.VENUS, "night": Planet.MARS},
-            Sign.SCORPIO: {"day": Planet.VENUS, "night": Planet.MARS},
-            Sign.PISCES: {"day": Planet.VENUS, "night": Planet.MARS}
-        }
-        
-        if sign not in triplicity_rulers:
-            return 0
-            
         # Determine if it's day or night (Sun above or below horizon)
         # Day = Sun in houses 7-12 (below horizon), Night = Sun in houses 1-6 (above horizon)
         sun_house = sun_pos.house
         is_day = sun_house in [7, 8, 9, 10, 11, 12]  # Houses below horizon = day
-        sect = "day" if is_day else "night"
         
-        if triplicity_rulers[sign][sect] == planet:
-            return cfg().dignity.triplicity  # Configurable triplicity score
+        if config is None:
+            config = cfg()
+        if get_dignity_table(config).flags_at(planet, sign.start_degree, is_day) & TRIPLICITY:
+            return config.dignity.triplicity  # Configurable triplicity score
             
         return 0
     
-    def _calculate_speed_dignity(self, planet: Planet, speed: float) -> int:
+    def _calculate_speed_dignity(self, planet: Planet, speed: float,
+                                 config: Optional[ConfigSnapshot] = None) -> int:
         """Calculate dignity bonus/penalty based on planetary speed (ENHANCED)"""
-        config = cfg()
+        if config is None:
+            config = cfg()
         
         # Traditional fast/slow considerations
         if planet == Planet.MOON:
@@ -609,12 +842,14 @@ class EnhancedTraditionalAstrologicalCalculator:
                 
         return 0
     
-    def _calculate_hayz_dignity(self, planet: Planet, sun_pos: PlanetPosition, houses: List[float]) -> int:
+    def _calculate_hayz_dignity(self, planet: Planet, sun_pos: PlanetPosition, houses: List[float],
+                                config: Optional[ConfigSnapshot] = None) -> int:
         """Calculate hayz (sect) dignity bonus (ENHANCED)"""
-        config = cfg()
+        if config is None:
+            config = cfg()
         
         # Determine if Sun is above horizon (day) or below (night)
-        sun_house = self._calculate_house_position(sun_pos.longitude, houses)
+        sun_house = house_of(sun_pos.longitude, houses)
         is_day = sun_house in [7, 8, 9, 10, 11, 12]  # Houses below horizon = day
         
         # Traditional sect assignments
@@ -636,44 +871,20 @@ class EnhancedTraditionalAstrologicalCalculator:
     
     def _calculate_enhanced_dignity_with_5degree_rule(self, planet: Planet, planet_pos: PlanetPosition, 
                                                      houses: List[float], 
-                                                     solar_analysis: Optional[SolarAnalysis] = None) -> int:
+                                                     solar_analysis: Optional[SolarAnalysis] = None,
+                                                     config: Optional[ConfigSnapshot] = None) -> int:
         """Enhanced dignity calculation with 5° rule for angularity (ENHANCED)"""
         score = 0
-        config = cfg()
-        sign = self._get_sign(planet_pos.longitude)
+        if config is None:
+            config = cfg()
+        sign = sign_of(planet_pos.longitude)
         house = planet_pos.house
         
         # Basic dignities (same as before)
-        if sign.ruler == planet:
-            score += config.dignity.rulership
-        
-        if planet in self.exaltations and self.exaltations[planet] == sign:
-            score += config.dignity.exaltation
-        
-        # Detriment
-        detriment_signs = {
-            Planet.SUN: [Sign.AQUARIUS],
-            Planet.MOON: [Sign.CAPRICORN],
-            Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
-            Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
-            Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
-            Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
-            Planet.SATURN: [Sign.CANCER, Sign.LEO]
-        }
-        
-        if planet in detriment_signs and sign in detriment_signs[planet]:
-            score += config.dignity.detriment
-        
-        if planet in self.falls and self.falls[planet] == sign:
-            score += config.dignity.fall
+        score += get_dignity_table(config).sign_score(planet, sign)
         
         # House joys
-        house_joys = {
-            Planet.MERCURY: 1, Planet.MOON: 3, Planet.VENUS: 5,
-            Planet.MARS: 6, Planet.SUN: 9, Planet.JUPITER: 11, Planet.SATURN: 12
-        }
-        
-        if planet in house_joys and house_joys[planet] == house:
+        if HOUSE_JOYS.get(planet) == house:
             score += config.dignity.joy
         
         # ENHANCED: Apply 5° rule for angularity
@@ -705,31 +916,6 @@ class EnhancedTraditionalAstrologicalCalculator:
         return score
     
     
-    def _get_sign(self, longitude: float) -> Sign:
-        """Get zodiac sign from longitude"""
-        longitude = longitude % 360
-        for sign in Sign:
-            if sign.start_degree <= longitude < (sign.start_degree + 30):
-                return sign
-        return Sign.PISCES
-    
-    def _calculate_house_position(self, longitude: float, houses: List[float]) -> int:
-        """Calculate house position"""
-        longitude = longitude % 360
-        
-        for i in range(12):
-            current_cusp = houses[i] % 360
-            next_cusp = houses[(i + 1) % 12] % 360
-            
-            if current_cusp > next_cusp:  # Crosses 0°
-                if longitude >= current_cusp or longitude < next_cusp:
-                    return i + 1
-            else:
-                if current_cusp <= longitude < next_cusp:
-                    return i + 1
-        
-        return 1
-    
     def _get_traditional_angularity(self, longitude: float, houses: List[float], house: int) -> str:
         """Determine traditional angularity using 5° rule (ENHANCED)"""
         longitude = longitude % 360
@@ -759,6 +945,53 @@ class EnhancedTraditionalAstrologicalCalculator:
             return "cadent"
 
 
+def _significators(state: JudgmentState) -> Dict[str, Any]:
+    return state.fact("significators")
+
+
+# The judgment, stage by stage in traditional precedence.  Facts are
+# computed only when a stage that reads them runs, so a judgment decided by
+# an early gate never pays for the perfection timing or Moon testimony.
+JUDGMENT_PIPELINE = RulePipeline(
+    stages=[
+        RuleStage("radicality", "_stage_radicality", gating=True),
+        RuleStage("void_moon", "_stage_void_moon", gating=True,
+                  applies=lambda state: not state.ignore_void_moon),
+        RuleStage("significators", "_stage_significators", ("significators",), gating=True),
+        RuleStage("same_ruler_bonus", "_stage_same_ruler_bonus",
+                  applies=lambda state: bool(_significators(state).get("same_ruler_analysis"))),
+        RuleStage("solar", "_stage_solar", ("solar_factors",), gating=True, cost=COST_MODERATE),
+        RuleStage("transaction_translation", "_stage_transaction_translation", ("solar_factors",),
+                  gating=True, cost=COST_MODERATE,
+                  applies=lambda state: bool(_significators(state).get("transaction_type")
+                                             and _significators(state).get("item_significator"))),
+        RuleStage("perfection_pair", "_stage_perfection_pair"),
+        RuleStage("prohibition", "_stage_prohibition", ("perfection",), gating=True,
+                  cost=COST_EXPENSIVE),
+        RuleStage("perfection", "_stage_perfection", ("perfection",), gating=True,
+                  cost=COST_EXPENSIVE),
+        RuleStage("same_ruler_unity", "_stage_same_ruler_unity", gating=True,
+                  applies=lambda state: bool(_significators(state).get("same_ruler_analysis"))),
+        RuleStage("moon_next_aspect", "_stage_moon_next_aspect", ("moon_next_aspect",)),
+        RuleStage("denial", "_stage_denial", gating=True, cost=COST_MODERATE),
+        RuleStage("theft_loss_denial", "_stage_theft_loss_denial", gating=True),
+        RuleStage("benefic_support", "_stage_benefic_support", ("benefic_support",)),
+        RuleStage("pregnancy", "_stage_pregnancy", ("moon_testimony",), gating=True,
+                  applies=lambda state: state.question_analysis.get("question_type") == "pregnancy"),
+        RuleStage("fallback_denial", "_stage_fallback_denial",
+                  ("moon_testimony", "benefic_support", "moon_next_aspect"), gating=True),
+    ],
+    facts=[
+        RuleFact("significators", "_fact_significators"),
+        RuleFact("solar_factors", "_fact_solar_factors", COST_MODERATE),
+        RuleFact("perfection", "_fact_perfection", COST_EXPENSIVE),
+        RuleFact("moon_next_aspect", "_fact_moon_next_aspect"),
+        RuleFact("moon_testimony", "_fact_moon_testimony", COST_MODERATE),
+        RuleFact("benefic_support", "_fact_benefic_support"),
+    ],
+)
+
+
 class EnhancedTraditionalHoraryJudgmentEngine:
     """Enhanced Traditional horary judgment engine with configuration system"""
     
@@ -766,7 +999,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         self.question_analyzer = TraditionalHoraryQuestionAnalyzer()
         self.calculator = EnhancedTraditionalAstrologicalCalculator()
         self.reception_calculator = TraditionalReceptionCalculator()
-        self.timezone_manager = TimezoneManager()
+        self.timezone_manager = get_timezone_manager()
     
     def judge_question(self, question: str, location: str, 
                       date_str: Optional[str] = None, time_str: Optional[str] = None,
@@ -778,85 +1011,164 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                       ignore_combustion: bool = False,
                       ignore_saturn_7th: bool = False,
                       # Legacy reception weighting (now configurable)
-                      exaltation_confidence_boost: float = None) -> Dict[str, Any]:
-        """Enhanced Traditional horary judgment with configuration system"""
+                      exaltation_confidence_boost: float = None,
+                      config: Optional[ConfigSnapshot] = None,
+                      moment: Optional[ChartMoment] = None) -> Dict[str, Any]:
+        """Enhanced Traditional horary judgment with configuration system
+        
+        ``config`` is the configuration snapshot of the judgment profile to
+        use (the loaded configuration when omitted). It is bound to the
+        chart and read from there by every rule. ``moment`` is the place
+        and time already resolved by ``resolve_moment``, if the caller has
+        done so.
+        """
         
         try:
             # Use configured values if not overridden
-            config = cfg()
+            if config is None:
+                config = cfg()
             if exaltation_confidence_boost is None:
                 exaltation_confidence_boost = config.confidence.reception.mutual_exaltation_bonus
             
-            # Fail-fast geocoding
-            try:
-                lat, lon, full_location = safe_geocode(location)
-            except LocationError as e:
-                raise e
+            if moment is None:
+                moment = self.resolve_moment(location, date_str, time_str, timezone_str,
+                                             use_current_time)
+            chart = self.chart_for_moment(moment, config)
+            attach_evaluation_context(chart, config)
             
-            # Handle datetime with proper timezone support
-            if use_current_time:
-                dt_local, dt_utc, timezone_used = self.timezone_manager.get_current_time_for_location(lat, lon)
-            else:
-                if not date_str or not time_str:
-                    raise ValueError("Date and time must be provided when not using current time")
-                dt_local, dt_utc, timezone_used = self.timezone_manager.parse_datetime_with_timezone(
-                    date_str, time_str, timezone_str, lat, lon)
-            
-            chart = self.calculator.calculate_chart(dt_local, dt_utc, timezone_used, lat, lon, full_location)
-            
-            # Analyze question traditionally
-            question_analysis = self.question_analyzer.analyze_question(question)
+            return self.judge_chart(
+                chart, question, manual_houses,
+                ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
+                exaltation_confidence_boost, moment=moment)
             
-            # Override with manual houses if provided
-            if manual_houses:
-                question_analysis["relevant_houses"] = manual_houses
-                question_analysis["significators"]["quesited_house"] = manual_houses[1] if len(manual_houses) > 1 else 7
+        except Exception as e:
+            return self.error_result(e)
+    
+    def chart_for_moment(self, moment: ChartMoment,
+                         config: Optional[ConfigSnapshot] = None) -> HoraryChart:
+        """The chart cast for a resolved place and time"""
+        if config is None:
+            config = cfg()
+        lat, lon, full_location, dt_local, dt_utc, timezone_used = moment
+        # Requests arriving within the same second for the same place and
+        # profile share one chart calculation; each gets its own copy.
+        chart_key = (dt_utc.replace(microsecond=0).isoformat(), timezone_used, lat, lon,
+                     full_location, config.content_hash)
+        return copy_chart(chart_flight.do(
+            chart_key,
+            lambda: self.calculator.calculate_chart(dt_local, dt_utc, timezone_used, lat, lon,
+                                                    full_location, config),
+        ))
+    
+    def chart_view(self, chart: HoraryChart, moment: Optional[ChartMoment] = None) -> Dict[str, Any]:
+        """The parts of a judgment response that depend on the chart alone"""
+        if moment is None:
+            moment = ChartMoment.of_chart(chart)
+        return {
+            "chart_data": serialize_chart_for_frontend(chart, chart.solar_analyses),
+            "general_info": self._calculate_general_info(chart),
+            "moon_aspects": self._build_moon_story(chart),  # Enhanced Moon story
             
-            # Apply enhanced judgment with configuration
-            judgment = self._apply_enhanced_judgment(
-                chart, question_analysis, 
-                ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
-                exaltation_confidence_boost)
+            # NEW: Enhanced lunar aspects
+            "moon_last_aspect": serialize_lunar_aspect(chart.moon_last_aspect),
+            "moon_next_aspect": serialize_lunar_aspect(chart.moon_next_aspect),
             
-            # Serialize chart data for frontend
-            chart_data_serialized = serialize_chart_for_frontend(chart, chart.solar_analyses)
-
-            general_info = self._calculate_general_info(chart)
-            considerations = self._calculate_considerations(chart, question_analysis)
-
-            return {
-                "question": question,
-                "judgment": judgment["result"],
-                "confidence": judgment["confidence"],
-                "reasoning": judgment["reasoning"],
-                
-                "chart_data": chart_data_serialized,
-                
-                "question_analysis": question_analysis,
-                "timing": judgment.get("timing"),
-                "moon_aspects": self._build_moon_story(chart),  # Enhanced Moon story
-                "traditional_factors": judgment.get("traditional_factors", {}),
-                "solar_factors": judgment.get("solar_factors", {}),
-                "general_info": general_info,
-                "considerations": considerations,
-                
-                # NEW: Enhanced lunar aspects
-                "moon_last_aspect": serialize_lunar_aspect(chart.moon_last_aspect),
-                "moon_next_aspect": serialize_lunar_aspect(chart.moon_next_aspect),
-                
-                "timezone_info": {
-                    "local_time": dt_local.isoformat(),
-                    "utc_time": dt_utc.isoformat(),
-                    "timezone": timezone_used,
-                    "location_name": full_location,
-                    "coordinates": {
-                        "latitude": lat,
-                        "longitude": lon
-                    }
+            "timezone_info": {
+                "local_time": moment.dt_local.isoformat(),
+                "utc_time": moment.dt_utc.isoformat(),
+                "timezone": moment.timezone,
+                "location_name": moment.location_name,
+                "coordinates": {
+                    "latitude": moment.lat,
+                    "longitude": moment.lon
                 }
             }
+        }
+    
+    def judge_chart(self, chart: HoraryChart, question: str,
+                    manual_houses: Optional[List[int]] = None,
+                    ignore_radicality: bool = False,
+                    ignore_void_moon: bool = False,
+                    ignore_combustion: bool = False,
+                    ignore_saturn_7th: bool = False,
+                    exaltation_confidence_boost: Optional[float] = None,
+                    moment: Optional[ChartMoment] = None,
+                    view: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Judge ``question`` against a chart already cast
+        
+        The chart must carry its evaluation context (and with it the
+        configuration it is judged under). ``view`` is the chart's
+        ``chart_view``, when the caller has it already.
+        """
+        config = chart_config(chart)
+        if exaltation_confidence_boost is None:
+            exaltation_confidence_boost = config.confidence.reception.mutual_exaltation_bonus
+        
+        # Analyze question traditionally
+        question_analysis = self.question_analyzer.analyze_question(question)
+        
+        # Override with manual houses if provided
+        if manual_houses:
+            question_analysis["relevant_houses"] = manual_houses
+            question_analysis["significators"]["quesited_house"] = manual_houses[1] if len(manual_houses) > 1 else 7
+        
+        # Apply enhanced judgment with configuration
+        judgment = self._apply_enhanced_judgment(
+            chart, question_analysis, 
+            ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
+            exaltation_confidence_boost)
+        
+        # Serialize chart data for frontend
+        if view is None:
+            view = self.chart_view(chart, moment)
+        considerations = self._calculate_considerations(chart, question_analysis)
+        
+        result = {
+            "question": question,
+            "judgment": judgment["result"],
+            "confidence": judgment["confidence"],
+            "reasoning": judgment["reasoning"],
+            
+            "chart_data": view["chart_data"],
+            
+            "question_analysis": question_analysis,
+            "timing": judgment.get("timing"),
+            "moon_aspects": view["moon_aspects"],
+            "traditional_factors": judgment.get("traditional_factors", {}),
+            "solar_factors": judgment.get("solar_factors", {}),
+            "general_info": view["general_info"],
+            "considerations": considerations,
+            
+            "moon_last_aspect": view["moon_last_aspect"],
+            "moon_next_aspect": view["moon_next_aspect"],
             
-        except LocationError as e:
+            "timezone_info": view["timezone_info"],
+        }
+        result["_evaluation_stats"] = get_evaluation_context(chart).stats()
+        result["_rule_trace"] = judgment.get("_rule_trace")
+        return result
+    
+    def resolve_moment(self, location: str, date_str: Optional[str] = None,
+                       time_str: Optional[str] = None, timezone_str: Optional[str] = None,
+                       use_current_time: bool = True) -> ChartMoment:
+        """Geocode the location and resolve the chart time (raises on bad input)"""
+        # Fail-fast geocoding
+        lat, lon, full_location = safe_geocode(location)
+        
+        # Handle datetime with proper timezone support
+        if use_current_time:
+            dt_local, dt_utc, timezone_used = self.timezone_manager.get_current_time_for_location(lat, lon)
+        else:
+            if not date_str or not time_str:
+                raise ValueError("Date and time must be provided when not using current time")
+            dt_local, dt_utc, timezone_used = self.timezone_manager.parse_datetime_with_timezone(
+                date_str, time_str, timezone_str, lat, lon)
+        return ChartMoment(lat, lon, full_location, dt_local, dt_utc, timezone_used)
+    
+    @staticmethod
+    def error_result(e: Exception) -> Dict[str, Any]:
+        """Response for a judgment that failed with ``e``"""
+        if isinstance(e, LocationError):
             return {
                 "error": str(e),
                 "judgment": "LOCATION_ERROR",
@@ -864,16 +1176,15 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "reasoning": [f"Location error: {e}"],
                 "error_type": "LocationError"
             }
-        except Exception as e:
-            import traceback
-            logger.error(f"Error in judge_question: {e}")
-            logger.error(traceback.format_exc())
-            return {
-                "error": str(e),
-                "judgment": "ERROR",
-                "confidence": 0,
-                "reasoning": [f"Calculation error: {e}"]
-            }
+        import traceback
+        logger.error(f"Error in judge_question: {e}")
+        logger.error(traceback.format_exc())
+        return {
+            "error": str(e),
+            "judgment": "ERROR",
+            "confidence": 0,
+            "reasoning": [f"Calculation error: {e}"]
+        }
     
     def _moon_aspects_significator_directly(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> bool:
         """
@@ -900,7 +1211,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         if elongation > 180:
             elongation = 360 - elongation
         
-        config = cfg()
+        config = chart_config(chart)
         
         # Determine phase and return bonus
         if 0 <= elongation < 30:
@@ -924,7 +1235,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         """Calculate Moon speed bonus from configuration"""
         
         moon_speed = abs(chart.planets[Planet.MOON].speed)
-        config = cfg()
+        config = chart_config(chart)
         
         if moon_speed < 11.0:
             return config.moon.speed_bonus.very_slow
@@ -941,7 +1252,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         """Calculate Moon angularity bonus from configuration"""
         
         moon_house = chart.planets[Planet.MOON].house
-        config = cfg()
+        config = chart_config(chart)
         
         if moon_house in [1, 4, 7, 10]:
             return config.moon.angularity_bonus.angular
@@ -1076,256 +1387,318 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                                ignore_radicality: bool = False, ignore_void_moon: bool = False,
                                ignore_combustion: bool = False, ignore_saturn_7th: bool = False,
                                exaltation_confidence_boost: float = 15.0) -> Dict[str, Any]:
-        """Enhanced judgment with configuration system"""
-        
-        reasoning = []
-        config = cfg()
-        confidence = config.confidence.base_confidence
-        asc_penalty = 0
-        void_penalty = 0
-        
-        # 1. Enhanced radicality with configuration
-        if not ignore_radicality:
-            radicality = check_enhanced_radicality(chart, ignore_saturn_7th)
-            if not radicality["valid"]:
-                reasoning.append(f"Radicality: {radicality['reason']}")
-                reason = radicality["reason"]
-                # Early or late Ascendant only gives a modest penalty
-                if "Ascendant too early" in reason or "Ascendant too late" in reason:
-                    asc_penalty = getattr(config.radicality, "asc_warning_penalty", 15)
-                    if getattr(config.radicality, "gating", False):
-                        return {
-                            "result": "NO",
-                            "confidence": max(confidence - asc_penalty, 0),
-                            "reasoning": reasoning,
-                            "timing": None,
-                        }
-                else:
-                    if getattr(config.radicality, "gating", False):
-                        return {
-                            "result": "NO",
-                            "confidence": min(confidence, config.confidence.lunar_confidence_caps.neutral),
-                            "reasoning": reasoning,
-                            "timing": None,
-                        }
-                    confidence = min(confidence, config.confidence.lunar_confidence_caps.neutral)
-            else:
-                reasoning.append(f"Radicality: {radicality['reason']}")
-        else:
+        """Enhanced judgment with configuration system, run as the staged rule pipeline"""
+        config = chart_config(chart)
+        state = JudgmentState(
+            chart=chart,
+            question_analysis=question_analysis,
+            config=config,
+            confidence=config.confidence.base_confidence,
+            ignore_radicality=ignore_radicality,
+            ignore_void_moon=ignore_void_moon,
+            ignore_combustion=ignore_combustion,
+            ignore_saturn_7th=ignore_saturn_7th,
+            exaltation_confidence_boost=exaltation_confidence_boost,
+        )
+        return JUDGMENT_PIPELINE.run(self, state)
+    
+    # Judgment facts: computed on first use by the stages that read them
+    
+    def _fact_significators(self, state: JudgmentState) -> Dict[str, Any]:
+        return self._identify_significators(state.chart, state.question_analysis)
+    
+    def _fact_solar_factors(self, state: JudgmentState) -> Dict[str, Any]:
+        return self._analyze_enhanced_solar_factors(
+            state.chart, state.querent, state.quesited, state.ignore_combustion)
+    
+    def _fact_perfection(self, state: JudgmentState) -> Dict[str, Any]:
+        return self._check_enhanced_perfection(
+            state.chart, state.primary, state.secondary, state.exaltation_confidence_boost)
+    
+    def _fact_moon_next_aspect(self, state: JudgmentState) -> Dict[str, Any]:
+        return self._check_moon_next_aspect_to_significators(
+            state.chart, state.querent, state.quesited, state.ignore_void_moon)
+    
+    def _fact_moon_testimony(self, state: JudgmentState) -> Dict[str, Any]:
+        return self._check_enhanced_moon_testimony(
+            state.chart, state.querent, state.quesited, state.ignore_void_moon)
+    
+    def _fact_benefic_support(self, state: JudgmentState) -> Dict[str, Any]:
+        return self._check_benefic_aspects_to_significators(state.chart, state.querent, state.quesited)
+    
+    # Judgment stages, in precedence order (see JUDGMENT_PIPELINE)
+    
+    def _stage_radicality(self, state: JudgmentState) -> Optional[Dict[str, Any]]:
+        """1. Enhanced radicality with configuration"""
+        config = state.config
+        reasoning = state.reasoning
+        
+        if state.ignore_radicality:
             reasoning.append("Radicality: Bypassed by override (chart validity check disabled)")
-
-        # 1.5. Void-of-Course Moon caution (no early return)
-        if not ignore_void_moon:
-            void_check = self._is_moon_void_of_course_enhanced(chart)
-            if void_check["void"]:
-                if void_check.get("exception"):
-                    reasoning.append(f"Void Moon noted but excepted: {void_check['reason']}")
-                else:
-                    override_check = TraditionalOverrides.check_void_moon_overrides(chart, question_analysis, self)
-                    if override_check.get("can_override"):
-                        reasoning.append(f"Void Moon noted but overridden: {override_check['reason']}")
-                    else:
-                        reasoning.append(f"Void Moon: {void_check['reason']}")
-                void_penalty = getattr(config.moon, "void_penalty", 10)
-                if getattr(config.moon, "void_gating", False):
-                    return {
-                        "result": "NO",
-                        "confidence": max(confidence - void_penalty, 0),
-                        "reasoning": reasoning,
-                        "timing": None,
-                    }
+            return None
+        
+        radicality = check_enhanced_radicality(state.chart, state.ignore_saturn_7th)
+        reasoning.append(f"Radicality: {radicality['reason']}")
+        if radicality["valid"]:
+            return None
+        
+        reason = radicality["reason"]
+        # Early or late Ascendant only gives a modest penalty
+        if "Ascendant too early" in reason or "Ascendant too late" in reason:
+            state.asc_penalty = config.radicality.asc_warning_penalty
+            if config.radicality.gating:
+                return {
+                    "result": "NO",
+                    "confidence": max(state.confidence - state.asc_penalty, 0),
+                    "reasoning": reasoning,
+                    "timing": None,
+                }
+        else:
+            if config.radicality.gating:
+                return {
+                    "result": "NO",
+                    "confidence": min(state.confidence, config.confidence.lunar_confidence_caps.neutral),
+                    "reasoning": reasoning,
+                    "timing": None,
+                }
+            state.confidence = min(state.confidence, config.confidence.lunar_confidence_caps.neutral)
+        return None
+    
+    def _stage_void_moon(self, state: JudgmentState) -> Optional[Dict[str, Any]]:
+        """1.5. Void-of-Course Moon caution (gating only when configured)"""
+        config = state.config
+        reasoning = state.reasoning
         
-        # 2. Identify significators
-        significators = self._identify_significators(chart, question_analysis)
+        void_check = self._is_moon_void_of_course_enhanced(state.chart)
+        if not void_check["void"]:
+            return None
+        
+        if void_check.get("exception"):
+            reasoning.append(f"Void Moon noted but excepted: {void_check['reason']}")
+        else:
+            override_check = TraditionalOverrides.check_void_moon_overrides(
+                state.chart, state.question_analysis, self)
+            if override_check.get("can_override"):
+                reasoning.append(f"Void Moon noted but overridden: {override_check['reason']}")
+            else:
+                reasoning.append(f"Void Moon: {void_check['reason']}")
+        state.void_penalty = config.moon.void_penalty
+        if config.moon.void_gating:
+            return {
+                "result": "NO",
+                "confidence": max(state.confidence - state.void_penalty, 0),
+                "reasoning": reasoning,
+                "timing": None,
+            }
+        return None
+    
+    def _stage_significators(self, state: JudgmentState) -> Optional[Dict[str, Any]]:
+        """2. Identify significators"""
+        significators = state.fact("significators")
         if not significators["valid"]:
             return {
                 "result": "CANNOT JUDGE",
                 "confidence": 0,
-                "reasoning": reasoning + [significators["reason"]],
+                "reasoning": state.reasoning + [significators["reason"]],
                 "timing": None
             }
         
-        reasoning.append(f"Significators: {significators['description']}")
-        
-        querent_planet = significators["querent"]
-        quesited_planet = significators["quesited"]
-        
-        
-        # Enhanced same-ruler analysis (Fix 2 & 5)
-        same_ruler_bonus = 0
-        if significators.get("same_ruler_analysis"):
-            same_ruler_info = significators["same_ruler_analysis"]
-            reasoning.append(f"Unity factor: {same_ruler_info['interpretation']}")
-            
-            # Traditional horary: same ruler = favorable disposition
-            same_ruler_bonus = 10  # Moderate bonus for unity of purpose
-            
-            # However, must analyze the shared planet's condition more carefully
-            shared_planet = same_ruler_info["shared_ruler"]
-            shared_position = chart.planets[shared_planet]
-            
-            if shared_position.dignity_score > 0:
-                same_ruler_bonus += 5  # Well-dignified shared ruler is very favorable
-                reasoning.append(f"Shared significator {shared_planet.value} is well-dignified (+{shared_position.dignity_score})")
-            elif shared_position.dignity_score < -10:
-                same_ruler_bonus -= 10  # Severely debilitated shared ruler reduces unity benefit
-                reasoning.append(f"Shared significator {shared_planet.value} is severely debilitated ({shared_position.dignity_score})")
-            
-            confidence += same_ruler_bonus
-        
-        # Enhanced solar condition analysis
-        solar_factors = self._analyze_enhanced_solar_factors(
-            chart, querent_planet, quesited_planet, ignore_combustion)
-        
-        if solar_factors["significant"]:
-            # Don't add generic solar conditions message - will be added below with context
-            solar_config = getattr(config, "solar", None)
-            r17b_enabled = getattr(solar_config, "severe_impediment_denial_enabled", False) if solar_config else False
-
-            # ENHANCED: Adjust confidence based on solar conditions affecting SIGNIFICATORS
-            if solar_factors["cazimi_count"] > 0:
-                confidence += config.confidence.solar.cazimi_bonus
-                reasoning.append("Cazimi planets significantly strengthen the judgment")
-            elif (solar_factors["combustion_count"] > 0 or solar_factors["under_beams_count"] > 0) and not ignore_combustion:
-                penalty_reasons = []
-                solar_penalty = 0
-                severe_impediments = 0
-
-                for planet in [querent_planet, quesited_planet]:
-                    planet_analysis = solar_factors["detailed_analyses"].get(planet.value, {})
-                    condition = planet_analysis.get("condition")
-                    if condition not in ["Combustion", "Under the Beams"]:
-                        continue
+        state.reasoning.append(f"Significators: {significators['description']}")
+        state.querent = significators["querent"]
+        state.quesited = significators["quesited"]
+        return None
+    
+    def _stage_same_ruler_bonus(self, state: JudgmentState) -> None:
+        """Enhanced same-ruler analysis (Fix 2 & 5)"""
+        reasoning = state.reasoning
+        same_ruler_info = state.fact("significators")["same_ruler_analysis"]
+        reasoning.append(f"Unity factor: {same_ruler_info['interpretation']}")
+        
+        # Traditional horary: same ruler = favorable disposition
+        same_ruler_bonus = 10  # Moderate bonus for unity of purpose
+        
+        # However, must analyze the shared planet's condition more carefully
+        shared_planet = same_ruler_info["shared_ruler"]
+        shared_position = state.chart.planets[shared_planet]
+        
+        if shared_position.dignity_score > 0:
+            same_ruler_bonus += 5  # Well-dignified shared ruler is very favorable
+            reasoning.append(f"Shared significator {shared_planet.value} is well-dignified (+{shared_position.dignity_score})")
+        elif shared_position.dignity_score < -10:
+            same_ruler_bonus -= 10  # Severely debilitated shared ruler reduces unity benefit
+            reasoning.append(f"Shared significator {shared_planet.value} is severely debilitated ({shared_position.dignity_score})")
+        
+        state.confidence += same_ruler_bonus
+    
+    def _stage_solar(self, state: JudgmentState) -> Optional[Dict[str, Any]]:
+        """Enhanced solar condition analysis"""
+        config = state.config
+        chart = state.chart
+        reasoning = state.reasoning
+        solar_factors = state.fact("solar_factors")
+        if not solar_factors["significant"]:
+            return None
+        
+        # Don't add generic solar conditions message - will be added below with context
+        r17b_enabled = config.solar.severe_impediment_denial_enabled
 
-                    distance = planet_analysis.get("distance_from_sun", 0)
-                    planet_dignity = chart.planets[planet].dignity_score
-
-                    if condition == "Combustion":
-                        if distance < 1.0:
-                            severe_impediments += 1
-                            solar_penalty += 40
-                            reason = f"{planet.value} (extreme combustion at {distance:.1f}°)"
-                        elif distance < 2.0:
-                            solar_penalty += 25
-                            reason = f"{planet.value} (severe combustion at {distance:.1f}°)"
-                        elif distance < 5.0:
-                            solar_penalty += 15
-                            reason = f"{planet.value} (combustion at {distance:.1f}°)"
-                        else:
-                            solar_penalty += 10
-                            reason = f"{planet.value} (light combustion at {distance:.1f}°)"
+        # ENHANCED: Adjust confidence based on solar conditions affecting SIGNIFICATORS
+        if solar_factors["cazimi_count"] > 0:
+            state.confidence += config.confidence.solar.cazimi_bonus
+            reasoning.append("Cazimi planets significantly strengthen the judgment")
+        elif (solar_factors["combustion_count"] > 0 or solar_factors["under_beams_count"] > 0) and not state.ignore_combustion:
+            penalty_reasons = []
+            solar_penalty = 0
+            severe_impediments = 0
 
-                        if planet_dignity <= -4 and distance < 3.0:
-                            severe_impediments += 1
-                            reason += f" (also severely debilitated: {planet_dignity:+d})"
+            for planet in [state.querent, state.quesited]:
+                planet_analysis = solar_factors["detailed_analyses"].get(planet.value, {})
+                condition = planet_analysis.get("condition")
+                if condition not in ["Combustion", "Under the Beams"]:
+                    continue
 
-                        penalty_reasons.append(reason)
+                distance = planet_analysis.get("distance_from_sun", 0)
+                planet_dignity = chart.planets[planet].dignity_score
 
-                    elif condition == "Under the Beams":
-                        solar_penalty += config.confidence.solar.under_beams_penalty
-                        penalty_reasons.append(f"{planet.value} under beams")
+                if condition == "Combustion":
+                    if distance < 1.0:
+                        severe_impediments += 1
+                        solar_penalty += 40
+                        reason = f"{planet.value} (extreme combustion at {distance:.1f}°)"
+                    elif distance < 2.0:
+                        solar_penalty += 25
+                        reason = f"{planet.value} (severe combustion at {distance:.1f}°)"
+                    elif distance < 5.0:
+                        solar_penalty += 15
+                        reason = f"{planet.value} (combustion at {distance:.1f}°)"
+                    else:
+                        solar_penalty += 10
+                        reason = f"{planet.value} (light combustion at {distance:.1f}°)"
 
-                if r17b_enabled and severe_impediments >= 2:
-                    return {
-                        "result": "NO",
-                        "confidence": 90,
-                        "reasoning": reasoning + [f"Multiple severe solar impediments deny perfection: {', '.join(penalty_reasons)}"],
-                        "timing": None,
-                        "traditional_factors": {
-                            "perfection_type": "impediment_denial",
-                            "impediment_type": "severe_combustion_and_debilitation"
-                        },
-                        "solar_factors": solar_factors,
-                    }
+                    if planet_dignity <= -4 and distance < 3.0:
+                        severe_impediments += 1
+                        reason += f" (also severely debilitated: {planet_dignity:+d})"
 
-                if penalty_reasons:
-                    confidence -= min(solar_penalty, 50)
-                    reasoning.append(f"Solar impediment: {', '.join(penalty_reasons)}")
-                else:
-                    reasoning.append(f"Solar conditions: {solar_factors['summary']} (significators unaffected)")
-        
-        # 3. Enhanced perfection check with transaction support
-        # CRITICAL FIX: Handle transaction questions with natural significators
-        if significators.get("transaction_type") and significators.get("item_significator"):
-            # For transaction questions, check for translation involving natural significator
-            item_significator = significators["item_significator"]
-            item_name = significators.get("item_name", "item")
-            
-            # Check for translation patterns involving the item significator
-            translation_result = self._check_transaction_translation(chart, querent_planet, quesited_planet, item_significator)
-            if translation_result["found"]:
-                result = "YES" if translation_result["favorable"] else "NO"
-                confidence = min(confidence, translation_result["confidence"])
-                
-                # Enhanced color-coded explanation
-                direction_indicator = "Favorable" if translation_result["pattern"] == "item_to_party" else "Mixed"
-                reasoning.append(f"{direction_indicator} Translation Found: {translation_result['reason']}")
-                
-                # Explain why this indicates success/failure
-                if translation_result["pattern"] == "item_to_party":
-                    party = "seller" if "seller" in translation_result["reason"] else "buyer"
-                    reasoning.append(f"Success Pattern: Item's energy flows to {party} - transaction completes")
-                elif translation_result["pattern"] == "party_to_item":
-                    party = "seller" if "seller" in translation_result["reason"] else "buyer"
-                    reasoning.append(f"Mixed Pattern: {party.title()}'s energy flows to item - potential but uncertain")
-                
-                timing = self._calculate_enhanced_timing(chart, translation_result)
-                
+                    penalty_reasons.append(reason)
+
+                elif condition == "Under the Beams":
+                    solar_penalty += config.confidence.solar.under_beams_penalty
+                    penalty_reasons.append(f"{planet.value} under beams")
+
+            if r17b_enabled and severe_impediments >= 2:
                 return {
-                    "result": result,
-                    "confidence": confidence,
-                    "reasoning": reasoning,
-                    "timing": timing,
+                    "result": "NO",
+                    "confidence": 90,
+                    "reasoning": reasoning + [f"Multiple severe solar impediments deny perfection: {', '.join(penalty_reasons)}"],
+                    "timing": None,
                     "traditional_factors": {
-                        "perfection_type": "transaction_translation",
-                        "reception": translation_result.get("reception", "none"),
-                        "querent_strength": chart.planets[querent_planet].dignity_score,
-                        "quesited_strength": chart.planets[quesited_planet].dignity_score,
-                        f"{item_name}_strength": chart.planets[item_significator].dignity_score
+                        "perfection_type": "impediment_denial",
+                        "impediment_type": "severe_combustion_and_debilitation"
                     },
-                    "solar_factors": solar_factors
+                    "solar_factors": solar_factors,
                 }
+
+            if penalty_reasons:
+                state.confidence -= min(solar_penalty, 50)
+                reasoning.append(f"Solar impediment: {', '.join(penalty_reasons)}")
+            else:
+                reasoning.append(f"Solar conditions: {solar_factors['summary']} (significators unaffected)")
+        return None
+    
+    def _stage_transaction_translation(self, state: JudgmentState) -> Optional[Dict[str, Any]]:
+        """3. Transaction questions: translation involving the natural significator of the item"""
+        chart = state.chart
+        reasoning = state.reasoning
+        significators = state.fact("significators")
+        querent_planet, quesited_planet = state.querent, state.quesited
+        item_significator = significators["item_significator"]
+        item_name = significators.get("item_name", "item")
+        
+        # Check for translation patterns involving the item significator
+        translation_result = self._check_transaction_translation(chart, querent_planet, quesited_planet, item_significator)
+        if not translation_result["found"]:
+            return None
+        
+        result = "YES" if translation_result["favorable"] else "NO"
+        state.confidence = min(state.confidence, translation_result["confidence"])
+        
+        # Enhanced color-coded explanation
+        direction_indicator = "Favorable" if translation_result["pattern"] == "item_to_party" else "Mixed"
+        reasoning.append(f"{direction_indicator} Translation Found: {translation_result['reason']}")
+        
+        # Explain why this indicates success/failure
+        if translation_result["pattern"] == "item_to_party":
+            party = "seller" if "seller" in translation_result["reason"] else "buyer"
+            reasoning.append(f"Success Pattern: Item's energy flows to {party} - transaction completes")
+        elif translation_result["pattern"] == "party_to_item":
+            party = "seller" if "seller" in translation_result["reason"] else "buyer"
+            reasoning.append(f"Mixed Pattern: {party.title()}'s energy flows to item - potential but uncertain")
+        
+        timing = self._calculate_enhanced_timing(chart, translation_result)
         
-        # Standard perfection check for non-transaction questions
-        # SPECIAL HANDLING: For 3rd person education questions, check perfection between student and success
-        primary_significator = querent_planet
-        secondary_significator = quesited_planet
+        return {
+            "result": result,
+            "confidence": state.confidence,
+            "reasoning": reasoning,
+            "timing": timing,
+            "traditional_factors": {
+                "perfection_type": "transaction_translation",
+                "reception": translation_result.get("reception", "none"),
+                "querent_strength": chart.planets[querent_planet].dignity_score,
+                "quesited_strength": chart.planets[quesited_planet].dignity_score,
+                f"{item_name}_strength": chart.planets[item_significator].dignity_score
+            },
+            "solar_factors": state.fact("solar_factors")
+        }
+    
+    def _stage_perfection_pair(self, state: JudgmentState) -> None:
+        """Pair whose perfection is judged (student and success for 3rd person education)"""
+        significators = state.fact("significators")
+        state.primary = state.querent
+        state.secondary = state.quesited
         
         if significators.get("third_person_education"):
             # For 3rd person education: analyze student -> success, not teacher -> success
-            primary_significator = significators["student"]
-            secondary_significator = significators["quesited"]  # Success
-            reasoning.append(f"3rd person analysis: Student ({primary_significator.value}) seeking Success ({secondary_significator.value})")
+            state.primary = significators["student"]
+            state.secondary = significators["quesited"]  # Success
+            state.reasoning.append(f"3rd person analysis: Student ({state.primary.value}) seeking Success ({state.secondary.value})")
+    
+    def _stage_prohibition(self, state: JudgmentState) -> Optional[Dict[str, Any]]:
+        """With a direct aspect pending, prohibition denies before the Moon is considered"""
+        if "aspect" not in state.fact("perfection"):
+            return None
+        
+        chart = state.chart
+        prohibition_result = self._check_traditional_prohibition(chart, state.primary, state.secondary)
+        if not prohibition_result.get("found"):
+            return None
+        
+        return {
+            "result": "NO",
+            "confidence": min(state.confidence, prohibition_result["confidence"]),
+            "reasoning": state.reasoning
+            + [f"Prohibition: {prohibition_result['reason']}"],
+            "timing": None,
+            "traditional_factors": {
+                "perfection_type": "prohibition",
+                "prohibiting_planet": prohibition_result["prohibiting_planet"].value,
+                "reception": prohibition_result.get("reception", "none"),
+                "querent_strength": chart.planets[state.querent].dignity_score,
+                "quesited_strength": chart.planets[state.quesited].dignity_score,
+            },
+            "solar_factors": state.fact("solar_factors"),
+        }
+    
+    def _stage_perfection(self, state: JudgmentState) -> Optional[Dict[str, Any]]:
+        """Perfection between the significators decides the judgment"""
+        chart = state.chart
+        reasoning = state.reasoning
+        perfection = state.fact("perfection")
         
-        perfection = self._check_enhanced_perfection(
-            chart, primary_significator, secondary_significator, exaltation_confidence_boost
-        )
-        # If a direct aspect exists, handle prohibition or immediate denial before considering Moon aspects
-        if "aspect" in perfection:
-            prohibition_result = self._check_traditional_prohibition(
-                chart, primary_significator, secondary_significator
-            )
-            if prohibition_result.get("found"):
-                return {
-                    "result": "NO",
-                    "confidence": min(confidence, prohibition_result["confidence"]),
-                    "reasoning": reasoning
-                    + [f"Prohibition: {prohibition_result['reason']}"],
-                    "timing": None,
-                    "traditional_factors": {
-                        "perfection_type": "prohibition",
-                        "prohibiting_planet": prohibition_result["prohibiting_planet"].value,
-                        "reception": prohibition_result.get("reception", "none"),
-                        "querent_strength": chart.planets[querent_planet].dignity_score,
-                        "quesited_strength": chart.planets[quesited_planet].dignity_score,
-                    },
-                    "solar_factors": solar_factors,
-                }
-
         # GENERAL ENHANCEMENT: Check Moon-Sun aspects in education questions (traditional co-significator analysis)
-        if not perfection["perfects"] and question_analysis.get("question_type") == "education":
+        if not perfection["perfects"] and state.question_analysis.get("question_type") == "education":
             moon_sun_perfection = self._check_moon_sun_education_perfection(
-                chart, question_analysis
+                chart, state.question_analysis
             )
             if moon_sun_perfection["perfects"]:
                 perfection = moon_sun_perfection
@@ -1333,165 +1706,172 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     f"Moon-Sun education perfection: {moon_sun_perfection['reason']}"
                 )
 
-        if perfection["perfects"]:
-            result = "YES" if perfection["favorable"] else "NO"
-            confidence = min(confidence, perfection["confidence"])
+        if not perfection["perfects"]:
+            return None
+        
+        querent_planet, quesited_planet = state.querent, state.quesited
+        result = "YES" if perfection["favorable"] else "NO"
+        confidence = min(state.confidence, perfection["confidence"])
 
-            # CRITICAL FIX 1: Apply separating aspect penalty
-            confidence = self._apply_aspect_direction_adjustment(
-                confidence, perfection, reasoning
-            )
+        # CRITICAL FIX 1: Apply separating aspect penalty
+        confidence = self._apply_aspect_direction_adjustment(
+            confidence, perfection, reasoning
+        )
 
-            # CRITICAL FIX 2: Apply retrograde quesited penalty early so bonuses can offset it
-            confidence = self._apply_retrograde_quesited_penalty(
-                confidence, chart, quesited_planet, reasoning
-            )
+        # CRITICAL FIX 2: Apply retrograde quesited penalty early so bonuses can offset it
+        confidence = self._apply_retrograde_quesited_penalty(
+            confidence, chart, quesited_planet, reasoning
+        )
 
-            # CRITICAL FIX 3: Apply dignity-based confidence adjustment (can mitigate retrograde)
-            confidence = self._apply_dignity_confidence_adjustment(
-                confidence, chart, querent_planet, quesited_planet, reasoning
-            )
+        # CRITICAL FIX 3: Apply dignity-based confidence adjustment (can mitigate retrograde)
+        confidence = self._apply_dignity_confidence_adjustment(
+            confidence, chart, querent_planet, quesited_planet, reasoning
+        )
 
-            # Clear step-by-step traditional reasoning
-            if perfection["type"] == "direct_penalized":
-                reasoning.append(f"Direct aspect penalized: {perfection['reason']}")
-            elif perfection["favorable"]:
-                reasoning.append(f"Perfection found: {perfection['reason']}")
-            else:
-                reasoning.append(f"❌ Negative perfection: {perfection['reason']}")
+        # Clear step-by-step traditional reasoning
+        if perfection["type"] == "direct_penalized":
+            reasoning.append(f"Direct aspect penalized: {perfection['reason']}")
+        elif perfection["favorable"]:
+            reasoning.append(f"Perfection found: {perfection['reason']}")
+        else:
+            reasoning.append(f"❌ Negative perfection: {perfection['reason']}")
 
-            # Apply consideration penalties (R1, R26) after perfection
-            confidence = max(confidence - asc_penalty - void_penalty, 0)
+        # Apply consideration penalties (R1, R26) after perfection
+        confidence = max(confidence - state.asc_penalty - state.void_penalty, 0)
 
-            # CRITICAL FIX 4: Apply confidence threshold (FIXED - low confidence should be NO/INCONCLUSIVE)
-            result, confidence = self._apply_confidence_threshold(
-                result, confidence, reasoning
-            )
+        # CRITICAL FIX 4: Apply confidence threshold (FIXED - low confidence should be NO/INCONCLUSIVE)
+        result, confidence = self._apply_confidence_threshold(
+            result, confidence, reasoning
+        )
 
-            # Enhanced timing with real Moon speed
-            timing = self._calculate_enhanced_timing(chart, perfection)
+        # Enhanced timing with real Moon speed
+        timing = self._calculate_enhanced_timing(chart, perfection)
 
-            return {
-                "result": result,
-                "confidence": confidence,
-                "reasoning": reasoning,
-                "timing": timing,
-                "traditional_factors": {
-                    "perfection_type": perfection["type"],
-                    "reception": perfection.get("reception", "none"),
-                    "querent_strength": chart.planets[querent_planet].dignity_score,
-                    "quesited_strength": chart.planets[quesited_planet].dignity_score,
-                },
-                "solar_factors": solar_factors,
-            }
+        return {
+            "result": result,
+            "confidence": confidence,
+            "reasoning": reasoning,
+            "timing": timing,
+            "traditional_factors": {
+                "perfection_type": perfection["type"],
+                "reception": perfection.get("reception", "none"),
+                "querent_strength": chart.planets[querent_planet].dignity_score,
+                "quesited_strength": chart.planets[quesited_planet].dignity_score,
+            },
+            "solar_factors": state.fact("solar_factors"),
+        }
+    
+    def _stage_same_ruler_unity(self, state: JudgmentState) -> Dict[str, Any]:
+        """3.5. Traditional Same-Ruler Logic (FIXED: Unity defaults to YES unless explicit prohibition)"""
+        chart = state.chart
+        reasoning = state.reasoning
+        querent_planet, quesited_planet = state.querent, state.quesited
+        solar_factors = state.fact("solar_factors")
+        same_ruler_info = state.fact("significators")["same_ruler_analysis"]
+        shared_planet = same_ruler_info["shared_ruler"]
+        shared_position = chart.planets[shared_planet]
+        
+        # Unity indicates perfection - default to YES
+        result = "YES"
+        base_confidence = 75  # Good confidence for unity
+        timing_description = "Moderate timeframe"
+        
+        # Check for explicit prohibitions that could deny the unity
+        prohibitions = []
+        
+        # Check for severe debilitation that could deny
+        if shared_position.dignity_score <= -10:
+            prohibitions.append("Shared significator severely debilitated")
+        
+        # Check for combustion (if not ignored)
+        if not state.ignore_combustion and any(
+            analysis.condition in ["Combustion", "Under the Beams"] 
+            for analysis in solar_factors.get("detailed_analyses", {}).values() 
+            if analysis["planet"] == shared_planet
+        ):
+            prohibitions.append("Shared significator combust/under beams")
         
-        # 3.5. Traditional Same-Ruler Logic (FIXED: Unity defaults to YES unless explicit prohibition)
-        if significators.get("same_ruler_analysis"):
-            same_ruler_info = significators["same_ruler_analysis"]
-            shared_planet = same_ruler_info["shared_ruler"]
-            shared_position = chart.planets[shared_planet]
-            
-            # Unity indicates perfection - default to YES
-            result = "YES"
-            base_confidence = 75  # Good confidence for unity
-            timing_description = "Moderate timeframe"
-            
-            # Check for explicit prohibitions that could deny the unity
-            prohibitions = []
-            
-            # Check for severe debilitation that could deny
-            if shared_position.dignity_score <= -10:
-                prohibitions.append("Shared significator severely debilitated")
-            
-            # Check for combustion (if not ignored)
-            if not ignore_combustion and any(
-                analysis.condition in ["Combustion", "Under the Beams"] 
-                for analysis in solar_factors.get("detailed_analyses", {}).values() 
-                if analysis["planet"] == shared_planet
-            ):
-                prohibitions.append("Shared significator combust/under beams")
-            
-            # Check for explicit refranation or frustration
-            if shared_position.retrograde and shared_position.dignity_score < -5:
-                prohibitions.append("Shared significator retrograde and weak (refranation)")
-            
-            # If explicit prohibitions exist, deny
-            if prohibitions:
-                result = "NO"
-                base_confidence = 80
-                reasoning.append(f"Same ruler unity denied: {', '.join(prohibitions)}")
+        # Check for explicit refranation or frustration
+        if shared_position.retrograde and shared_position.dignity_score < -5:
+            prohibitions.append("Shared significator retrograde and weak (refranation)")
+        
+        # If explicit prohibitions exist, deny
+        if prohibitions:
+            result = "NO"
+            base_confidence = 80
+            reasoning.append(f"Same ruler unity denied: {', '.join(prohibitions)}")
+        else:
+            # Unity perfected - check for conditions/modifications
+            conditions = []
+            
+            # Retrograde indicates delays/conditions, not denial
+            if shared_position.retrograde:
+                conditions.append("with delays/renegotiation (retrograde)")
+                timing_description = "Delayed/with conditions"
+            
+            # Poor dignity indicates difficulty but not denial
+            if -10 < shared_position.dignity_score < 0:
+                conditions.append("with difficulty")
+            
+            if conditions:
+                result = "YES"
+                reasoning.append(f"Same ruler unity perfected {' '.join(conditions)}")
             else:
-                # Unity perfected - check for conditions/modifications
-                conditions = []
-                
-                # Retrograde indicates delays/conditions, not denial
-                if shared_position.retrograde:
-                    conditions.append("with delays/renegotiation (retrograde)")
-                    timing_description = "Delayed/with conditions"
-                
-                # Poor dignity indicates difficulty but not denial
-                if -10 < shared_position.dignity_score < 0:
-                    conditions.append("with difficulty")
+                reasoning.append("Same ruler unity indicates direct perfection")
+        
+        # Reception bonus
+        reception = self._detect_reception_between_planets(chart, querent_planet, quesited_planet)
+        if reception != "none":
+            base_confidence = min(90, base_confidence + 3)
+            reasoning.append(f"Reception supports perfection: {reception}")
+        
+        # FIXED: Check Moon's dual roles (house ruler vs co-significator)
+        moon_house_roles = []
+        for house_num, ruler in chart.house_rulers.items():
+            if ruler == Planet.MOON:
+                moon_house_roles.append(house_num)
+        
+        if moon_house_roles:
+            relevant_moon_roles = []
+            for house in moon_house_roles:
+                if house in [1, 2, 7, 8, 10, 11]:  # Houses potentially relevant to financial/approval questions
+                    relevant_moon_roles.append(house)
+            
+            if relevant_moon_roles:
+                # Moon as house ruler should be analyzed separately from general testimony
+                moon_as_ruler_condition = chart.planets[Planet.MOON]
                 
-                if conditions:
-                    result = "YES"
-                    reasoning.append(f"Same ruler unity perfected {' '.join(conditions)}")
-                else:
-                    reasoning.append("Same ruler unity indicates direct perfection")
-            
-            # Reception bonus
-            reception = self._detect_reception_between_planets(chart, querent_planet, quesited_planet)
-            if reception != "none":
-                base_confidence = min(90, base_confidence + 3)
-                reasoning.append(f"Reception supports perfection: {reception}")
-            
-            # FIXED: Check Moon's dual roles (house ruler vs co-significator)
-            moon_house_roles = []
-            for house_num, ruler in chart.house_rulers.items():
-                if ruler == Planet.MOON:
-                    moon_house_roles.append(house_num)
-            
-            if moon_house_roles:
-                relevant_moon_roles = []
-                for house in moon_house_roles:
-                    if house in [1, 2, 7, 8, 10, 11]:  # Houses potentially relevant to financial/approval questions
-                        relevant_moon_roles.append(house)
+                if moon_as_ruler_condition.dignity_score >= 0:
+                    base_confidence = min(88, base_confidence + 3)
+                    reasoning.append(f"Moon as L{',L'.join(map(str, relevant_moon_roles))} well-positioned supports perfection")
+                elif moon_as_ruler_condition.dignity_score < -5:
+                    base_confidence = max(65, base_confidence - 5)
+                    reasoning.append(f"Moon as L{',L'.join(map(str, relevant_moon_roles))} poorly positioned creates uncertainty")
                 
-                if relevant_moon_roles:
-                    # Moon as house ruler should be analyzed separately from general testimony
-                    moon_as_ruler_condition = chart.planets[Planet.MOON]
-                    
-                    if moon_as_ruler_condition.dignity_score >= 0:
-                        base_confidence = min(88, base_confidence + 3)
-                        reasoning.append(f"Moon as L{',L'.join(map(str, relevant_moon_roles))} well-positioned supports perfection")
-                    elif moon_as_ruler_condition.dignity_score < -5:
-                        base_confidence = max(65, base_confidence - 5)
-                        reasoning.append(f"Moon as L{',L'.join(map(str, relevant_moon_roles))} poorly positioned creates uncertainty")
-                    
-                    # For loan applications, L10 (authority) is especially important
-                    if 10 in relevant_moon_roles:
-                        reasoning.append("Moon as L10 (authority/decision-maker) is key to approval process")
-            
-            timing = self._calculate_enhanced_timing(chart, {"type": "same_ruler_unity", "planet": shared_planet})
-            
-            return {
-                "result": result,
-                "confidence": base_confidence,
-                "reasoning": reasoning,
-                "timing": timing,
-                "traditional_factors": {
-                    "perfection_type": "same_ruler_unity",
-                    "reception": self._detect_reception_between_planets(chart, querent_planet, quesited_planet),
-                    "querent_strength": shared_position.dignity_score,
-                    "quesited_strength": shared_position.dignity_score,  # Same ruler = same strength
-                },
-                "solar_factors": solar_factors
-            }
+                # For loan applications, L10 (authority) is especially important
+                if 10 in relevant_moon_roles:
+                    reasoning.append("Moon as L10 (authority/decision-maker) is key to approval process")
         
-        # 3.6. PRIORITY: Moon's next applying aspect to significators (traditional key indicator)
-        moon_next_aspect_result = self._check_moon_next_aspect_to_significators(
-            chart, querent_planet, quesited_planet, ignore_void_moon
-        )
+        timing = self._calculate_enhanced_timing(chart, {"type": "same_ruler_unity", "planet": shared_planet})
+        
+        return {
+            "result": result,
+            "confidence": base_confidence,
+            "reasoning": reasoning,
+            "timing": timing,
+            "traditional_factors": {
+                "perfection_type": "same_ruler_unity",
+                "reception": self._detect_reception_between_planets(chart, querent_planet, quesited_planet),
+                "querent_strength": shared_position.dignity_score,
+                "quesited_strength": shared_position.dignity_score,  # Same ruler = same strength
+            },
+            "solar_factors": solar_factors
+        }
+    
+    def _stage_moon_next_aspect(self, state: JudgmentState) -> None:
+        """3.6. PRIORITY: Moon's next applying aspect to significators (traditional key indicator)"""
+        reasoning = state.reasoning
+        moon_next_aspect_result = state.fact("moon_next_aspect")
         if moon_next_aspect_result.get("result"):
             if moon_next_aspect_result.get("result") == "NO":
                 reasoning.append(
@@ -1501,47 +1881,50 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 reasoning.append(
                     f"Moon's next aspect supports but cannot perfect: {moon_next_aspect_result['reason']}"
                 )
-            confidence = min(
-                confidence, moon_next_aspect_result.get("confidence", confidence)
+            state.confidence = min(
+                state.confidence, moon_next_aspect_result.get("confidence", state.confidence)
             )
 
         if moon_next_aspect_result.get("decisive"):
             reasoning.append("FLAG: MOON_NEXT_DECISIVE")
-        
-        # 3.7. Enhanced Moon testimony analysis when no decisive Moon aspect
-        moon_testimony = self._check_enhanced_moon_testimony(chart, querent_planet, quesited_planet, ignore_void_moon)
-        
-        # 4. Enhanced denial conditions (retrograde now configurable)
-        denial = self._check_enhanced_denial_conditions(chart, querent_planet, quesited_planet)
-        if denial["denied"]:
-            return {
-                "result": "NO",
-                "confidence": min(confidence, denial["confidence"]),
-                "reasoning": reasoning + [f"Denial: {denial['reason']}"],
-                "timing": None,
-                "solar_factors": solar_factors
-            }
-        
-        # 4.5. ENHANCED: Check theft/loss-specific denial factors
-        theft_denials = self._check_theft_loss_specific_denials(chart, question_analysis.get("question_type"), querent_planet, quesited_planet)
-        if theft_denials:
-            combined_theft_denial = "; ".join(theft_denials)
-            return {
-                "result": "NO", 
-                "confidence": 80,  # High confidence for traditional theft denial factors
-                "reasoning": reasoning + [f"Theft/Loss Denial: {combined_theft_denial}"],
-                "timing": None,
-                "solar_factors": solar_factors
-            }
-        
-        # 5. ENHANCED: Check benefic aspects to significators - BUT ONLY as secondary testimony
+    
+    def _stage_denial(self, state: JudgmentState) -> Optional[Dict[str, Any]]:
+        """4. Enhanced denial conditions (retrograde now configurable)"""
+        denial = self._check_enhanced_denial_conditions(state.chart, state.querent, state.quesited)
+        if not denial["denied"]:
+            return None
+        return {
+            "result": "NO",
+            "confidence": min(state.confidence, denial["confidence"]),
+            "reasoning": state.reasoning + [f"Denial: {denial['reason']}"],
+            "timing": None,
+            "solar_factors": state.fact("solar_factors")
+        }
+    
+    def _stage_theft_loss_denial(self, state: JudgmentState) -> Optional[Dict[str, Any]]:
+        """4.5. ENHANCED: Check theft/loss-specific denial factors"""
+        theft_denials = self._check_theft_loss_specific_denials(
+            state.chart, state.question_analysis.get("question_type"), state.querent, state.quesited)
+        if not theft_denials:
+            return None
+        combined_theft_denial = "; ".join(theft_denials)
+        return {
+            "result": "NO", 
+            "confidence": 80,  # High confidence for traditional theft denial factors
+            "reasoning": state.reasoning + [f"Theft/Loss Denial: {combined_theft_denial}"],
+            "timing": None,
+            "solar_factors": state.fact("solar_factors")
+        }
+    
+    def _stage_benefic_support(self, state: JudgmentState) -> None:
+        """5. ENHANCED: Check benefic aspects to significators - BUT ONLY as secondary testimony"""
         # Traditional rule: Benefic support alone cannot override lack of significator perfection
-        benefic_support = self._check_benefic_aspects_to_significators(chart, querent_planet, quesited_planet)
-        benefic_support_overridden = False
+        benefic_support = state.fact("benefic_support")
+        state.notes["benefic_support_overridden"] = False
 
         if benefic_support["favorable"]:
             # ROOT FIX: Add significator weakness assessment to benefic support logic
-            quesited_pos = chart.planets[quesited_planet]
+            quesited_pos = state.chart.planets[state.quesited]
 
             # Check if quesited is severely debilitated
             if quesited_pos.dignity_score <= -4 or quesited_pos.retrograde:
@@ -1552,58 +1935,69 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 if quesited_pos.retrograde:
                     weakness_reasons.append("retrograde")
 
-                reasoning.append(f"Note: {benefic_support['reason']} (insufficient - quesited {', '.join(weakness_reasons)})")
-                benefic_support_overridden = True
+                state.reasoning.append(f"Note: {benefic_support['reason']} (insufficient - quesited {', '.join(weakness_reasons)})")
+                state.notes["benefic_support_overridden"] = True
             else:
                 # Traditional horary: benefic support noted but not decisive
-                reasoning.append(f"Note: {benefic_support['reason']} (secondary testimony)")
-        
-        # 6. PREGNANCY-SPECIFIC: Check for Moon→benefic OR L1↔L5 reception (FIXED: don't auto-deny)
-        if question_analysis.get("question_type") == "pregnancy":
-            # Check for L1↔L5 reception (already fixed)
-            reception = self._detect_reception_between_planets(chart, querent_planet, quesited_planet)
-            has_reception = reception != "none"
-            
-            # Check for Moon→benefic testimony (already fixed in moon testimony)  
-            has_moon_benefic = False
-            if moon_testimony.get("aspects"):
-                for aspect_info in moon_testimony["aspects"]:
-                    if (aspect_info.get("testimony_type") == "moon_to_benefic" and 
-                        aspect_info.get("applying") and aspect_info.get("favorable")):
-                        has_moon_benefic = True
-                        break
-            
-            # Pregnancy exception: Don't auto-deny if reception OR moon→benefic exists
-            if has_reception or has_moon_benefic:
-                reception_reason = f"L1↔L5 reception ({reception})" if has_reception else ""
-                moon_benefic_reason = "Moon applying to benefic" if has_moon_benefic else ""
-                combined_reason = " & ".join(filter(None, [reception_reason, moon_benefic_reason]))
-                
-                reasoning.append(f"Pregnancy: {combined_reason}")
-                
-                # Calculate confidence based on quality of testimony
-                pregnancy_confidence = 70  # Base for pregnancy sufficiency
-                if has_reception:
-                    pregnancy_confidence += 5
-                if has_moon_benefic:
-                    pregnancy_confidence += 5
-                
-                return {
-                    "result": "YES",
-                    "confidence": pregnancy_confidence,
-                    "reasoning": reasoning,
-                    "timing": moon_testimony.get("timing", "Moderate timeframe"),
-                    "traditional_factors": {
-                        "perfection_type": "pregnancy_sufficiency",
-                        "reception": reception,
-                        "querent_strength": chart.planets[querent_planet].dignity_score,
-                        "quesited_strength": chart.planets[quesited_planet].dignity_score,
-                        "moon_benefic": has_moon_benefic
-                    },
-                    "solar_factors": solar_factors
-                }
+                state.reasoning.append(f"Note: {benefic_support['reason']} (secondary testimony)")
+    
+    def _stage_pregnancy(self, state: JudgmentState) -> Optional[Dict[str, Any]]:
+        """6. PREGNANCY-SPECIFIC: Check for Moon→benefic OR L1↔L5 reception (FIXED: don't auto-deny)"""
+        chart = state.chart
+        querent_planet, quesited_planet = state.querent, state.quesited
+        moon_testimony = state.fact("moon_testimony")
+        
+        # Check for L1↔L5 reception (already fixed)
+        reception = self._detect_reception_between_planets(chart, querent_planet, quesited_planet)
+        has_reception = reception != "none"
+        
+        # Check for Moon→benefic testimony (already fixed in moon testimony)  
+        has_moon_benefic = False
+        if moon_testimony.get("aspects"):
+            for aspect_info in moon_testimony["aspects"]:
+                if (aspect_info.get("testimony_type") == "moon_to_benefic" and 
+                    aspect_info.get("applying") and aspect_info.get("favorable")):
+                    has_moon_benefic = True
+                    break
+        
+        # Pregnancy exception: Don't auto-deny if reception OR moon→benefic exists
+        if not (has_reception or has_moon_benefic):
+            return None
         
-        # 7. FALLBACK: Build specific denial reasoning based on actual chart analysis
+        reception_reason = f"L1↔L5 reception ({reception})" if has_reception else ""
+        moon_benefic_reason = "Moon applying to benefic" if has_moon_benefic else ""
+        combined_reason = " & ".join(filter(None, [reception_reason, moon_benefic_reason]))
+        
+        state.reasoning.append(f"Pregnancy: {combined_reason}")
+        
+        # Calculate confidence based on quality of testimony
+        pregnancy_confidence = 70  # Base for pregnancy sufficiency
+        if has_reception:
+            pregnancy_confidence += 5
+        if has_moon_benefic:
+            pregnancy_confidence += 5
+        
+        return {
+            "result": "YES",
+            "confidence": pregnancy_confidence,
+            "reasoning": state.reasoning,
+            "timing": moon_testimony.get("timing", "Moderate timeframe"),
+            "traditional_factors": {
+                "perfection_type": "pregnancy_sufficiency",
+                "reception": reception,
+                "querent_strength": chart.planets[querent_planet].dignity_score,
+                "quesited_strength": chart.planets[quesited_planet].dignity_score,
+                "moon_benefic": has_moon_benefic
+            },
+            "solar_factors": state.fact("solar_factors")
+        }
+    
+    def _stage_fallback_denial(self, state: JudgmentState) -> Dict[str, Any]:
+        """7. FALLBACK: Build specific denial reasoning based on actual chart analysis"""
+        chart = state.chart
+        querent_planet, quesited_planet = state.querent, state.quesited
+        moon_testimony = state.fact("moon_testimony")
+        benefic_support = state.fact("benefic_support")
         denial_reasons = []
         
         # Check what we actually found
@@ -1635,18 +2029,18 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             denial_reasons.append("no benefic aspects to significators")
         
         combined_denial = "; ".join(denial_reasons)
-        reasoning.append(f"Denial: {combined_denial}")
+        state.reasoning.append(f"Denial: {combined_denial}")
         
-        final_confidence = min(confidence, 75)
-        if moon_next_aspect_result.get("result") == "YES" or (
-            benefic_support.get("favorable") and not benefic_support_overridden
+        final_confidence = min(state.confidence, 75)
+        if state.fact("moon_next_aspect").get("result") == "YES" or (
+            benefic_support.get("favorable") and not state.notes["benefic_support_overridden"]
         ):
             final_confidence = min(final_confidence, 60)
 
         return {
             "result": "NO",
             "confidence": final_confidence,
-            "reasoning": reasoning,
+            "reasoning": state.reasoning,
             "timing": None,
             "traditional_factors": {
                 "perfection_type": "none",
@@ -1655,14 +2049,13 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "reception": self._detect_reception_between_planets(chart, querent_planet, quesited_planet),
                 "benefic_noted": benefic_support.get("total_score", 0) > 0
             },
-            "solar_factors": solar_factors
+            "solar_factors": state.fact("solar_factors")
         }
     
-    
     def _check_enhanced_denial_conditions(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
         """Enhanced denial conditions with configurable retrograde handling"""
         
-        config = cfg()
+        config = chart_config(chart)
         
         # Traditional Prohibition - any planet can prohibit by aspecting a significator first
         prohibition_result = self._check_traditional_prohibition(chart, querent, quesited)
@@ -1696,7 +2089,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     def _check_enhanced_denial_conditions(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
         """Enhanced denial conditions with configurable retrograde handling"""
         
-        config = cfg()
+        config = chart_config(chart)
         
         # Traditional Prohibition - any planet can prohibit by aspecting a significator first
         prohibition_result = self._check_traditional_prohibition(chart, querent, quesited)
@@ -1823,11 +2216,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                                          quesited: Planet, reasoning: List[str]) -> float:
         """CRITICAL FIX 2: Apply penalty for retrograde quesited"""
 
-        config = cfg()
+        config = chart_config(chart)
         quesited_pos = chart.planets[quesited]
         if quesited_pos.retrograde:
             # Retrograde quesited = turning away, obstacles, delays
-            penalty = getattr(config.retrograde, "quesited_penalty", 12)
+            penalty = config.retrograde.quesited_penalty
             confidence = max(confidence - penalty, 10)
             reasoning.append(f"Retrograde quesited: -{penalty}% (turning away from success)")
 
@@ -1836,7 +2229,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     def _check_enhanced_translation_of_light(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
         """Traditional translation of light with comprehensive validation requirements"""
         
-        config = cfg()
+        config = chart_config(chart)
         
         # Check all planets as potential translators (traditionally Moon, but allow all)
         for planet, pos in chart.planets.items():
@@ -1858,20 +2251,15 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     continue
             
             # TRADITIONAL REQUIREMENT 2: Find valid aspects between translator and significators with orb validation
-            querent_aspect = None
-            quesited_aspect = None
+            aspect_index = chart_aspect_index(chart)
+            querent_aspect = aspect_index.between(planet, querent)
+            quesited_aspect = aspect_index.between(planet, quesited) if quesited != querent else None
             
-            for aspect in chart.aspects:
-                # Check orb limits using moiety-based calculation
-                if not self._is_aspect_within_orb_limits(chart, aspect):
-                    continue  # Skip aspects that exceed proper orb limits
-                
-                if ((aspect.planet1 == planet and aspect.planet2 == querent) or
-                    (aspect.planet1 == querent and aspect.planet2 == planet)):
-                    querent_aspect = aspect
-                elif ((aspect.planet1 == planet and aspect.planet2 == quesited) or
-                      (aspect.planet1 == quesited and aspect.planet2 == planet)):
-                    quesited_aspect = aspect
+            # Check orb limits using moiety-based calculation
+            if querent_aspect and not self._is_aspect_within_orb_limits(chart, querent_aspect):
+                querent_aspect = None  # Exceeds proper orb limits
+            if quesited_aspect and not self._is_aspect_within_orb_limits(chart, quesited_aspect):
+                quesited_aspect = None
             
             # TRADITIONAL REQUIREMENT 2: Must have aspects to both significators
             if not (querent_aspect and quesited_aspect):
@@ -2003,15 +2391,14 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             
             # Find aspects involving the translator
             translator_aspects = []
-            for aspect in chart.aspects:
-                if aspect.planet1 == translator_planet or aspect.planet2 == translator_planet:
-                    other_planet = aspect.planet2 if aspect.planet1 == translator_planet else aspect.planet1
-                    translator_aspects.append({
-                        "other": other_planet,
-                        "aspect": aspect,
-                        "applying": aspect.applying,
-                        "degrees_to_exact": aspect.degrees_to_exact
-                    })
+            for aspect in chart_aspect_index(chart).involving(translator_planet):
+                other_planet = aspect.planet2 if aspect.planet1 == translator_planet else aspect.planet1
+                translator_aspects.append({
+                    "other": other_planet,
+                    "aspect": aspect,
+                    "applying": aspect.applying,
+                    "degrees_to_exact": aspect.degrees_to_exact
+                })
             
             # Check for transaction translation patterns:
             # Pattern 1: Translator separates from item, applies to seller/buyer
@@ -2063,7 +2450,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         """Enhanced Moon testimony with configurable void-of-course methods"""
         
         moon_pos = chart.planets[Planet.MOON]
-        config = cfg()
+        config = chart_config(chart)
         
         # ENHANCED: Check if Moon is void of course - now cautionary, not absolute blocker
         void_of_course = False
@@ -2095,67 +2482,66 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 break
         
         # Check all current Moon aspects
-        for aspect in chart.aspects:
-            if Planet.MOON in [aspect.planet1, aspect.planet2]:
-                other_planet = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
+        for aspect in chart_aspect_index(chart).involving(Planet.MOON):
+            other_planet = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
+            
+            # Check if this is a significator aspect
+            if other_planet in [querent, quesited]:
+                # Determine which house this planet rules
+                house_role = ""
+                if other_planet == querent:
+                    house_role = "querent (L1)"
+                elif other_planet == quesited:
+                    # Find which house this quesited planet rules
+                    for house, ruler in chart.house_rulers.items():
+                        if ruler == other_planet:
+                            house_role = f"L{house}"
+                            break
+                    if not house_role:
+                        house_role = "quesited"
                 
-                # Check if this is a significator aspect
-                if other_planet in [querent, quesited]:
-                    # Determine which house this planet rules
-                    house_role = ""
-                    if other_planet == querent:
-                        house_role = "querent (L1)"
-                    elif other_planet == quesited:
-                        # Find which house this quesited planet rules
-                        for house, ruler in chart.house_rulers.items():
-                            if ruler == other_planet:
-                                house_role = f"L{house}"
-                                break
-                        if not house_role:
-                            house_role = "quesited"
-                    
-                    favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
-                    aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.value, other_planet.value, aspect.applying)
-                    
-                    moon_significator_aspects.append({
-                        "planet": other_planet,
-                        "aspect": aspect.aspect,
-                        "applying": aspect.applying,
-                        "favorable": favorable,
-                        "house_role": house_role,
-                        "description": f"{aspect_desc} ({house_role})",
-                        "testimony_type": "significator"
-                    })
+                favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
+                aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.value, other_planet.value, aspect.applying)
                 
-                # ADDED: Check Moon-to-benefic testimony (FIXED: missing benefic support detection)
-                elif other_planet in [Planet.JUPITER, Planet.VENUS, Planet.SUN]:
-                    favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
-                    aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.value, other_planet.value, aspect.applying)
-                    
-                    moon_significator_aspects.append({
-                        "planet": other_planet,
-                        "aspect": aspect.aspect,
-                        "applying": aspect.applying,
-                        "favorable": favorable,
-                        "house_role": f"benefic in {chart.planets[other_planet].house}th house",
-                        "description": f"{aspect_desc} (Moon to benefic {other_planet.value})",
-                        "testimony_type": "moon_to_benefic"
-                    })
+                moon_significator_aspects.append({
+                    "planet": other_planet,
+                    "aspect": aspect.aspect,
+                    "applying": aspect.applying,
+                    "favorable": favorable,
+                    "house_role": house_role,
+                    "description": f"{aspect_desc} ({house_role})",
+                    "testimony_type": "significator"
+                })
+            
+            # ADDED: Check Moon-to-benefic testimony (FIXED: missing benefic support detection)
+            elif other_planet in [Planet.JUPITER, Planet.VENUS, Planet.SUN]:
+                favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
+                aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.value, other_planet.value, aspect.applying)
                 
-                # ADDED: Check planets-in-house testimony (Moon to planet located in quesited house)
-                elif quesited_house_number and chart.planets[other_planet].house == quesited_house_number:
-                    favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
-                    aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.value, other_planet.value, aspect.applying)
-                    
-                    moon_significator_aspects.append({
-                        "planet": other_planet,
-                        "aspect": aspect.aspect,
-                        "applying": aspect.applying,
-                        "favorable": favorable,
-                        "house_role": f"planet in {quesited_house_number}th house",
-                        "description": f"{aspect_desc} (planet in {quesited_house_number}th house)",
-                        "testimony_type": "planet_in_house"
-                    })
+                moon_significator_aspects.append({
+                    "planet": other_planet,
+                    "aspect": aspect.aspect,
+                    "applying": aspect.applying,
+                    "favorable": favorable,
+                    "house_role": f"benefic in {chart.planets[other_planet].house}th house",
+                    "description": f"{aspect_desc} (Moon to benefic {other_planet.value})",
+                    "testimony_type": "moon_to_benefic"
+                })
+            
+            # ADDED: Check planets-in-house testimony (Moon to planet located in quesited house)
+            elif quesited_house_number and chart.planets[other_planet].house == quesited_house_number:
+                favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
+                aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.value, other_planet.value, aspect.applying)
+                
+                moon_significator_aspects.append({
+                    "planet": other_planet,
+                    "aspect": aspect.aspect,
+                    "applying": aspect.applying,
+                    "favorable": favorable,
+                    "house_role": f"planet in {quesited_house_number}th house",
+                    "description": f"{aspect_desc} (planet in {quesited_house_number}th house)",
+                    "testimony_type": "planet_in_house"
+                })
         
         # If Moon has significant aspects to significators, prioritize this
         if moon_significator_aspects:
@@ -2163,24 +2549,24 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             
             if applying_aspects:
                 # FIXED: Sort by proximity to perfection (earliest first)
-                # Find the degrees to exact for each aspect
+                # Find when each aspect perfects on the lunar timeline
+                moon_speed = self.calculator.get_real_moon_speed(chart.julian_day)
                 applying_with_degrees = []
                 for aspect_data in applying_aspects:
-                    # Find corresponding aspect in chart.aspects to get degrees_to_exact
-                    for chart_aspect in chart.aspects:
-                        if (Planet.MOON in [chart_aspect.planet1, chart_aspect.planet2] and
-                            aspect_data["planet"] in [chart_aspect.planet1, chart_aspect.planet2] and
-                            chart_aspect.aspect == aspect_data["aspect"] and
-                            chart_aspect.applying == aspect_data["applying"]):
-                            
-                            applying_with_degrees.append({
-                                **aspect_data,
-                                "degrees_to_exact": chart_aspect.degrees_to_exact
-                            })
-                            break
+                    # Find corresponding chart aspect to get degrees_to_exact
+                    chart_aspect = chart_aspect_index(chart).between(
+                        Planet.MOON, aspect_data["planet"], aspect_data["applying"])
+                    if chart_aspect is not None and chart_aspect.aspect == aspect_data["aspect"]:
+                        applying_with_degrees.append({
+                            **aspect_data,
+                            "degrees_to_exact": chart_aspect.degrees_to_exact,
+                            "days_to_perfect": self._moon_days_to_perfect(
+                                chart, aspect_data["planet"], chart_aspect.aspect,
+                                chart_aspect.degrees_to_exact, moon_speed)
+                        })
                 
-                # Sort by degrees to exact (earliest perfection first)
-                applying_with_degrees.sort(key=lambda x: x.get("degrees_to_exact", 999))
+                # Sort by time to exact (earliest perfection first)
+                applying_with_degrees.sort(key=lambda x: x.get("days_to_perfect", 999))
                 primary_aspect = applying_with_degrees[0]  # Earliest perfection
                 favorable = primary_aspect["favorable"]
                 
@@ -2197,7 +2583,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     "unfavorable": not favorable,
                     "reason": reason,
                     "supportive": True,  # Marks this as significant Moon testimony
-                    "timing": "Within days" if applying_aspects else "Variable",
+                    "timing": self._format_timing_description_enhanced(primary_aspect["days_to_perfect"]),
                     "void_of_course": void_of_course,
                     "aspects": moon_significator_aspects,
                     "confidence": base_confidence
@@ -2331,26 +2717,24 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             for significator in significators:
                 sig_pos = chart.planets[significator]
                 
-                # Find aspects between benefic and significator
-                for aspect in chart.aspects:
-                    if ((aspect.planet1 == benefic and aspect.planet2 == significator) or
-                        (aspect.planet1 == significator and aspect.planet2 == benefic)):
-                        
-                        # Calculate benefic strength
-                        aspect_strength = self._calculate_benefic_aspect_strength(
-                            benefic, significator, aspect, chart)
-                        
-                        if aspect_strength > 0:
-                            benefic_aspects.append({
-                                "benefic": benefic.value,
-                                "significator": significator.value, 
-                                "aspect": aspect.aspect.value,
-                                "applying": aspect.applying,
-                                "degrees": aspect.degrees_to_exact,
-                                "strength": aspect_strength,
-                                "house_position": benefic_pos.house
-                            })
-                            total_score += aspect_strength
+                # Find the aspect between benefic and significator
+                aspect = chart_aspect_index(chart).between(benefic, significator)
+                if aspect is not None:
+                    # Calculate benefic strength
+                    aspect_strength = self._calculate_benefic_aspect_strength(
+                        benefic, significator, aspect, chart)
+                    
+                    if aspect_strength > 0:
+                        benefic_aspects.append({
+                            "benefic": benefic.value,
+                            "significator": significator.value, 
+                            "aspect": aspect.aspect.value,
+                            "applying": aspect.applying,
+                            "degrees": aspect.degrees_to_exact,
+                            "strength": aspect_strength,
+                            "house_position": benefic_pos.house
+                        })
+                        total_score += aspect_strength
         
         if benefic_aspects:
             # Determine result based on total score
@@ -2435,11 +2819,12 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             
         return max(0, base_strength)
     
+    @memoize_on_chart("void_of_course")
     def _is_moon_void_of_course_enhanced(self, chart: HoraryChart) -> Dict[str, Any]:
         """Enhanced void of course check with configurable methods"""
         
         moon_pos = chart.planets[Planet.MOON]
-        config = cfg()
+        config = chart_config(chart)
         void_rule = config.moon.void_rule
         
         if void_rule == "by_sign":
@@ -2456,7 +2841,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         """Traditional void-of-course by sign boundary method"""
         
         moon_pos = chart.planets[Planet.MOON]
-        config = cfg()
+        config = chart_config(chart)
         
         # Calculate degrees left in current sign
         moon_degree_in_sign = moon_pos.longitude % 30
@@ -2470,30 +2855,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "degrees_left_in_sign": degrees_left_in_sign
             }
         
-        # Find future aspects in current sign
-        future_aspects = []
-        
-        for planet, planet_pos in chart.planets.items():
-            if planet == Planet.MOON:
-                continue
-            
-            for aspect_type in Aspect:
-                target_moon_positions = self._calculate_aspect_positions(
-                    planet_pos.longitude, aspect_type, moon_pos.sign)
-                
-                for target_position in target_moon_positions:
-                    target_degree_in_sign = target_position % 30
-                    
-                    if target_degree_in_sign > moon_degree_in_sign:
-                        degrees_to_target = target_degree_in_sign - moon_degree_in_sign
-                        
-                        if degrees_to_target < degrees_left_in_sign:
-                            future_aspects.append({
-                                "planet": planet,
-                                "aspect": aspect_type,
-                                "target_degree": target_degree_in_sign,
-                                "degrees_to_reach": degrees_to_target
-                            })
+        # Aspects the Moon perfects before it leaves its sign, with both
+        # bodies moving (soonest first)
+        future_aspects = self._lunar_timeline(chart).remaining_in_sign()
         
         # Traditional exceptions
         void_exceptions = config.moon.void_exceptions
@@ -2512,8 +2876,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         if is_void:
             reason = f"Moon makes no more aspects before leaving {moon_pos.sign.sign_name}"
         else:
-            next_aspect = min(future_aspects, key=lambda x: x["degrees_to_reach"])
-            reason = f"Moon will {next_aspect['aspect'].display_name.lower()} {next_aspect['planet'].value} at {next_aspect['target_degree']:.1f}° {moon_pos.sign.sign_name}"
+            next_aspect = future_aspects[0]
+            reason = f"Moon will {next_aspect.aspect.display_name.lower()} {next_aspect.planet.value} at {next_aspect.moon_longitude % 30:.1f}° {moon_pos.sign.sign_name}"
         
         if exceptions:
             if moon_pos.sign == Sign.CANCER:
@@ -2534,7 +2898,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         """Void-of-course by orb method"""
         
         moon_pos = chart.planets[Planet.MOON]
-        config = cfg()
+        config = chart_config(chart)
         void_orb = config.orbs.void_orb_deg
         
         # Check if Moon is within orb of any aspect
@@ -2581,29 +2945,25 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         return void_result
     
-    def _calculate_aspect_positions(self, planet_longitude: float, aspect: Aspect, moon_sign: Sign) -> List[float]:
-        """Calculate aspect positions (preserved from original)"""
-        positions = []
-        
-        aspect_positions = [
-            (planet_longitude + aspect.degrees) % 360,
-            (planet_longitude - aspect.degrees) % 360
-        ]
-        
-        sign_start = moon_sign.start_degree
-        sign_end = (sign_start + 30) % 360
-        
-        for pos in aspect_positions:
-            pos_normalized = pos % 360
-            
-            if sign_start < sign_end:
-                if sign_start <= pos_normalized < sign_end:
-                    positions.append(pos_normalized)
-            else:  
-                if pos_normalized >= sign_start or pos_normalized < sign_end:
-                    positions.append(pos_normalized)
-        
-        return positions
+    def _lunar_timeline(self, chart: HoraryChart) -> LunarTimeline:
+        """The Moon's solved ingress, egress and exact aspects around the chart"""
+        return chart_lunar_timeline(chart, self.calculator.planets_swe,
+                                    self.calculator.ephemeris.calc_ut)
+    
+    @memoize_on_chart("event_timeline")
+    def _event_timeline(self, chart: HoraryChart) -> EventTimeline:
+        """Perfections, stations and ingresses over the configured horizon"""
+        horizon_days = chart_config(chart).timing.perfection_horizon_days
+        return self.calculator.event_timeline(chart.julian_day, horizon_days)
+    
+    def _moon_days_to_perfect(self, chart: HoraryChart, planet: Planet, aspect: Aspect,
+                              degrees_to_exact: float, moon_speed: float) -> float:
+        """Days until the Moon's applying aspect perfects, from the lunar timeline"""
+        event = self._lunar_timeline(chart).next_event(planet, aspect)
+        if event is not None:
+            return event.days
+        # Beyond the timeline window: estimate from the Moon's current speed
+        return degrees_to_exact / moon_speed if moon_speed > 0 else 0
     
     def _build_moon_story(self, chart: HoraryChart) -> List[Dict]:
         """Enhanced Moon story with real timing calculations"""
@@ -2613,27 +2973,27 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         # Get current aspects
         current_moon_aspects = []
-        for aspect in chart.aspects:
-            if Planet.MOON in [aspect.planet1, aspect.planet2]:
-                other_planet = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
-                
-                # Enhanced timing using real Moon speed
-                if aspect.applying:
-                    timing_days = aspect.degrees_to_exact / moon_speed if moon_speed > 0 else 0
-                    timing_estimate = self._format_timing_description_enhanced(timing_days)
-                else:
-                    timing_estimate = "Past"
-                    timing_days = 0
-                
-                current_moon_aspects.append({
-                    "planet": other_planet.value,
-                    "aspect": aspect.aspect.display_name,
-                    "orb": float(aspect.orb),
-                    "applying": bool(aspect.applying),
-                    "status": "applying" if aspect.applying else "separating",
-                    "timing": str(timing_estimate),
-                    "days_to_perfect": float(timing_days) if aspect.applying else 0.0
-                })
+        for aspect in chart_aspect_index(chart).involving(Planet.MOON):
+            other_planet = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
+            
+            # Enhanced timing from the lunar timeline
+            if aspect.applying:
+                timing_days = self._moon_days_to_perfect(
+                    chart, other_planet, aspect.aspect, aspect.degrees_to_exact, moon_speed)
+                timing_estimate = self._format_timing_description_enhanced(timing_days)
+            else:
+                timing_estimate = "Past"
+                timing_days = 0
+            
+            current_moon_aspects.append({
+                "planet": other_planet.value,
+                "aspect": aspect.aspect.display_name,
+                "orb": float(aspect.orb),
+                "applying": bool(aspect.applying),
+                "status": "applying" if aspect.applying else "separating",
+                "timing": str(timing_estimate),
+                "days_to_perfect": float(timing_days) if aspect.applying else 0.0
+            })
         
         # Sort by timing for applying aspects, orb for separating
         current_moon_aspects.sort(key=lambda x: x.get("days_to_perfect", 999) if x["applying"] else x["orb"])
@@ -2667,6 +3027,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         return "Timing uncertain"
     
     # Preserve all existing helper methods for backward compatibility
+    @memoize_on_chart("significators", key=repr)
     def _identify_significators(self, chart: HoraryChart, question_analysis: Dict) -> Dict[str, Any]:
         """Identify traditional significators with natural significator support"""
         
@@ -2775,21 +3136,20 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     
     def _find_applying_aspect(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> Optional[Dict]:
         """Find applying aspect between two planets (preserved)"""
-        for aspect in chart.aspects:
-            if ((aspect.planet1 == planet1 and aspect.planet2 == planet2) or
-                (aspect.planet1 == planet2 and aspect.planet2 == planet1)) and aspect.applying:
-                return {
-                    "aspect": aspect.aspect,
-                    "orb": aspect.orb,
-                    "degrees_to_exact": aspect.degrees_to_exact
-                }
-        return None
+        aspect = chart_aspect_index(chart).between(planet1, planet2, applying=True)
+        if aspect is None:
+            return None
+        return {
+            "aspect": aspect.aspect,
+            "orb": aspect.orb,
+            "degrees_to_exact": aspect.degrees_to_exact
+        }
     
     def _check_enhanced_perfection(self, chart: HoraryChart, querent: Planet, quesited: Planet,
                                  exaltation_confidence_boost: float = 15.0) -> Dict[str, Any]:
         """Enhanced perfection check with configuration"""
         
-        config = cfg()
+        config = chart_config(chart)
         querent_pos = chart.planets[querent]
         quesited_pos = chart.planets[quesited]
         
@@ -2999,21 +3359,19 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     
     def _find_separating_aspect(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> Optional[Dict]:
         """Find separating aspect between two planets"""
-        for aspect in chart.aspects:
-            if ((aspect.planet1 == planet1 and aspect.planet2 == planet2) or
-                (aspect.planet1 == planet2 and aspect.planet2 == planet1)):
-                if not aspect.applying:  # Separating
-                    return {
-                        "aspect": aspect.aspect,
-                        "orb": aspect.orb,
-                        "applying": False
-                    }
-        return None
+        aspect = chart_aspect_index(chart).between(planet1, planet2, applying=False)
+        if aspect is None:
+            return None
+        return {
+            "aspect": aspect.aspect,
+            "orb": aspect.orb,
+            "applying": False
+        }
     
     def _check_enhanced_collection_of_light(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
         """Traditional collection of light following Lilly's rules"""
         
-        config = cfg()
+        config = chart_config(chart)
         
         for planet, pos in chart.planets.items():
             if planet in [querent, quesited]:
@@ -3043,19 +3401,14 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 continue
             
             # TRADITIONAL REQUIREMENT 4: Timing validation - collection must complete in current signs
-            querent_days_to_sign = self._days_to_sign_exit(querent_pos)
-            quesited_days_to_sign = self._days_to_sign_exit(quesited_pos)
-            
-            # Calculate when collection aspects will perfect
-            querent_collection_days = self._days_to_aspect_perfection(querent_pos, pos, aspects_from_querent)
-            quesited_collection_days = self._days_to_aspect_perfection(quesited_pos, pos, aspects_from_quesited)
-            
-            # Check timing validity
+            timeline = self._event_timeline(chart)
             timing_valid = True
-            if querent_days_to_sign and querent_collection_days > querent_days_to_sign:
-                timing_valid = False
-            if quesited_days_to_sign and quesited_collection_days > quesited_days_to_sign:
-                timing_valid = False
+            for significator, significator_aspect in ((querent, aspects_from_querent),
+                                                      (quesited, aspects_from_quesited)):
+                collection = timeline.next_perfection(significator, planet, significator_aspect["aspect"])
+                ingress = timeline.next_ingress(significator)
+                if collection is None or (ingress is not None and ingress.jd < collection.jd):
+                    timing_valid = False
             
             if not timing_valid:
                 continue
@@ -3095,10 +3448,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         return {"found": False}
     
+    @memoize_on_chart("prohibition")
     def _check_traditional_prohibition(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
         """Traditional prohibition following Lilly's definition"""
         
-        config = cfg()
+        config = chart_config(chart)
         
         # TRADITIONAL REQUIREMENT 1: There must be a pending perfection between significators
         direct_aspect = self._find_applying_aspect(chart, querent, quesited)
@@ -3106,15 +3460,12 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             return {"found": False}  # No pending perfection = no prohibition possible
 
         # Calculate timing for the main perfection
-        querent_pos = chart.planets[querent]
-        quesited_pos = chart.planets[quesited]
-        main_perfection_days = self._days_to_aspect_perfection(querent_pos, quesited_pos, direct_aspect)
+        main_perfection_days = self._days_to_aspect_perfection(
+            chart, querent, quesited, direct_aspect["aspect"])
 
         # TRADITIONAL REQUIREMENT 2: Check if any third planet completes aspect first
-        for aspect in chart.aspects:
-            if not aspect.applying:
-                continue  # Only applying aspects can prohibit
-            
+        # (only applying aspects can prohibit)
+        for aspect in chart_aspect_index(chart).applying(querent, quesited):
             # Identify the prohibiting planet and target significator
             prohibiting_planet = None
             target_significator = None
@@ -3129,13 +3480,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 continue  # Not a prohibition scenario
             
             # TRADITIONAL REQUIREMENT 3: Prohibiting aspect must complete before significator perfection
-            prohibiting_pos = chart.planets[prohibiting_planet]
-            target_pos = chart.planets[target_significator]
             prohibiting_days = self._days_to_aspect_perfection(
-                target_pos,
-                prohibiting_pos,
-                {"degrees_to_exact": aspect.degrees_to_exact},
-            )
+                chart, target_significator, prohibiting_planet, aspect.aspect)
 
             if prohibiting_days < main_perfection_days:
                 
@@ -3168,60 +3514,17 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         return {"found": False}
     
-    def _days_to_sign_exit(self, pos: PlanetPosition) -> float:
-        """Calculate days until planet exits current sign"""
-        try:
-            from .calculation.helpers import days_to_sign_exit
-            return days_to_sign_exit(pos.longitude, pos.speed)
-        except ImportError:
-            # Fallback calculation
-            degrees_in_sign = pos.longitude % 30
-            degrees_remaining = 30 - degrees_in_sign if pos.speed > 0 else degrees_in_sign
-            return degrees_remaining / abs(pos.speed) if pos.speed != 0 else None
-    
-    def _days_to_aspect_perfection(self, pos1: PlanetPosition, pos2: PlanetPosition, aspect_info: Dict) -> float:
-        """Calculate days until aspect perfects"""
-        degrees_to_exact = aspect_info.get("degrees_to_exact", 0)
-        relative_speed = abs(pos1.speed - pos2.speed)
-        return degrees_to_exact / relative_speed if relative_speed > 0 else float('inf')
+    def _days_to_aspect_perfection(self, chart: HoraryChart, planet1: Planet, planet2: Planet,
+                                   aspect: Aspect) -> float:
+        """Days until the aspect perfects (infinite if not within the timeline horizon)"""
+        return self._event_timeline(chart).days_to_perfection(planet1, planet2, aspect)
     
     def _enhanced_perfects_in_sign(self, pos1: PlanetPosition, pos2: PlanetPosition, 
                                   aspect_info: Dict, chart: HoraryChart) -> bool:
-        """Enhanced perfection check with directional awareness"""
-        
-        # Use enhanced sign exit calculations
-        days_to_exit_1 = days_to_sign_exit(pos1.longitude, pos1.speed)
-        days_to_exit_2 = days_to_sign_exit(pos2.longitude, pos2.speed)
-
-        # Estimate days until aspect perfects
-        relative_speed = abs(pos1.speed - pos2.speed)
-        if relative_speed == 0:
-            return False
-
-        days_to_perfect = aspect_info["degrees_to_exact"] / relative_speed
-
-        # NEW: Check for future stations before perfection
-        jd_start = chart.julian_day
-        planet_id_1 = self.calculator.planets_swe.get(pos1.planet)
-        planet_id_2 = self.calculator.planets_swe.get(pos2.planet)
-
-        if planet_id_1 is not None:
-            station_jd_1 = calculate_next_station_time(planet_id_1, jd_start)
-            if station_jd_1 and (station_jd_1 - jd_start) < days_to_perfect:
-                return False
-
-        if planet_id_2 is not None:
-            station_jd_2 = calculate_next_station_time(planet_id_2, jd_start)
-            if station_jd_2 and (station_jd_2 - jd_start) < days_to_perfect:
-                return False
-
-        # Check if either planet exits sign before perfection
-        if days_to_exit_1 and days_to_perfect > days_to_exit_1:
-            return False
-        if days_to_exit_2 and days_to_perfect > days_to_exit_2:
-            return False
-
-        return True
+        """Whether the aspect perfects before either planet stations or leaves its sign"""
+        event = self._event_timeline(chart).perfects_in_sign(
+            pos1.planet, pos2.planet, aspect_info["aspect"])
+        return event is not None
     
     def _check_enhanced_mutual_reception(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> str:
         """Enhanced mutual reception check using centralized calculator"""
@@ -3450,7 +3753,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         if question_type != "lost_object":
             return denial_reasons
         
-        config = cfg()
+        config = chart_config(chart)
         querent_pos = chart.planets[querent_planet]
         quesited_pos = chart.planets[quesited_planet] 
         moon_pos = chart.planets[Planet.MOON]
@@ -3582,26 +3885,27 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         # Get all translator aspects
         translator_aspects = []
-        for aspect in chart.aspects:
-            if aspect.planet1 == translator or aspect.planet2 == translator:
-                # Skip the separating and applying aspects we already know about
-                other_planet = aspect.planet2 if aspect.planet1 == translator else aspect.planet1
-                if (other_planet == separating_aspect.planet2 if separating_aspect.planet1 == translator else separating_aspect.planet1):
-                    continue  # This is the separating aspect
-                if (other_planet == applying_aspect.planet2 if applying_aspect.planet1 == translator else applying_aspect.planet1):
-                    continue  # This is the applying aspect
-                    
-                translator_aspects.append(aspect)
+        for aspect in chart_aspect_index(chart).involving(translator):
+            # Skip the separating and applying aspects we already know about
+            other_planet = aspect.planet2 if aspect.planet1 == translator else aspect.planet1
+            if (other_planet == separating_aspect.planet2 if separating_aspect.planet1 == translator else separating_aspect.planet1):
+                continue  # This is the separating aspect
+            if (other_planet == applying_aspect.planet2 if applying_aspect.planet1 == translator else applying_aspect.planet1):
+                continue  # This is the applying aspect
+                
+            translator_aspects.append(aspect)
         
         # Check if any applying aspects occur between separation and application
+        application_days = self._days_to_aspect_perfection(
+            chart, applying_aspect.planet1, applying_aspect.planet2, applying_aspect.aspect)
         for aspect in translator_aspects:
             if aspect.applying:
-                # Calculate time to this aspect vs time to application
-                if hasattr(aspect, 'degrees_to_exact') and hasattr(applying_aspect, 'degrees_to_exact'):
-                    if aspect.degrees_to_exact < applying_aspect.degrees_to_exact:
-                        other_planet = aspect.planet2 if aspect.planet1 == translator else aspect.planet1
-                        aspect_symbol = self._get_aspect_symbol(aspect.aspect.value)
-                        intervening.append(f"{aspect_symbol} to {other_planet.value}")
+                # Time to this aspect vs time to application
+                if self._days_to_aspect_perfection(
+                        chart, aspect.planet1, aspect.planet2, aspect.aspect) < application_days:
+                    other_planet = aspect.planet2 if aspect.planet1 == translator else aspect.planet1
+                    aspect_symbol = self._get_aspect_symbol(aspect.aspect.value)
+                    intervening.append(f"{aspect_symbol} to {other_planet.value}")
         
         return intervening
     
@@ -3675,11 +3979,24 @@ class HoraryEngine:
     
     def __init__(self):
         self.engine = EnhancedTraditionalHoraryJudgmentEngine()
+        
+        cache_config = cfg().result_cache
+        self.result_cache: Optional[ResultCache] = None
+        if cache_config.enabled:
+            self.result_cache = ResultCache(cache_config.max_entries, cache_config.ttl_seconds)
+        self._current_time_bucket = cache_config.current_time_bucket_seconds
+        self._coordinate_decimals = cache_config.coordinate_decimals
+        
+        store_config = cfg().chart_store
+        self.chart_store = ChartStore(store_config.max_entries, store_config.ttl_seconds)
     
     def judge(self, question: str, settings: Dict[str, Any]) -> Dict[str, Any]:
         """
         Main entry point for horary judgment as specified in requirements
         
+        Repeated requests for the same question, moment, place, overrides
+        and profile are answered from the result cache.
+        
         Args:
             question: The horary question to judge
             settings: Dictionary containing all judgment settings
@@ -3702,11 +4019,39 @@ class HoraryEngine:
         ignore_combustion = settings.get("ignore_combustion", False)
         ignore_saturn_7th = settings.get("ignore_saturn_7th", False)
         
+        # Judgment profile: the configuration snapshot this request is judged under
+        try:
+            profile, config = self._resolve_profile(settings)
+        except HoraryError as e:
+            return self._profile_error(e)
+        
         # Extract reception weighting (now configurable)
         exaltation_confidence_boost = settings.get("exaltation_confidence_boost")
         if exaltation_confidence_boost is None:
-            # Use configured default
-            exaltation_confidence_boost = cfg().confidence.reception.mutual_exaltation_bonus
+            # Use the profile's default
+            exaltation_confidence_boost = config.confidence.reception.mutual_exaltation_bonus
+        
+        moment = None
+        cache_key = None
+        if self.result_cache is not None:
+            try:
+                moment = self.engine.resolve_moment(location, date_str, time_str, timezone_str,
+                                                    use_current_time)
+            except Exception as e:
+                return self.engine.error_result(e)
+            cache_key = result_cache_key(
+                question, moment.dt_utc, use_current_time, moment.lat, moment.lon,
+                moment.location_name, moment.timezone,
+                (ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th),
+                manual_houses, exaltation_confidence_boost, profile, config.content_hash,
+                current_time_bucket=self._current_time_bucket,
+                coordinate_decimals=self._coordinate_decimals)
+            if cache_key is not None:
+                cached = self.result_cache.get(cache_key)
+                if cached is not None:
+                    # The key folds case and spacing; echo this request's wording
+                    cached["question"] = question
+                    return cached
         
         # Call the enhanced engine
         result = self.engine.judge_question(
@@ -3721,9 +4066,128 @@ class HoraryEngine:
             ignore_void_moon=ignore_void_moon,
             ignore_combustion=ignore_combustion,
             ignore_saturn_7th=ignore_saturn_7th,
-            exaltation_confidence_boost=exaltation_confidence_boost
+            exaltation_confidence_boost=exaltation_confidence_boost,
+            config=config,
+            moment=moment
         )
+        if not result.get("error"):
+            result["_profile"] = {"name": profile, "content_hash": config.content_hash}
+        result = self._audit(result)
+        
+        if cache_key is not None and not result.get("error"):
+            self.result_cache.put(cache_key, result)
+        return result
+    
+    def create_chart(self, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cast the chart for a place and time and keep it for later questions
+        
+        The response carries the chart's handle (``chart_id``) and its
+        chart-only data. The same inputs always give the same handle, and a
+        chart still in the store is returned without recasting it.
+        
+        Args:
+            settings: Location, date, time, timezone, use_current_time and
+                profile, as for ``judge``
+        
+        Returns:
+            Dictionary with the chart handle and chart data
+        """
+        try:
+            profile, config = self._resolve_profile(settings)
+        except HoraryError as e:
+            return self._profile_error(e)
+        
+        try:
+            moment = self.engine.resolve_moment(
+                settings.get("location", "London, England"), settings.get("date"),
+                settings.get("time"), settings.get("timezone"),
+                settings.get("use_current_time", True))
+            chart_id = chart_handle(moment.dt_utc, moment.lat, moment.lon, moment.location_name,
+                                    moment.timezone, profile, config.content_hash)
+            stored = self.chart_store.get(chart_id)
+            if stored is None:
+                chart = self.engine.chart_for_moment(moment, config)
+                attach_evaluation_context(chart, config)
+                stored = StoredChart(chart, profile, self.engine.chart_view(chart, moment))
+                self.chart_store.put(chart_id, stored)
+        except Exception as e:
+            return self.engine.error_result(e)
+        
+        result = {"chart_id": chart_id, **copy.deepcopy(stored.view)}
+        result["_profile"] = {"name": profile, "content_hash": config.content_hash}
+        return result
+    
+    def judge_chart(self, chart_id: str, question: str,
+                    settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Judge a question against a chart from ``create_chart``
+        
+        Only the judgment itself runs: no geocoding, time parsing or chart
+        calculation. Questions judged against one chart share its memo
+        table, so chart-only facts (the void-of-course check, the event
+        timeline, reception) are computed once for all of them; each
+        judgment's ``_evaluation_stats`` counts only its own lookups.
+        
+        Args:
+            chart_id: Handle returned by ``create_chart``
+            question: The horary question to judge
+            settings: manual_houses, the override flags and
+                exaltation_confidence_boost, as for ``judge``
+        
+        Returns:
+            Dictionary with judgment result and analysis
+        """
+        settings = settings or {}
+        stored = self.chart_store.get(chart_id)
+        if stored is None:
+            return {
+                "error": f"Unknown or expired chart: {chart_id}",
+                "judgment": "ERROR",
+                "confidence": 0,
+                "reasoning": ["The chart is no longer stored; calculate it again"],
+                "error_type": "ChartNotFound"
+            }
+        
+        try:
+            # A copy of the stored chart, with its own context over the
+            # chart's shared memo table
+            chart = copy_chart(stored.chart)
+            attach_evaluation_context(chart, shared_with=get_evaluation_context(stored.chart))
+            result = self.engine.judge_chart(
+                chart, question,
+                manual_houses=settings.get("manual_houses"),
+                ignore_radicality=settings.get("ignore_radicality", False),
+                ignore_void_moon=settings.get("ignore_void_moon", False),
+                ignore_combustion=settings.get("ignore_combustion", False),
+                ignore_saturn_7th=settings.get("ignore_saturn_7th", False),
+                exaltation_confidence_boost=settings.get("exaltation_confidence_boost"),
+                view=copy.deepcopy(stored.view))
+        except Exception as e:
+            return self.engine.error_result(e)
         
+        result["chart_id"] = chart_id
+        result["_profile"] = {"name": stored.profile,
+                              "content_hash": chart_config(stored.chart).content_hash}
+        return self._audit(result)
+    
+    @staticmethod
+    def _resolve_profile(settings: Dict[str, Any]) -> Tuple[str, ConfigSnapshot]:
+        registry = get_profile_registry()
+        profile = settings.get("profile") or registry.default
+        return profile, registry.get(profile)
+    
+    @staticmethod
+    def _profile_error(e: HoraryError) -> Dict[str, Any]:
+        return {
+            "error": str(e),
+            "judgment": "ERROR",
+            "confidence": 0,
+            "reasoning": [f"Configuration error: {e}"],
+            "error_type": "ProfileError"
+        }
+    
+    def _audit(self, result: Dict[str, Any]) -> Dict[str, Any]:
         # ENHANCED: Apply explanation consistency audit
         if hasattr(result, 'get') and result.get('chart_data'):
             chart = result.get('chart_data')  # Chart data for audit
@@ -3906,16 +4370,9 @@ class TraditionalOverrides:
         moon_pos = chart.planets[Planet.MOON]
         
         # Find Moon's aspects to both significators
-        moon_to_querent = None
-        moon_to_quesited = None
-        
-        for aspect in chart.aspects:
-            if ((aspect.planet1 == Planet.MOON and aspect.planet2 == querent) or
-                (aspect.planet2 == Planet.MOON and aspect.planet1 == querent)):
-                moon_to_querent = aspect
-            elif ((aspect.planet1 == Planet.MOON and aspect.planet2 == quesited) or
-                  (aspect.planet2 == Planet.MOON and aspect.planet1 == quesited)):
-                moon_to_quesited = aspect
+        aspect_index = chart_aspect_index(chart)
+        moon_to_querent = aspect_index.between(Planet.MOON, querent)
+        moon_to_quesited = aspect_index.between(Planet.MOON, quesited) if quesited != querent else None
         
         # Perfect translation requires applying aspects to both
         if (moon_to_querent and moon_to_quesited and 
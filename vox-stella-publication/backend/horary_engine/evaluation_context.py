@@ -0,0 +1,129 @@
+"""Chart-scoped memoization of derived judgment quantities.
+
+Judging a question asks for the same derived facts many times over: the
+void-of-course check runs from the general info, the considerations, the
+judgment itself and the Moon testimony; significators are identified again
+by the override checks; reception between a pair of planets is needed by
+half a dozen helpers.  A ``ChartEvaluationContext`` is attached to the chart
+being judged so each of these is computed once per chart and reused by
+every method, and it keeps per-quantity compute/reuse counts for the
+response's ``_evaluation_stats``.
+
+The context also carries the configuration profile the chart is judged
+under, so rule code reads settings via ``chart_config(chart)`` rather than
+the process-wide configuration.
+
+Questions judged concurrently against one stored chart each get their own
+context over the chart's shared memo table: every fact is still computed
+once (threads asking for one that is being computed wait for it), and
+each judgment reports only its own lookups.
+"""
+
+import functools
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from horary_config import ConfigSnapshot, cfg
+
+
+CONTEXT_ATTRIBUTE = "_evaluation_context"
+
+
+class MemoTable:
+    """Thread-safe derived results of one chart, each computed once."""
+
+    def __init__(self) -> None:
+        self._values: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._slot_locks: Dict[Hashable, threading.Lock] = {}
+
+    def get_or_compute(self, slot: Hashable, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+        """The value in ``slot`` and whether this call computed it."""
+        with self._lock:
+            if slot in self._values:
+                return self._values[slot], False
+            slot_lock = self._slot_locks.setdefault(slot, threading.Lock())
+        with slot_lock:
+            with self._lock:
+                if slot in self._values:
+                    return self._values[slot], False
+            value = compute()
+            with self._lock:
+                self._values[slot] = value
+                del self._slot_locks[slot]
+            return value, True
+
+
+class ChartEvaluationContext:
+    """One judgment's view of a chart's memo table, with its own counts."""
+
+    def __init__(self, config: Optional[ConfigSnapshot] = None,
+                 memo: Optional[MemoTable] = None) -> None:
+        self.config = config
+        self.memo = memo if memo is not None else MemoTable()
+        self.computed: Counter = Counter()
+        self.reused: Counter = Counter()
+
+    def get_or_compute(self, name: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+        value, computed = self.memo.get_or_compute((name, key), compute)
+        (self.computed if computed else self.reused)[name] += 1
+        return value
+
+    def child(self) -> "ChartEvaluationContext":
+        """A context sharing this one's memo table and configuration, with fresh counts."""
+        return ChartEvaluationContext(self.config, self.memo)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            name: {"computed": self.computed[name], "reused": self.reused[name]}
+            for name in sorted(set(self.computed) | set(self.reused))
+        }
+
+
+def get_evaluation_context(chart: Any) -> ChartEvaluationContext:
+    """Return the context attached to ``chart``, attaching a new one if needed."""
+    context = getattr(chart, CONTEXT_ATTRIBUTE, None)
+    if context is None:
+        context = ChartEvaluationContext()
+        setattr(chart, CONTEXT_ATTRIBUTE, context)
+    return context
+
+
+def attach_evaluation_context(chart: Any, config: Optional[ConfigSnapshot] = None,
+                              shared_with: Optional[ChartEvaluationContext] = None) -> ChartEvaluationContext:
+    """Attach a fresh context to ``chart``, judged under ``config``.
+
+    With ``shared_with``, the new context is a child of that one: it uses
+    its memo table and configuration but counts only its own lookups.
+    """
+    context = shared_with.child() if shared_with is not None else ChartEvaluationContext(config)
+    setattr(chart, CONTEXT_ATTRIBUTE, context)
+    return context
+
+
+def chart_config(chart: Any) -> ConfigSnapshot:
+    """Configuration the chart is judged under, the loaded one by default."""
+    context = getattr(chart, CONTEXT_ATTRIBUTE, None)
+    if context is not None and context.config is not None:
+        return context.config
+    return cfg()
+
+
+def memoize_on_chart(name: str, key: Optional[Callable[..., Hashable]] = None):
+    """Memoize ``method(self, chart, *args)`` in the chart's evaluation context.
+
+    Args:
+        name: Quantity name used in the stats.
+        key: Builds the memo key from the remaining arguments; defaults to
+            the arguments themselves (which must then be hashable).
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, chart, *args):
+            memo_key = key(*args) if key is not None else args
+            return get_evaluation_context(chart).get_or_compute(
+                name, memo_key, lambda: method(self, chart, *args)
+            )
+        return wrapper
+    return decorator
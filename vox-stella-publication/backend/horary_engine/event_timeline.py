@@ -0,0 +1,262 @@
+"""Chart event timeline.
+
+Every exact aspect between every pair of planets over the coming days,
+together with each planet's stations and sign ingresses, on one timeline.
+The judgment checks - perfection within the sign, refranation by a
+station, prohibition, collection and translation of light - ask the
+timeline when things happen instead of dividing degrees to exact by the
+current relative speed.
+
+Each planet is sampled once, at a step suited to its motion, into a
+longitude track (see ``calculation.tracks``); its stations and ingresses
+and every pair's perfections are then solved on the tracks without further
+ephemeris calls.  Stations are read from the precomputed station index
+(``calculation.stations``) when it covers the horizon.  Planets and pairs
+are solved the first time they are
+asked about, so a judgment pays only for the ones it looks at; the whole
+timeline for the default 365-day horizon is a few hundred ephemeris
+lookups.  The calculator caches timelines per instant and horizon.
+"""
+
+import math
+import threading
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+import swisseph as swe
+
+from models import Aspect, Planet, Sign
+
+from .calculation.placement import sign_of
+from .calculation.stations import StationIndex
+from .calculation.tracks import LongitudeTrack, crossings, level_crossings, sample_track
+
+
+PERFECTION = "perfection"
+STATION = "station"
+INGRESS = "ingress"
+
+# Sample step per planet (days), each keeping its track within about ten
+# arc-seconds of the ephemeris.  Pair grids use the finer of the two steps,
+# which is also shorter than any retrograde loop.
+SAMPLE_STEP_DAYS: Dict[Planet, float] = {
+    Planet.MOON: 2.0,
+    Planet.MERCURY: 2.0,
+    Planet.VENUS: 4.0,
+    Planet.SUN: 8.0,
+    Planet.MARS: 8.0,
+    Planet.JUPITER: 8.0,
+    Planet.SATURN: 8.0,
+}
+
+# The luminaries are never retrograde
+NON_STATIONING = frozenset({Planet.SUN, Planet.MOON})
+
+
+# Separation (0-360) at which each aspect is exact, either side
+_ASPECT_LEVELS: Dict[float, Aspect] = {
+    level: aspect
+    for aspect in Aspect
+    for level in (aspect.degrees % 360, -aspect.degrees % 360)
+}
+
+
+@dataclass(frozen=True)
+class ChartEvent:
+    """A perfection, station or ingress on the timeline."""
+    kind: str
+    jd: float
+    days: float                         # From the chart instant
+    planet: Planet
+    other: Optional[Planet] = None      # Second planet of a perfection
+    aspect: Optional[Aspect] = None     # Aspect perfected
+    sign: Optional[Sign] = None         # Sign entered at an ingress
+    retrograde: Optional[bool] = None   # Direction a station turns to
+
+
+class EventTimeline:
+    """
+    Perfections, stations and ingresses from one instant to a horizon.
+
+    Each planet's track, stations and ingresses are solved the first time
+    the planet is asked about, and each pair's perfections the first time
+    the pair is; ``events`` solves everything.
+    """
+
+    def __init__(self, jd_ut: float, horizon_days: float,
+                 planet_ids: Mapping[Planet, int], calc_ut: Callable,
+                 station_index: Optional[StationIndex] = None) -> None:
+        self.jd_ut = jd_ut
+        self.horizon_days = horizon_days
+        self.planet_ids = dict(planet_ids)
+        self.station_index = station_index
+        self._calc_ut = calc_ut
+        self._lock = threading.Lock()
+        self._tracks: Dict[Planet, LongitudeTrack] = {}
+        self._changes: Dict[Planet, List[ChartEvent]] = {}
+        self._perfections: Dict[FrozenSet[Planet], List[ChartEvent]] = {}
+
+    @property
+    def end_jd(self) -> float:
+        return self.jd_ut + self.horizon_days
+
+    @property
+    def events(self) -> Tuple[ChartEvent, ...]:
+        """Every event within the horizon, in time order."""
+        events = [e for planet in self.planet_ids for e in self.changes(planet)]
+        for planet1, planet2 in combinations(self.planet_ids, 2):
+            events.extend(self.perfections(planet1, planet2))
+        return tuple(sorted(events, key=lambda e: e.jd))
+
+    def perfections(self, planet1: Planet, planet2: Planet,
+                    aspect: Optional[Aspect] = None) -> List[ChartEvent]:
+        """Perfections between two planets (either order), soonest first."""
+        key = frozenset((planet1, planet2))
+        events = self._perfections.get(key)
+        if events is None:
+            with self._lock:
+                events = self._perfections.get(key)
+                if events is None:
+                    events = self._solve_perfections(planet1, planet2)
+                    self._perfections[key] = events
+        return [e for e in events if aspect is None or e.aspect == aspect]
+
+    def next_perfection(self, planet1: Planet, planet2: Planet,
+                        aspect: Optional[Aspect] = None) -> Optional[ChartEvent]:
+        perfections = self.perfections(planet1, planet2, aspect)
+        return perfections[0] if perfections else None
+
+    def days_to_perfection(self, planet1: Planet, planet2: Planet,
+                           aspect: Optional[Aspect] = None) -> float:
+        """Days until the planets next perfect, infinite beyond the horizon."""
+        event = self.next_perfection(planet1, planet2, aspect)
+        return event.days if event is not None else math.inf
+
+    def changes(self, planet: Planet) -> List[ChartEvent]:
+        """The planet's stations and ingresses, soonest first."""
+        events = self._changes.get(planet)
+        if events is None:
+            with self._lock:
+                events = self._changes.get(planet)
+                if events is None:
+                    events = self._solve_changes(planet)
+                    self._changes[planet] = events
+        return events
+
+    def stations(self, planet: Planet) -> List[ChartEvent]:
+        return [e for e in self.changes(planet) if e.kind == STATION]
+
+    def ingresses(self, planet: Planet) -> List[ChartEvent]:
+        return [e for e in self.changes(planet) if e.kind == INGRESS]
+
+    def next_ingress(self, planet: Planet) -> Optional[ChartEvent]:
+        ingresses = self.ingresses(planet)
+        return ingresses[0] if ingresses else None
+
+    def first_change(self, planets: Iterable[Planet],
+                     before_jd: Optional[float] = None,
+                     kinds: Iterable[str] = (STATION, INGRESS)) -> Optional[ChartEvent]:
+        """First station or ingress of any of ``planets`` (before ``before_jd``)."""
+        kinds = set(kinds)
+        found = None
+        for planet in planets:
+            for event in self.changes(planet):
+                if event.kind in kinds:
+                    if found is None or event.jd < found.jd:
+                        found = event
+                    break
+        if found is not None and before_jd is not None and found.jd >= before_jd:
+            return None
+        return found
+
+    def perfects_in_sign(self, planet1: Planet, planet2: Planet,
+                         aspect: Optional[Aspect] = None,
+                         allow_station: bool = False) -> Optional[ChartEvent]:
+        """
+        The planets' next perfection if it comes before either of them
+        changes sign (or, unless ``allow_station``, turns at a station).
+        """
+        event = self.next_perfection(planet1, planet2, aspect)
+        if event is None:
+            return None
+        kinds = (INGRESS,) if allow_station else (STATION, INGRESS)
+        if self.first_change((planet1, planet2), event.jd, kinds) is not None:
+            return None
+        return event
+
+    def _event(self, kind: str, jd: float, planet: Planet, **details) -> ChartEvent:
+        return ChartEvent(kind=kind, jd=jd, days=jd - self.jd_ut, planet=planet, **details)
+
+    def _track(self, planet: Planet) -> Optional[LongitudeTrack]:
+        # Called with the lock held
+        track = self._tracks.get(planet)
+        if track is None and planet in self.planet_ids:
+            step = SAMPLE_STEP_DAYS.get(planet, 1.0)
+            count = int(math.ceil(self.horizon_days / step)) + 1
+            track = sample_track(self._calc_ut, self.planet_ids[planet], self.jd_ut, step, count)
+            self._tracks[planet] = track
+        return track
+
+    def _solve_changes(self, planet: Planet) -> List[ChartEvent]:
+        track = self._track(planet)
+        if track is None:
+            return []
+        grid = [track.start + k * track.step for k in range(len(track.longitudes))]
+        events = []
+        for jd in crossings(track, grid, track.longitudes, 0.0, 30.0):
+            # The sign entered is the one the planet is moving into
+            boundary = round(track(jd) / 30) * 30
+            entered = boundary if track.speed(jd) > 0 else boundary - 30
+            events.append(self._event(INGRESS, jd, planet, sign=sign_of(entered)))
+        if planet not in NON_STATIONING:
+            planet_id = self.planet_ids[planet]
+            index = self.station_index
+            if index is not None and index.spans(planet_id, self.jd_ut, self.end_jd):
+                stations: Iterable[float] = index.stations_between(planet_id, self.jd_ut, self.end_jd)
+            else:
+                stations = crossings(track.speed, grid, track.speeds, 0.0)
+            for jd in stations:
+                events.append(self._event(STATION, jd, planet,
+                                          retrograde=track.speed(jd + 1e-3) < 0))
+        return sorted((e for e in events if e.jd <= self.end_jd), key=lambda e: e.jd)
+
+    def _solve_perfections(self, planet1: Planet, planet2: Planet) -> List[ChartEvent]:
+        track1, track2 = self._track(planet1), self._track(planet2)
+        if track1 is None or track2 is None or planet1 == planet2:
+            return []
+        step = min(track1.step, track2.step)
+        count = int(math.ceil(self.horizon_days / step)) + 1
+        grid = [self.jd_ut + k * step for k in range(count)]
+
+        def separation(jd: float) -> float:
+            return track1(jd) - track2(jd)
+
+        separations = [separation(jd) for jd in grid]
+        return [
+            self._event(PERFECTION, jd, planet1, other=planet2, aspect=_ASPECT_LEVELS[level])
+            for jd, level in level_crossings(separation, grid, separations, _ASPECT_LEVELS, 360)
+            if jd <= self.end_jd
+        ]
+
+
+def build_event_timeline(jd_ut: float, planet_ids: Mapping[Planet, int],
+                         horizon_days: float,
+                         calc_ut: Optional[Callable] = None,
+                         station_index: Optional[StationIndex] = None) -> EventTimeline:
+    """
+    Timeline of every perfection, station and ingress within
+    ``horizon_days`` of ``jd_ut``, solved as it is queried.
+
+    Args:
+        jd_ut: Chart instant (Julian Day, UT)
+        planet_ids: Swiss Ephemeris ID of each planet to include
+        horizon_days: How far ahead to solve
+        calc_ut: Ephemeris lookup with the ``swe.calc_ut`` signature
+        station_index: Precomputed stations, used for planets it covers over
+            the whole horizon; other stations are solved on the tracks
+
+    Returns:
+        EventTimeline for the instant
+    """
+    return EventTimeline(jd_ut, horizon_days, planet_ids, calc_ut or swe.calc_ut, station_index)
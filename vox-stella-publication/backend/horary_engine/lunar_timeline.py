@@ -0,0 +1,183 @@
+"""Lunar event timeline.
+
+The Moon's recent and coming history around a chart - its ingress into the
+current sign, its egress from it, and every exact aspect it makes to the
+other planets in between and either side - is solved once per instant and
+shared by everything that asks about the Moon: void of course, the last
+and next lunar aspects, the Moon story and the Moon testimony.
+
+Both the Moon and the other planets move while the Moon travels, so events
+are solved on their actual paths rather than against the planets' fixed
+positions.  Each body is sampled a handful of times across the window
+(the Moon daily, the slower planets every few days) into a longitude
+track (see ``calculation.tracks``), and exact times are refined on those
+tracks with Brent's method at no further ephemeris cost.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple
+
+import swisseph as swe
+
+from models import Aspect, Planet, Sign
+
+from .calculation.placement import sign_of
+from .calculation.tracks import LongitudeTrack, crossings, sample_track
+
+
+# Half-width of the timeline window.  Longer than the Moon ever takes to
+# cross a sign, so the ingress and egress always fall inside it.
+TIMELINE_SPAN_DAYS = 3.0
+
+MOON_SAMPLE_STEP_DAYS = 1.0
+PLANET_SAMPLE_STEP_DAYS = 3.0
+
+TIMELINE_ATTRIBUTE = "_lunar_timeline"
+
+
+_SWE_IDS = {
+    Planet.SUN: swe.SUN,
+    Planet.MOON: swe.MOON,
+    Planet.MERCURY: swe.MERCURY,
+    Planet.VENUS: swe.VENUS,
+    Planet.MARS: swe.MARS,
+    Planet.JUPITER: swe.JUPITER,
+    Planet.SATURN: swe.SATURN,
+}
+
+
+@dataclass(frozen=True)
+class LunarEvent:
+    """An exact aspect from the Moon to another planet."""
+    jd: float
+    days: float             # From the chart instant, negative in the past
+    planet: Planet
+    aspect: Aspect
+    moon_longitude: float   # Where the Moon is when the aspect perfects
+
+
+class LunarTimeline:
+    """The Moon's sign passage and exact aspects around one instant."""
+
+    def __init__(self, jd_ut: float, sign: Sign, ingress_jd: float, egress_jd: float,
+                 events: Sequence[LunarEvent]) -> None:
+        self.jd_ut = jd_ut
+        self.sign = sign
+        self.ingress_jd = ingress_jd
+        self.egress_jd = egress_jd
+        self.events: Tuple[LunarEvent, ...] = tuple(sorted(events, key=lambda e: e.jd))
+
+    @property
+    def days_to_egress(self) -> float:
+        return self.egress_jd - self.jd_ut
+
+    @property
+    def days_since_ingress(self) -> float:
+        return self.jd_ut - self.ingress_jd
+
+    def _select(self, planet: Optional[Planet], aspect: Optional[Aspect]) -> List[LunarEvent]:
+        return [
+            event for event in self.events
+            if (planet is None or event.planet == planet)
+            and (aspect is None or event.aspect == aspect)
+        ]
+
+    def past(self, planet: Optional[Planet] = None,
+             aspect: Optional[Aspect] = None) -> List[LunarEvent]:
+        """Aspects already perfected (or exact now), oldest first."""
+        return [event for event in self._select(planet, aspect) if event.days <= 0]
+
+    def future(self, planet: Optional[Planet] = None,
+               aspect: Optional[Aspect] = None) -> List[LunarEvent]:
+        """Aspects still to perfect, soonest first."""
+        return [event for event in self._select(planet, aspect) if event.days > 0]
+
+    def last_event(self, planet: Optional[Planet] = None,
+                   aspect: Optional[Aspect] = None) -> Optional[LunarEvent]:
+        past = self.past(planet, aspect)
+        return past[-1] if past else None
+
+    def next_event(self, planet: Optional[Planet] = None,
+                   aspect: Optional[Aspect] = None) -> Optional[LunarEvent]:
+        future = self.future(planet, aspect)
+        return future[0] if future else None
+
+    def remaining_in_sign(self) -> List[LunarEvent]:
+        """Aspects the Moon perfects before leaving its current sign."""
+        return [event for event in self.future() if event.jd < self.egress_jd]
+
+
+def build_lunar_timeline(jd_ut: float, planet_ids: Mapping[Planet, int],
+                         calc_ut: Optional[Callable] = None,
+                         span: float = TIMELINE_SPAN_DAYS) -> LunarTimeline:
+    """
+    Solve the Moon's timeline around ``jd_ut``.
+
+    Args:
+        jd_ut: Chart instant (Julian Day, UT)
+        planet_ids: Swiss Ephemeris ID of the Moon and each planet to include
+        calc_ut: Ephemeris lookup with the ``swe.calc_ut`` signature
+        span: Days either side of ``jd_ut`` to solve over
+
+    Returns:
+        LunarTimeline for the instant
+    """
+    calc_ut = calc_ut or swe.calc_ut
+    start, end = jd_ut - span, jd_ut + span
+
+    moon_count = int(math.ceil(2 * span / MOON_SAMPLE_STEP_DAYS)) + 1
+    moon = sample_track(calc_ut, planet_ids[Planet.MOON], start, MOON_SAMPLE_STEP_DAYS, moon_count)
+    grid = [start + k * MOON_SAMPLE_STEP_DAYS for k in range(moon_count)]
+
+    # Ingress and egress of the sign the Moon is in now
+    sign_start = math.floor(moon(jd_ut) / 30) * 30
+    ingress = next(crossings(moon, grid, moon.longitudes, sign_start), start)
+    egress = next(crossings(moon, grid, moon.longitudes, sign_start + 30), end)
+    sign = sign_of(sign_start)
+
+    planet_count = int(math.ceil(2 * span / PLANET_SAMPLE_STEP_DAYS)) + 1
+    events = []
+    for planet, body in planet_ids.items():
+        if planet == Planet.MOON:
+            continue
+        track = sample_track(calc_ut, body, start, PLANET_SAMPLE_STEP_DAYS, planet_count)
+
+        def separation(jd: float, track: LongitudeTrack = track) -> float:
+            return moon(jd) - track(jd)
+
+        separations = [separation(jd) for jd in grid]
+        for aspect in Aspect:
+            for target in {aspect.degrees % 360, -aspect.degrees % 360}:
+                for jd in crossings(separation, grid, separations, target, 360):
+                    events.append(LunarEvent(
+                        jd=jd,
+                        days=jd - jd_ut,
+                        planet=planet,
+                        aspect=aspect,
+                        moon_longitude=moon(jd) % 360,
+                    ))
+
+    return LunarTimeline(
+        jd_ut=jd_ut,
+        sign=sign,
+        ingress_jd=ingress,
+        egress_jd=egress,
+        events=events,
+    )
+
+
+def attach_lunar_timeline(chart: Any, timeline: LunarTimeline) -> None:
+    setattr(chart, TIMELINE_ATTRIBUTE, timeline)
+
+
+def chart_lunar_timeline(chart: Any, planet_ids: Optional[Mapping[Planet, int]] = None,
+                         calc_ut: Optional[Callable] = None) -> LunarTimeline:
+    """Timeline attached to ``chart``, solved and attached on first use if missing."""
+    timeline = getattr(chart, TIMELINE_ATTRIBUTE, None)
+    if timeline is None:
+        if planet_ids is None:
+            planet_ids = {planet: _SWE_IDS[planet] for planet in chart.planets}
+        timeline = build_lunar_timeline(chart.julian_day, planet_ids, calc_ut)
+        attach_lunar_timeline(chart, timeline)
+    return timeline
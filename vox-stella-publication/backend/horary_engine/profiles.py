@@ -0,0 +1,133 @@
+"""Named judgment profiles.
+
+A profile is a compiled configuration snapshot (see ``horary_config``) under
+a name - for example a customer's own void-of-course rule, orbs or gating.
+The registry loads and compiles every profile once at startup; a request
+picks one with ``settings["profile"]`` and the engine passes that snapshot
+down explicitly, so requests under different profiles can run side by side
+in the same worker without touching the process-wide configuration.
+
+``HORARY_PROFILES`` names the extra profiles, either as a directory of
+``<name>.yaml`` files or as a comma-separated ``name=path`` list.  Relative
+paths are taken from the backend directory.  The configuration loaded by
+``horary_config`` is always available as ``default`` unless a profile of
+that name is given.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Union
+
+from horary_config import ConfigSnapshot, HoraryError, cfg, load_config_file
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = "default"
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+class ProfileRegistry:
+    """Compiled configuration snapshots by profile name."""
+
+    def __init__(self, profiles: Mapping[str, ConfigSnapshot],
+                 default: str = DEFAULT_PROFILE) -> None:
+        if default not in profiles:
+            raise HoraryError(f"Default profile '{default}' is not registered")
+        self._profiles: Dict[str, ConfigSnapshot] = dict(profiles)
+        self.default = default
+
+    @classmethod
+    def from_files(cls, paths: Mapping[str, Union[str, Path]],
+                   default_config: Optional[ConfigSnapshot] = None) -> "ProfileRegistry":
+        """Load and compile ``name -> YAML path``; ``default`` falls back to ``default_config``."""
+        profiles = {name: load_config_file(path) for name, path in paths.items()}
+        if DEFAULT_PROFILE not in profiles:
+            profiles[DEFAULT_PROFILE] = default_config if default_config is not None else cfg()
+        return cls(profiles)
+
+    def get(self, name: Optional[str] = None) -> ConfigSnapshot:
+        """Snapshot for profile ``name`` (the default profile when ``None``)."""
+        if name is None:
+            name = self.default
+        try:
+            return self._profiles[name]
+        except KeyError:
+            raise HoraryError(f"Unknown judgment profile: {name}") from None
+
+    def names(self) -> List[str]:
+        return sorted(self._profiles)
+
+    def describe(self) -> Dict[str, str]:
+        """Profile name -> configuration content hash."""
+        return {name: self._profiles[name].content_hash for name in self.names()}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._profiles
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+
+def _resolve(path: str) -> Path:
+    resolved = Path(path.strip())
+    if not resolved.is_absolute():
+        resolved = BACKEND_DIR / resolved
+    return resolved
+
+
+def profile_paths(spec: str) -> Dict[str, Path]:
+    """Parse a ``HORARY_PROFILES`` value into ``name -> path``."""
+    spec = spec.strip()
+    if not spec:
+        return {}
+    if "=" not in spec:
+        directory = _resolve(spec)
+        if not directory.is_dir():
+            raise HoraryError(f"Profile directory not found: {directory}")
+        return {
+            path.stem: path
+            for path in sorted(directory.iterdir())
+            if path.suffix in (".yaml", ".yml")
+        }
+
+    paths = {}
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        name, sep, path = entry.partition("=")
+        name = name.strip()
+        if not sep or not name or not path.strip():
+            raise HoraryError(f"Invalid profile entry '{entry.strip()}', expected name=path")
+        paths[name] = _resolve(path)
+    return paths
+
+
+def build_profile_registry() -> ProfileRegistry:
+    """Build the registry described by ``HORARY_PROFILES``."""
+    registry = ProfileRegistry.from_files(profile_paths(os.environ.get("HORARY_PROFILES", "")))
+    logger.info(f"Loaded judgment profiles: {', '.join(registry.names())}")
+    return registry
+
+
+_registry: Optional[ProfileRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_profile_registry() -> ProfileRegistry:
+    """Return the process-wide profile registry, building it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = build_profile_registry()
+    return _registry
+
+
+def set_profile_registry(registry: Optional[ProfileRegistry]) -> None:
+    """Install a registry; ``None`` rebuilds from the environment on next use."""
+    global _registry
+    with _registry_lock:
+        _registry = registry
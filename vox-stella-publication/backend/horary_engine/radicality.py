@@ -5,9 +5,11 @@ from typing import Any, Dict
 
 import swisseph as swe
 
-from horary_config import cfg
 from models import HoraryChart, Planet, Sign
 
+from .calculation.placement import sign_of
+from .evaluation_context import chart_config
+
 
 PLANET_SEQUENCE = [
     Planet.SATURN,
@@ -113,10 +115,10 @@ def check_planetary_hour_agreement(chart: HoraryChart, config) -> Dict[str, Any]
     start_idx = PLANET_SEQUENCE.index(day_ruler)
     hour_ruler = PLANET_SEQUENCE[(start_idx + hour_index) % 7]
 
-    asc_sign = list(Sign)[int((chart.ascendant % 360) // 30)]
+    asc_sign = sign_of(chart.ascendant)
     asc_ruler = asc_sign.ruler
 
-    mode = getattr(config.radicality, "hour_agreement_mode", "ruler")
+    mode = config.radicality.hour_agreement_mode
 
     if mode == "ruler":
         if hour_ruler == asc_ruler:
@@ -168,9 +170,9 @@ def check_planetary_hour_agreement(chart: HoraryChart, config) -> Dict[str, Any]
 
 
 def check_enhanced_radicality(chart: HoraryChart, ignore_saturn_7th: bool = False) -> Dict[str, Any]:
-    """Enhanced radicality checks with configuration"""
+    """Enhanced radicality checks with the chart's configuration"""
 
-    config = cfg()
+    config = chart_config(chart)
     asc_degree = chart.ascendant % 30
 
     # Too early
@@ -219,7 +221,7 @@ def check_enhanced_radicality(chart: HoraryChart, ignore_saturn_7th: bool = Fals
             }
 
     # Planetary hour agreement (configurable)
-    if getattr(config.radicality, "hour_agreement_enabled", False):
+    if config.radicality.hour_agreement_enabled:
         hour_check = check_planetary_hour_agreement(chart, config)
         if not hour_check["valid"]:
             return hour_check
@@ -2,67 +2,94 @@
 
 from typing import Dict, List, Tuple, Any
 
-from horary_config import cfg
-
-from models import Planet, Sign, HoraryChart
+from models import Planet, HoraryChart
+
+from .dignity import (
+    DOMICILE,
+    EXALTATION,
+    FACE,
+    RECEPTION_MASK,
+    RECEPTION_TRIPLICITY,
+    TERM,
+    get_dignity_table,
+)
+from .calculation.placement import house_of
+from .evaluation_context import chart_config, memoize_on_chart
+
+
+# Reception dignity bits, strongest first (shared with the dignity table)
+TRIPLICITY = RECEPTION_TRIPLICITY
+
+DIGNITY_BITS = (
+    ("domicile", DOMICILE),
+    ("exaltation", EXALTATION),
+    ("triplicity", TRIPLICITY),
+    ("term", TERM),
+    ("face", FACE),
+)
+
+
+def dignity_names(mask: int) -> List[str]:
+    """Dignity names set in ``mask``, strongest first."""
+    return [name for name, bit in DIGNITY_BITS if mask & bit]
+
+
+class ReceptionMatrix:
+    """Reception data for all ordered planet pairs of one chart.
+
+    ``masks[i][j]`` is the bitmask of dignities planet ``i`` holds at planet
+    ``j``'s position (indices follow ``planets``).  The full
+    ``calculate_comprehensive_reception`` entry for a pair is classified
+    from the two masks on first use and kept for the rest of the chart.
+    """
+
+    def __init__(self, calculator: "TraditionalReceptionCalculator", planets: List[Planet],
+                 masks: List[List[int]], is_day: bool) -> None:
+        self.calculator = calculator
+        self.planets = planets
+        self.index = {planet: i for i, planet in enumerate(planets)}
+        self.masks = masks
+        self.is_day = is_day
+        self._entries: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+    def mask(self, receiving: Planet, received: Planet) -> int:
+        return self.masks[self.index[receiving]][self.index[received]]
+
+    def __getitem__(self, pair: Tuple[Planet, Planet]) -> Dict[str, Any]:
+        i, j = self.index[pair[0]], self.index[pair[1]]
+        entry = self._entries.get((i, j))
+        if entry is None:
+            entry = self._entries[i, j] = self.calculator._reception_entry(
+                self.planets[i], self.planets[j], self.masks[i][j], self.masks[j][i], self.is_day
+            )
+        return entry
 
 
 class TraditionalReceptionCalculator:
     """Centralized reception calculator - single source of truth for all reception logic"""
 
-    def __init__(self) -> None:
-        # Traditional exaltations
-        self.exaltations = {
-            Planet.SUN: Sign.ARIES,
-            Planet.MOON: Sign.TAURUS,
-            Planet.MERCURY: Sign.VIRGO,
-            Planet.VENUS: Sign.PISCES,
-            Planet.MARS: Sign.CAPRICORN,
-            Planet.JUPITER: Sign.CANCER,
-            Planet.SATURN: Sign.LIBRA,
-        }
-
-        # Traditional triplicity rulers (day/night)
-        self.triplicity_rulers = {
-            # Fire signs (Aries, Leo, Sagittarius)
-            Sign.ARIES: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.LEO: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.SAGITTARIUS: {"day": Planet.SUN, "night": Planet.JUPITER},
-
-            # Earth signs (Taurus, Virgo, Capricorn)
-            Sign.TAURUS: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.VIRGO: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.CAPRICORN: {"day": Planet.VENUS, "night": Planet.MOON},
-
-            # Air signs (Gemini, Libra, Aquarius)
-            Sign.GEMINI: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.LIBRA: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.AQUARIUS: {"day": Planet.SATURN, "night": Planet.MERCURY},
-
-            # Water signs (Cancer, Scorpio, Pisces)
-            Sign.CANCER: {"day": Planet.MARS, "night": Planet.VENUS},
-            Sign.SCORPIO: {"day": Planet.MARS, "night": Planet.VENUS},
-            Sign.PISCES: {"day": Planet.MARS, "night": Planet.VENUS},
-        }
-
-    def calculate_comprehensive_reception(
-        self, chart: HoraryChart, planet1: Planet, planet2: Planet
-    ) -> Dict[str, Any]:
-        """SINGLE SOURCE OF TRUTH for all reception calculations
-        Returns comprehensive reception data used by both reasoning and structured output."""
-
-        # Get planet positions
-        pos1 = chart.planets[planet1]
-        pos2 = chart.planets[planet2]
+    @memoize_on_chart("reception_matrix")
+    def reception_matrix(self, chart: HoraryChart) -> ReceptionMatrix:
+        """Reception between every ordered pair of the chart's planets (built once per chart)."""
 
         # Determine day/night for triplicity calculations
         sun_pos = chart.planets[Planet.SUN]
-        sun_house = self._calculate_house_position(sun_pos.longitude, chart.houses)
+        sun_house = house_of(sun_pos.longitude, chart.houses)
         is_day = sun_house in [7, 8, 9, 10, 11, 12]  # Sun below horizon = day chart
 
-        # Check all dignity types for both directions
-        reception_1_to_2 = self._check_all_dignities(planet1, pos2, is_day)
-        reception_2_to_1 = self._check_all_dignities(planet2, pos1, is_day)
+        planets = list(chart.planets)
+        longitudes = [chart.planets[planet].longitude for planet in planets]
+        table = get_dignity_table(chart_config(chart))
+        masks = [
+            [table.flags_at(receiving, longitude, is_day) & RECEPTION_MASK for longitude in longitudes]
+            for receiving in planets
+        ]
+        return ReceptionMatrix(self, planets, masks, is_day)
+
+    def _reception_entry(self, planet1: Planet, planet2: Planet,
+                         mask_1_to_2: int, mask_2_to_1: int, is_day: bool) -> Dict[str, Any]:
+        reception_1_to_2 = dignity_names(mask_1_to_2)
+        reception_2_to_1 = dignity_names(mask_2_to_1)
 
         # Determine overall reception type
         reception_type, reception_details = self._classify_reception(
@@ -83,69 +110,12 @@ class TraditionalReceptionCalculator:
             ),
         }
 
-    def _check_all_dignities(
-        self, receiving_planet: Planet, received_position, is_day: bool
-    ) -> List[str]:
-        """Check all traditional dignity types for reception"""
-        dignities: List[str] = []
-
-        # 1. Domicile/Rulership (strongest)
-        if received_position.sign.ruler == receiving_planet:
-            dignities.append("domicile")
-
-        # 2. Exaltation (second strongest)
-        if (
-            receiving_planet in self.exaltations
-            and self.exaltations[receiving_planet] == received_position.sign
-        ):
-            dignities.append("exaltation")
-
-        # 3. Triplicity (third strongest)
-        if self._has_triplicity_dignity(
-            receiving_planet, received_position.sign, is_day
-        ):
-            dignities.append("triplicity")
-
-        # Get position within sign for terms/faces
-        sign_degree = (
-            received_position.longitude - received_position.sign.start_degree
-        ) % 30
-
-        # 4. Terms (Egyptian terms)
-        try:
-            terms_table = getattr(
-                cfg().reception.terms, received_position.sign.sign_name
-            )
-            for term in terms_table:
-                if term.start <= sign_degree < term.end:
-                    if Planet[term.ruler.upper()] == receiving_planet:
-                        dignities.append("term")
-                    break
-        except AttributeError:
-            pass
-
-        # 5. Faces/Decans
-        try:
-            faces_table = getattr(
-                cfg().reception.faces, received_position.sign.sign_name
-            )
-            for face in faces_table:
-                if face.start <= sign_degree < face.end:
-                    if Planet[face.ruler.upper()] == receiving_planet:
-                        dignities.append("face")
-                    break
-        except AttributeError:
-            pass
-
-        return dignities
-
-    def _has_triplicity_dignity(self, planet: Planet, sign: Sign, is_day: bool) -> bool:
-        """Check if planet has triplicity dignity in sign"""
-        if sign not in self.triplicity_rulers:
-            return False
-
-        sect = "day" if is_day else "night"
-        return self.triplicity_rulers[sign][sect] == planet
+    def calculate_comprehensive_reception(
+        self, chart: HoraryChart, planet1: Planet, planet2: Planet
+    ) -> Dict[str, Any]:
+        """SINGLE SOURCE OF TRUTH for all reception calculations
+        Returns comprehensive reception data used by both reasoning and structured output."""
+        return self.reception_matrix(chart)[planet1, planet2]
 
     def _classify_reception(
         self,
@@ -261,20 +231,3 @@ class TraditionalReceptionCalculator:
                 return 1
             return 1
         return 1
-
-    def _calculate_house_position(self, longitude: float, houses: List[float]) -> int:
-        """Helper method for house calculation"""
-        longitude = longitude % 360
-
-        for i in range(12):
-            current_cusp = houses[i] % 360
-            next_cusp = houses[(i + 1) % 12] % 360
-
-            if current_cusp > next_cusp:  # Crosses 0°
-                if longitude >= current_cusp or longitude < next_cusp:
-                    return i + 1
-            else:
-                if current_cusp <= longitude < next_cusp:
-                    return i + 1
-
-        return 1
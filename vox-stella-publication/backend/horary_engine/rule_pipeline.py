@@ -0,0 +1,150 @@
+"""Staged judgment pipeline.
+
+A judgment is a sequence of rule stages run in traditional precedence
+order - radicality, the void Moon, significators, solar conditions,
+perfection, denial, the Moon's testimony and so on.  Each stage declares
+
+* the chart facts it reads (``inputs``), computed on first use and shared
+  by every later stage;
+* whether it may decide the judgment (``gating``): a gating stage returns
+  the verdict and the stages after it never run;
+* its relative cost, and optionally when it applies (``applies``).
+
+Because facts are only computed for the stages that actually run, the
+expensive ones - perfection timing on the event timeline, the Moon's
+testimony - are never paid for a judgment a cheaper gate has already
+decided.  Every stage and fact records its wall time in a per-request
+trace returned as the response's ``_rule_trace``.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+COST_CHEAP = "cheap"
+COST_MODERATE = "moderate"
+COST_EXPENSIVE = "expensive"
+
+OUTCOME_PASSED = "passed"
+OUTCOME_DECIDED = "decided"
+OUTCOME_SKIPPED = "skipped"
+
+
+@dataclass(frozen=True)
+class RuleStage:
+    """One step of the judgment."""
+    name: str
+    method: str                         # Engine method taking the JudgmentState
+    inputs: Tuple[str, ...] = ()        # Facts resolved before the stage runs
+    gating: bool = False                # May return the verdict
+    cost: str = COST_CHEAP
+    applies: Optional[Callable[["JudgmentState"], bool]] = None
+
+
+@dataclass(frozen=True)
+class RuleFact:
+    """A derived chart quantity shared between stages."""
+    name: str
+    method: str                         # Engine method taking the JudgmentState
+    cost: str = COST_CHEAP
+
+
+@dataclass
+class JudgmentState:
+    """Everything the stages of one judgment read and write."""
+    chart: Any
+    question_analysis: Dict[str, Any]
+    config: Any
+    confidence: float
+    ignore_radicality: bool = False
+    ignore_void_moon: bool = False
+    ignore_combustion: bool = False
+    ignore_saturn_7th: bool = False
+    exaltation_confidence_boost: float = 15.0
+    reasoning: List[str] = field(default_factory=list)
+    asc_penalty: float = 0
+    void_penalty: float = 0
+    querent: Any = None
+    quesited: Any = None
+    primary: Any = None                 # Pair whose perfection is judged
+    secondary: Any = None
+    notes: Dict[str, Any] = field(default_factory=dict)   # Stage-to-stage findings
+    facts: Dict[str, Any] = field(default_factory=dict)
+    trace: Dict[str, List[Dict[str, Any]]] = field(
+        default_factory=lambda: {"stages": [], "facts": []})
+    _resolve: Optional[Callable[[str], Any]] = field(default=None, repr=False)
+
+    def fact(self, name: str) -> Any:
+        """The named fact, computed on first use."""
+        if name not in self.facts:
+            self.facts[name] = self._resolve(name)
+        return self.facts[name]
+
+
+class RulePipeline:
+    """Runs stages in order against an owner object holding their methods."""
+
+    def __init__(self, stages: Sequence[RuleStage], facts: Sequence[RuleFact]) -> None:
+        self.stages = tuple(stages)
+        self.facts: Mapping[str, RuleFact] = {fact.name: fact for fact in facts}
+        names = [stage.name for stage in self.stages]
+        if len(set(names)) != len(names):
+            raise ValueError("Rule stage names must be unique")
+        for stage in self.stages:
+            unknown = [name for name in stage.inputs if name not in self.facts]
+            if unknown:
+                raise ValueError(f"Rule stage {stage.name} reads unknown facts: {', '.join(unknown)}")
+        if not self.stages or not self.stages[-1].gating:
+            raise ValueError("The last rule stage must decide the judgment")
+
+    def run(self, owner: Any, state: JudgmentState) -> Dict[str, Any]:
+        """Run the stages until one decides; the verdict carries the trace."""
+        started = time.perf_counter()
+        state._resolve = lambda name: self._compute_fact(owner, state, name)
+
+        for stage in self.stages:
+            if stage.applies is not None and not stage.applies(state):
+                self._record(state, stage, OUTCOME_SKIPPED, 0.0)
+                continue
+
+            stage_start = time.perf_counter()
+            for name in stage.inputs:
+                state.fact(name)
+            verdict = getattr(owner, stage.method)(state)
+            elapsed = time.perf_counter() - stage_start
+
+            if verdict is None:
+                self._record(state, stage, OUTCOME_PASSED, elapsed)
+                continue
+            if not stage.gating:
+                raise RuntimeError(f"Non-gating rule stage {stage.name} returned a verdict")
+            self._record(state, stage, OUTCOME_DECIDED, elapsed)
+            verdict["_rule_trace"] = {
+                "decided_by": stage.name,
+                "total_ms": round((time.perf_counter() - started) * 1000, 3),
+                **state.trace,
+            }
+            return verdict
+
+        raise RuntimeError("Judgment pipeline finished without a verdict")
+
+    def _compute_fact(self, owner: Any, state: JudgmentState, name: str) -> Any:
+        fact = self.facts[name]
+        fact_start = time.perf_counter()
+        value = getattr(owner, fact.method)(state)
+        state.trace["facts"].append({
+            "fact": name,
+            "cost": fact.cost,
+            "ms": round((time.perf_counter() - fact_start) * 1000, 3),
+        })
+        return value
+
+    @staticmethod
+    def _record(state: JudgmentState, stage: RuleStage, outcome: str, elapsed: float) -> None:
+        state.trace["stages"].append({
+            "stage": stage.name,
+            "cost": stage.cost,
+            "outcome": outcome,
+            "ms": round(elapsed * 1000, 3),
+        })
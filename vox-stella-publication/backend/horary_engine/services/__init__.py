@@ -1,5 +1,37 @@
 """Service utilities for the horary engine."""
 
-from .geolocation import TimezoneManager, LocationError, safe_geocode
+from .geolocation import (
+    TimezoneManager,
+    get_timezone_manager,
+    LocationError,
+    safe_geocode,
+    get_geocoder,
+    set_geocoder,
+    get_geocode_cache,
+    set_geocode_cache,
+    NominatimGeocoder,
+    ChainedGeocoder,
+)
+from .gazetteer import GazetteerGeocoder
+from .geocode_cache import GeocodeCache
+from .chart_store import ChartStore
+from .result_cache import ResultCache
+from .singleflight import SingleFlight
 
-__all__ = ["TimezoneManager", "LocationError", "safe_geocode"]
+__all__ = [
+    "TimezoneManager",
+    "get_timezone_manager",
+    "LocationError",
+    "safe_geocode",
+    "get_geocoder",
+    "set_geocoder",
+    "get_geocode_cache",
+    "set_geocode_cache",
+    "NominatimGeocoder",
+    "ChainedGeocoder",
+    "GazetteerGeocoder",
+    "GeocodeCache",
+    "ChartStore",
+    "ResultCache",
+    "SingleFlight",
+]
@@ -0,0 +1,40 @@
+"""Server-side store of computed charts, addressed by handle.
+
+A consultation often asks several questions about one moment and place.
+The chart for it is computed once and kept here under a handle derived
+from what determines it - the UTC instant, coordinates, place name,
+timezone and the judgment profile with its configuration hash - so the
+same inputs always give the same handle and later questions are judged
+against the stored chart without geocoding or recasting it.
+"""
+
+import datetime
+import hashlib
+
+from .result_cache import TTLCache
+
+DEFAULT_MAX_CHARTS = 256
+DEFAULT_CHART_TTL_SECONDS = 3600.0
+
+
+def chart_handle(dt_utc: datetime.datetime, lat: float, lon: float, location_name: str,
+                 timezone_name: str, profile: str, config_hash: str) -> str:
+    """Content-addressed id of the chart cast for these inputs."""
+    canonical = "|".join((
+        dt_utc.astimezone(datetime.timezone.utc).isoformat(timespec="microseconds"),
+        repr(float(lat)),
+        repr(float(lon)),
+        location_name,
+        timezone_name,
+        profile,
+        config_hash,
+    ))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:24]
+
+
+class ChartStore(TTLCache):
+    """Stored charts by handle; entries are shared between requests, not copied."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_CHARTS,
+                 ttl: float = DEFAULT_CHART_TTL_SECONDS, **kwargs) -> None:
+        super().__init__(max_entries, ttl, **kwargs)
@@ -0,0 +1,202 @@
+"""Offline place-name geocoding from a GeoNames-style dump.
+
+The dump (for example ``cities15000.txt`` from download.geonames.org) is
+loaded once into a SQLite index - in memory, or on disk so it can be shared
+and reused across restarts - and queried by normalized name.  A query such
+as ``"Paris, France"`` is split into a place name and qualifiers; the
+qualifiers are matched against country and first-level admin names and the
+most populous place that satisfies them wins.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import pytz
+
+
+logger = logging.getLogger(__name__)
+
+# GeoNames "geoname" table column positions
+_NAME, _ASCII_NAME, _ALT_NAMES = 1, 2, 3
+_LAT, _LON = 4, 5
+_FEATURE_CLASS = 6
+_COUNTRY, _ADMIN1 = 8, 10
+_POPULATION = 14
+
+# Common ways people write a country that are not its ISO name
+COUNTRY_ALIASES: Dict[str, str] = {
+    "usa": "US",
+    "us": "US",
+    "united states of america": "US",
+    "america": "US",
+    "uk": "GB",
+    "united kingdom": "GB",
+    "great britain": "GB",
+    "britain": "GB",
+    "england": "GB",
+    "scotland": "GB",
+    "wales": "GB",
+    "northern ireland": "GB",
+    "uae": "AE",
+    "russia": "RU",
+    "south korea": "KR",
+    "korea": "KR",
+    "north korea": "KP",
+    "iran": "IR",
+    "syria": "SY",
+    "vietnam": "VN",
+    "czech republic": "CZ",
+    "holland": "NL",
+}
+
+
+def normalize_place_name(text: str) -> str:
+    """Lower-case, strip accents and punctuation, collapse whitespace."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = re.sub(r"[^\w\s]", " ", text.lower())
+    return " ".join(text.split())
+
+
+class GazetteerGeocoder:
+    """Geocoder backed by a SQLite index built from a GeoNames dump."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._conn = connection
+        self._lock = threading.Lock()
+        self._country_names = {code: name for code, name in pytz.country_names.items()}
+        self._country_codes = {normalize_place_name(name): code for code, name in self._country_names.items()}
+        self._country_codes.update(COUNTRY_ALIASES)
+
+    @classmethod
+    def from_dump(cls, dump_path: str, db_path: Optional[str] = None,
+                  admin1_path: Optional[str] = None) -> "GazetteerGeocoder":
+        """Open ``db_path`` if it is already built, otherwise index ``dump_path``.
+
+        Args:
+            dump_path: GeoNames-format TSV (geonameid, name, asciiname, ...).
+            db_path: SQLite file to build/reuse; ``None`` keeps the index in memory.
+            admin1_path: Optional ``admin1CodesASCII.txt`` for region names.
+        """
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path or ":memory:", check_same_thread=False)
+        # The name index is created last, so its presence marks a complete build
+        built = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name='names_key'"
+        ).fetchone()
+        if not built:
+            cls._build(conn, dump_path, admin1_path)
+        return cls(conn)
+
+    @staticmethod
+    def _build(conn: sqlite3.Connection, dump_path: str, admin1_path: Optional[str]) -> None:
+        logger.info(f"Building gazetteer index from {dump_path}")
+        conn.executescript(
+            """
+            DROP TABLE IF EXISTS places;
+            DROP TABLE IF EXISTS names;
+            DROP TABLE IF EXISTS admin1;
+            CREATE TABLE places (
+                id INTEGER PRIMARY KEY, name TEXT, lat REAL, lon REAL,
+                country TEXT, admin1 TEXT, population INTEGER
+            );
+            CREATE TABLE names (key TEXT, place_id INTEGER);
+            CREATE TABLE admin1 (code TEXT PRIMARY KEY, name TEXT, key TEXT);
+            """
+        )
+
+        with open(dump_path, "r", encoding="utf-8") as handle:
+            places, names = [], []
+            for line in handle:
+                row = line.rstrip("\n").split("\t")
+                if len(row) <= _POPULATION or row[_FEATURE_CLASS] not in ("P", "A"):
+                    continue
+                place_id = int(row[0])
+                places.append((
+                    place_id, row[_NAME], float(row[_LAT]), float(row[_LON]),
+                    row[_COUNTRY], row[_ADMIN1], int(row[_POPULATION] or 0),
+                ))
+                keys = {normalize_place_name(row[_NAME]), normalize_place_name(row[_ASCII_NAME])}
+                keys.update(normalize_place_name(alt) for alt in row[_ALT_NAMES].split(",") if alt)
+                names.extend((key, place_id) for key in keys if key)
+            conn.executemany("INSERT INTO places VALUES (?, ?, ?, ?, ?, ?, ?)", places)
+            conn.executemany("INSERT INTO names VALUES (?, ?)", names)
+
+        if admin1_path and Path(admin1_path).exists():
+            with open(admin1_path, "r", encoding="utf-8") as handle:
+                rows = [line.rstrip("\n").split("\t") for line in handle]
+            conn.executemany(
+                "INSERT OR REPLACE INTO admin1 VALUES (?, ?, ?)",
+                [(row[0], row[1], normalize_place_name(row[1])) for row in rows if len(row) >= 2],
+            )
+
+        conn.execute("CREATE INDEX names_key ON names (key)")
+        conn.commit()
+        logger.info(f"Gazetteer index ready: {len(places)} places")
+
+    def geocode(self, location_string: str, timeout: Optional[float] = None) -> Optional[Tuple[float, float, str]]:
+        """Look up ``"Place[, Region][, Country]"``.
+
+        Returns:
+            (latitude, longitude, address) or None when nothing matches.
+            ``timeout`` is accepted for interface parity and ignored.
+        """
+        parts = [normalize_place_name(part) for part in location_string.split(",")]
+        parts = [part for part in parts if part]
+        if not parts:
+            return None
+        place, qualifiers = parts[0], parts[1:]
+
+        with self._lock:
+            candidates = self._conn.execute(
+                "SELECT DISTINCT p.id, p.name, p.lat, p.lon, p.country, p.admin1, p.population "
+                "FROM names n JOIN places p ON p.id = n.place_id WHERE n.key = ?",
+                (place,),
+            ).fetchall()
+            if not candidates:
+                return None
+            admin_names = self._admin1_names({(c[4], c[5]) for c in candidates})
+
+        def score(candidate) -> Tuple[int, int]:
+            matched = sum(
+                1 for qualifier in qualifiers
+                if self._matches(qualifier, candidate[4], admin_names.get((candidate[4], candidate[5])))
+            )
+            return matched, candidate[6]
+
+        best = max(candidates, key=score)
+        if qualifiers and score(best)[0] == 0:
+            return None
+
+        _, name, lat, lon, country, admin1, _ = best
+        address = [name]
+        region = admin_names.get((country, admin1))
+        if region and normalize_place_name(region) != normalize_place_name(name):
+            address.append(region)
+        address.append(self._country_names.get(country, country))
+        return (lat, lon, ", ".join(address))
+
+    def _matches(self, qualifier: str, country: str, region: Optional[str]) -> bool:
+        if self._country_codes.get(qualifier) == country or qualifier == country.lower():
+            return True
+        return region is not None and normalize_place_name(region) == qualifier
+
+    def _admin1_names(self, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+        names = {}
+        for country, admin1 in keys:
+            row = self._conn.execute(
+                "SELECT name FROM admin1 WHERE code = ?", (f"{country}.{admin1}",)
+            ).fetchone()
+            if row:
+                names[(country, admin1)] = row[0]
+        return names
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM places").fetchone()[0]
@@ -0,0 +1,133 @@
+"""Persistent geocode cache shared by every worker process.
+
+Results of ``safe_geocode`` are stored in a SQLite database in WAL mode, so
+all gunicorn workers read and write the same cache without blocking each
+other.  Keys are canonicalized location strings, successful lookups live for
+``ttl`` seconds and "Location not found" answers are cached as negative
+entries for ``negative_ttl`` seconds.  Expired entries are not deleted
+straight away: they are revalidated against the upstream geocoder and, if
+that times out or is unavailable, served stale instead of failing.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from .gazetteer import normalize_place_name
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_NEGATIVE_TTL_SECONDS = 24 * 3600
+
+
+def canonical_location_key(location_string: str) -> str:
+    """Canonical cache key: case, accents, whitespace and punctuation folded.
+
+    Commas are kept as separators because they change what the geocoder
+    matches ("Paris, Texas" vs "Paris Texas").
+    """
+    parts = (normalize_place_name(part) for part in location_string.split(","))
+    return ",".join(part for part in parts if part)
+
+
+class CacheEntry(NamedTuple):
+    result: Optional[Tuple[float, float, str]]  # None for a negative entry
+    fresh: bool
+
+
+class GeocodeCache:
+    """SQLite-backed TTL cache of ``(lat, lon, address)`` lookups."""
+
+    def __init__(self, path: str, ttl: float = DEFAULT_TTL_SECONDS,
+                 negative_ttl: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+                 serve_stale: bool = True):
+        self.path = str(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.serve_stale = serve_stale
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.stale_served = 0
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            " key TEXT PRIMARY KEY, lat REAL, lon REAL, address TEXT, stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, location_string: str) -> Optional[CacheEntry]:
+        """Return the cached entry (fresh or expired) or None if never seen."""
+        key = canonical_location_key(location_string)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT lat, lon, address, stored_at FROM geocode WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            lat, lon, address, stored_at = row
+            result = None if address is None else (lat, lon, address)
+            ttl = self.ttl if result is not None else self.negative_ttl
+            fresh = time.time() - stored_at < ttl
+            if not fresh:
+                self.misses += 1
+            elif result is None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return CacheEntry(result, fresh)
+
+    def put(self, location_string: str, result: Optional[Tuple[float, float, str]]) -> None:
+        """Store a lookup result; ``None`` records a "not found" answer."""
+        key = canonical_location_key(location_string)
+        lat, lon, address = result if result is not None else (None, None, None)
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?, ?)",
+                    (key, lat, lon, address, time.time()),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:  # pragma: no cover - disk full / locked
+            logger.warning(f"Could not store geocode cache entry for '{key}': {e}")
+
+    def record_stale(self) -> None:
+        with self._lock:
+            self.stale_served += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM geocode")
+            self._conn.commit()
+            self.hits = self.misses = self.negative_hits = self.stale_served = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters are per process; size is shared by all workers."""
+        with self._lock:
+            size, negative = self._conn.execute(
+                "SELECT COUNT(*), COUNT(*) - COUNT(address) FROM geocode"
+            ).fetchone()
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "stale_served": self.stale_served,
+                "hit_rate": round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0,
+                "size": size,
+                "negative_entries": negative,
+                "path": self.path,
+            }
@@ -1,5 +1,10 @@
 import logging
-from typing import Optional, Tuple
+import math
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 import datetime
 import pytz
@@ -18,21 +23,193 @@ except ImportError:  # pragma: no cover
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
 
+from .geocode_cache import canonical_location_key
+from .singleflight import SingleFlight
+
 
 logger = logging.getLogger(__name__)
 
+# (lat_min, lat_max, lon_min, lon_max) -> zone that must win inside the box
+GEOGRAPHIC_VALIDATIONS = {
+    (29.5, 33.5, 34.0, 36.0): "Asia/Jerusalem",
+}
+
+DEFAULT_TIMEZONE_GRID_DEGREES = 0.05
+DEFAULT_TIMEZONE_CACHE_SIZE = 4096
+# Points per side of a grid cell checked before caching it: corners, edge
+# midpoints and centre
+TIMEZONE_CELL_SAMPLES = 3
+
+# Marks a grid cell whose zone is not uniform, so lookups inside it bypass the cache
+_BORDER_CELL = object()
+
 
 class LocationError(Exception):
     """Custom exception for geocoding failures."""
     pass
 
 
+class NominatimGeocoder:
+    """Remote geocoding through OpenStreetMap Nominatim (one shared client)."""
+
+    def __init__(self, user_agent: str = "horary_astrology_precise") -> None:
+        self.client = Nominatim(user_agent=user_agent)
+
+    def geocode(self, location_string: str, timeout: Optional[float] = 10) -> Optional[Tuple[float, float, str]]:
+        location = self.client.geocode(location_string, timeout=timeout)
+        if location is None:
+            return None
+        return (location.latitude, location.longitude, location.address)
+
+
+class ChainedGeocoder:
+    """Try each backend in order and return the first match."""
+
+    def __init__(self, *backends) -> None:
+        self.backends = list(backends)
+
+    def geocode(self, location_string: str, timeout: Optional[float] = 10) -> Optional[Tuple[float, float, str]]:
+        for backend in self.backends:
+            result = backend.geocode(location_string, timeout=timeout)
+            if result is not None:
+                return result
+        return None
+
+
+def build_geocoder():
+    """Build the geocoder described by the environment.
+
+    ``HORARY_GEOCODER`` selects the backend:
+
+    * ``nominatim`` - remote lookups only (the default when no gazetteer is configured)
+    * ``gazetteer`` - local lookups only; works with no network
+    * ``auto`` - local gazetteer first, Nominatim for places it does not know
+
+    The gazetteer is a GeoNames-format dump at ``HORARY_GAZETTEER_PATH``,
+    indexed into ``HORARY_GAZETTEER_DB`` (in memory when unset), with region
+    names from ``HORARY_GAZETTEER_ADMIN1`` when given.
+    """
+    mode = os.environ.get("HORARY_GEOCODER", "auto").strip().lower()
+    dump_path = os.environ.get("HORARY_GAZETTEER_PATH")
+
+    if mode not in ("auto", "gazetteer", "nominatim"):
+        raise LocationError(f"Unknown geocoder backend: {mode}")
+    if mode == "nominatim":
+        return NominatimGeocoder()
+
+    gazetteer = None
+    if dump_path:
+        from .gazetteer import GazetteerGeocoder
+
+        try:
+            gazetteer = GazetteerGeocoder.from_dump(
+                dump_path,
+                db_path=os.environ.get("HORARY_GAZETTEER_DB") or None,
+                admin1_path=os.environ.get("HORARY_GAZETTEER_ADMIN1") or None,
+            )
+        except (OSError, ValueError, sqlite3.Error) as e:
+            if mode == "gazetteer":
+                raise LocationError(f"Gazetteer could not be loaded from {dump_path}: {e}")
+            logger.error(f"Gazetteer could not be loaded from {dump_path}, using Nominatim only: {e}")
+    elif mode == "gazetteer":
+        raise LocationError("HORARY_GAZETTEER_PATH must be set to use the gazetteer geocoder")
+
+    if gazetteer is None:
+        return NominatimGeocoder()
+    if mode == "gazetteer":
+        return gazetteer
+    return ChainedGeocoder(gazetteer, NominatimGeocoder())
+
+
+_geocoder = None
+_geocoder_lock = threading.Lock()
+
+
+def get_geocoder():
+    """Return the process-wide geocoder, building it on first use."""
+    global _geocoder
+    if _geocoder is None:
+        with _geocoder_lock:
+            if _geocoder is None:
+                _geocoder = build_geocoder()
+    return _geocoder
+
+
+def set_geocoder(geocoder) -> None:
+    """Install a geocoder (anything with ``geocode(location, timeout)``); ``None`` rebuilds from the environment."""
+    global _geocoder
+    with _geocoder_lock:
+        _geocoder = geocoder
+
+
+_geocode_cache = None
+_geocode_cache_built = False
+
+geocode_flight = SingleFlight("geocode")
+
+
+def build_geocode_cache():
+    """Build the shared geocode cache described by the environment.
+
+    ``HORARY_GEOCODE_CACHE`` is the SQLite file (``off`` disables caching;
+    default ``cache/geocode_cache.sqlite3`` under the backend directory).
+    ``HORARY_GEOCODE_CACHE_TTL`` and ``HORARY_GEOCODE_NEGATIVE_TTL`` are in
+    seconds and ``HORARY_GEOCODE_SERVE_STALE=0`` stops expired entries from
+    being served when the upstream geocoder is unreachable.
+    """
+    from .geocode_cache import (
+        DEFAULT_NEGATIVE_TTL_SECONDS,
+        DEFAULT_TTL_SECONDS,
+        GeocodeCache,
+    )
+
+    path = os.environ.get("HORARY_GEOCODE_CACHE", "cache/geocode_cache.sqlite3").strip()
+    if path.lower() in ("", "off", "none", "0", "false"):
+        return None
+    if path != ":memory:" and not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), path)
+
+    try:
+        return GeocodeCache(
+            path,
+            ttl=float(os.environ.get("HORARY_GEOCODE_CACHE_TTL", DEFAULT_TTL_SECONDS)),
+            negative_ttl=float(os.environ.get("HORARY_GEOCODE_NEGATIVE_TTL", DEFAULT_NEGATIVE_TTL_SECONDS)),
+            serve_stale=os.environ.get("HORARY_GEOCODE_SERVE_STALE", "1").lower() not in ("0", "false", "no"),
+        )
+    except (OSError, ValueError, sqlite3.Error) as e:
+        logger.error(f"Geocode cache disabled, could not open {path}: {e}")
+        return None
+
+
+def get_geocode_cache():
+    """Return the process-wide geocode cache (None when disabled)."""
+    global _geocode_cache, _geocode_cache_built
+    if not _geocode_cache_built:
+        with _geocoder_lock:
+            if not _geocode_cache_built:
+                _geocode_cache = build_geocode_cache()
+                _geocode_cache_built = True
+    return _geocode_cache
+
+
+def set_geocode_cache(cache, enabled: bool = True) -> None:
+    """Install a geocode cache; ``None`` rebuilds from the environment unless ``enabled`` is False."""
+    global _geocode_cache, _geocode_cache_built
+    with _geocoder_lock:
+        _geocode_cache = cache
+        _geocode_cache_built = cache is not None or not enabled
+
+
 def safe_geocode(location_string: str, timeout: int = 10) -> Tuple[float, float, str]:
     """Geocode a location string with fail-fast behaviour.
 
+    Lookups go through the shared geocode cache first; an expired entry is
+    served stale if the upstream geocoder times out or is unavailable.
+    Concurrent lookups of the same place share one upstream request.
+
     Args:
         location_string: Location to geocode.
-        timeout: Timeout in seconds.
+        timeout: Timeout in seconds for remote backends.
 
     Returns:
         Tuple of (latitude, longitude, full_address).
@@ -40,15 +217,35 @@ def safe_geocode(location_string: str, timeout: int = 10) -> Tuple[float, float,
     Raises:
         LocationError: If geocoding fails or the library is unavailable.
     """
+    cache = get_geocode_cache()
+    cached = cache.get(location_string) if cache is not None else None
+    if cached is not None and cached.fresh:
+        if cached.result is None:
+            raise LocationError(
+                f"Location not found: '{location_string}'. Please provide a more specific location."
+            )
+        return cached.result
+
     try:
-        geolocator = Nominatim(user_agent="horary_astrology_precise")
-        location = geolocator.geocode(location_string, timeout=timeout)
+        def lookup():
+            result = get_geocoder().geocode(location_string, timeout=timeout)
+            if cache is not None:
+                cache.put(location_string, result)
+            return result
+
+        location = geocode_flight.do(canonical_location_key(location_string), lookup)
         if location is None:
             raise LocationError(
                 f"Location not found: '{location_string}'. Please provide a more specific location."
             )
-        return (location.latitude, location.longitude, location.address)
+        return location
+    except LocationError:
+        raise
     except (GeocoderTimedOut, GeocoderUnavailable) as e:
+        if cached is not None and cached.result is not None and cache.serve_stale:
+            logger.warning(f"Geocoder unavailable, serving stale cache entry for '{location_string}': {e}")
+            cache.record_stale()
+            return cached.result
         raise LocationError(f"Geocoding service unavailable: {e}")
     except ImportError:
         raise LocationError("Geocoding library not available. Please install geopy.")
@@ -57,13 +254,38 @@ def safe_geocode(location_string: str, timeout: int = 10) -> Tuple[float, float,
 
 
 class TimezoneManager:
-    """Handles timezone operations for horary calculations."""
+    """Handles timezone operations for horary calculations.
+
+    Construction loads the timezone polygon data, so the application shares a
+    single instance through ``get_timezone_manager()``.  ``in_memory`` reads
+    the polygon data into memory up front instead of from the package files
+    on demand; ``data_dir`` points TimezoneFinder at a different data set.
+    """
+
+    def __init__(self, in_memory: bool = False, data_dir: Optional[str] = None,
+                 grid_degrees: float = DEFAULT_TIMEZONE_GRID_DEGREES,
+                 cache_size: int = DEFAULT_TIMEZONE_CACHE_SIZE) -> None:
+        # TimezoneFinder reads its data through shared file handles, so
+        # lookups from concurrent request threads are serialized.
+        self._tf_lock = threading.Lock()
+
+        # Resolved zone names keyed on coordinates snapped to the grid;
+        # ``grid_degrees <= 0`` or ``cache_size <= 0`` disables the cache.
+        self.grid_degrees = grid_degrees
+        self.cache_size = cache_size
+        self._cells: "OrderedDict[Tuple[int, int], object]" = OrderedDict()
+        self._cells_lock = threading.Lock()
+        self._zones: Dict[str, datetime.tzinfo] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.border_bypasses = 0
 
-    def __init__(self) -> None:
         if TIMEZONEFINDER_AVAILABLE:
             try:
-                self.tf = TimezoneFinder()
-                logger.info("TimezoneFinder initialized successfully")
+                self.tf = TimezoneFinder(bin_file_location=data_dir, in_memory=in_memory)
+                logger.info(
+                    f"TimezoneFinder initialized successfully ({'in-memory' if in_memory else 'file-backed'})"
+                )
             except Exception as e:  # pragma: no cover - initialization failure
                 logger.error(f"Failed to initialize TimezoneFinder: {e}")
                 self.tf = None
@@ -80,14 +302,103 @@ class TimezoneManager:
             logger.error(f"Failed to initialize Geolocator: {e}")
             self.geolocator = None
 
+    def timezone_at(self, lat: float, lon: float) -> Optional[str]:
+        """Raw TimezoneFinder lookup (no validation or fallback)."""
+        if self.tf is None:
+            return None
+        with self._tf_lock:
+            return self.tf.timezone_at(lat=lat, lng=lon)
+
+    def get_zone(self, timezone_str: str) -> datetime.tzinfo:
+        """Return the (cached) tzinfo for a zone name; raises if the name is unknown."""
+        zone = self._zones.get(timezone_str)
+        if zone is None:
+            zone = ZoneInfo(timezone_str) if ZoneInfo else pytz.timezone(timezone_str)
+            self._zones[timezone_str] = zone
+        return zone
+
+    def _grid_key(self, lat: float, lon: float) -> Optional[Tuple[int, int]]:
+        if self.grid_degrees <= 0 or self.cache_size <= 0:
+            return None
+        return (math.floor(lat / self.grid_degrees), math.floor(lon / self.grid_degrees))
+
+    def _cell_is_uniform(self, key: Tuple[int, int], timezone_str: str) -> bool:
+        """True when the whole grid cell resolves to ``timezone_str``.
+
+        The cell must not cross a validation box edge, and a grid of points
+        over it (``TIMEZONE_CELL_SAMPLES`` per side, so its corners, edge
+        midpoints and centre) must all resolve to the same validated zone
+        as the queried point. A border crossing one edge twice, or an
+        enclave, is caught when it reaches a sample point.
+        """
+        lat0, lon0 = key[0] * self.grid_degrees, key[1] * self.grid_degrees
+        lat1, lon1 = lat0 + self.grid_degrees, lon0 + self.grid_degrees
+
+        for lat_min, lat_max, lon_min, lon_max in GEOGRAPHIC_VALIDATIONS:
+            overlaps = lat0 <= lat_max and lat1 >= lat_min and lon0 <= lon_max and lon1 >= lon_min
+            inside = lat_min <= lat0 and lat1 <= lat_max and lon_min <= lon0 and lon1 <= lon_max
+            if overlaps and not inside:
+                return False
+
+        steps = [i / (TIMEZONE_CELL_SAMPLES - 1) for i in range(TIMEZONE_CELL_SAMPLES)]
+        for lat in (lat0 + f * self.grid_degrees for f in steps):
+            for lon in (lon0 + f * self.grid_degrees for f in steps):
+                sample_tz = self.timezone_at(lat, lon)
+                if sample_tz is None or self._validate_timezone_for_coordinates(sample_tz, lat, lon) != timezone_str:
+                    return False
+        return True
+
+    def _remember_cell(self, key: Tuple[int, int], timezone_str: str) -> None:
+        value = timezone_str if self._cell_is_uniform(key, timezone_str) else _BORDER_CELL
+        with self._cells_lock:
+            self._cells[key] = value
+            self._cells.move_to_end(key)
+            while len(self._cells) > self.cache_size:
+                self._cells.popitem(last=False)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        with self._cells_lock:
+            lookups = self.cache_hits + self.cache_misses + self.border_bypasses
+            return {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "border_bypasses": self.border_bypasses,
+                "hit_rate": round(self.cache_hits / lookups, 4) if lookups else 0.0,
+                "size": len(self._cells),
+                "maxsize": self.cache_size,
+                "grid_degrees": self.grid_degrees,
+                "zones": len(self._zones),
+            }
+
+    def warm(self) -> None:
+        """Touch the polygon data once so the first request does not pay for it."""
+        self.timezone_at(51.5074, -0.1278)
+
     def get_timezone_for_location(self, lat: float, lon: float) -> Optional[str]:
         """Get timezone string for given coordinates with enhanced debugging."""
+        key = self._grid_key(lat, lon)
+        if key is not None:
+            with self._cells_lock:
+                cached = self._cells.get(key)
+                if cached is None:
+                    self.cache_misses += 1
+                elif cached is _BORDER_CELL:
+                    self.border_bypasses += 1
+                else:
+                    self._cells.move_to_end(key)
+                    self.cache_hits += 1
+            if isinstance(cached, str):
+                logger.debug(f"Timezone cache hit for {lat}, {lon}: {cached}")
+                return cached
+        else:
+            cached = None
+
         logger.info(f"=== TIMEZONE DETECTION STARTED for {lat}, {lon} ===")
 
         try:
             if self.tf is not None:
                 logger.info("Using TimezoneFinder library")
-                timezone_result = self.tf.timezone_at(lat=lat, lng=lon)
+                timezone_result = self.timezone_at(lat, lon)
                 logger.info(f"TimezoneFinder raw result: {timezone_result}")
 
                 if timezone_result:
@@ -99,6 +410,8 @@ class TimezoneManager:
                         logger.info(
                             f"=== FINAL TIMEZONE: {validated_tz} (after validation) ==="
                         )
+                        if key is not None and cached is None:
+                            self._remember_cell(key, validated_tz)
                         return validated_tz
             else:
                 logger.info(
@@ -136,11 +449,7 @@ class TimezoneManager:
             f"TIMEZONE VALIDATION: Checking {timezone_str} for coordinates {lat}, {lon}"
         )
 
-        geographic_validations = {
-            (29.5, 33.5, 34.0, 36.0): "Asia/Jerusalem",
-        }
-
-        for (lat_min, lat_max, lon_min, lon_max), expected_tz in geographic_validations.items():
+        for (lat_min, lat_max, lon_min, lon_max), expected_tz in GEOGRAPHIC_VALIDATIONS.items():
             if lat_min <= lat <= lat_max and lon_min <= lon <= lon_max:
                 logger.info(
                     f"COORDINATE MATCH: {lat},{lon} falls in range {lat_min}-{lat_max}, {lon_min}-{lon_max}"
@@ -172,7 +481,7 @@ class TimezoneManager:
                     logger.warning(
                         f"TIMEZONE OVERRIDE: Suspicious combination {lat},{lon} with timezone {timezone_str}"
                     )
-                    return geographic_validations.get(
+                    return GEOGRAPHIC_VALIDATIONS.get(
                         (29.5, 33.5, 34.0, 36.0), timezone_str
                     )
 
@@ -203,10 +512,7 @@ class TimezoneManager:
             logger.error(f"Fallback timezone detection failed: {e}")
 
         try:
-            from timezonefinder import TimezoneFinderL
-
-            tf = TimezoneFinder()
-            return tf.timezone_at(lat=lat, lng=lon)
+            return self.timezone_at(lat, lon)
         except Exception:
             return None
 
@@ -251,10 +557,7 @@ class TimezoneManager:
 
         if timezone_str:
             try:
-                if ZoneInfo:
-                    tz = ZoneInfo(timezone_str)
-                else:
-                    tz = pytz.timezone(timezone_str)
+                tz = self.get_zone(timezone_str)
                 timezone_used = timezone_str
             except Exception:
                 tz = pytz.UTC
@@ -263,10 +566,7 @@ class TimezoneManager:
             tz_str = self.get_timezone_for_location(lat, lon)
             if tz_str:
                 try:
-                    if ZoneInfo:
-                        tz = ZoneInfo(tz_str)
-                    else:
-                        tz = pytz.timezone(tz_str)
+                    tz = self.get_zone(tz_str)
                     timezone_used = tz_str
                 except Exception:
                     tz = pytz.UTC
@@ -309,10 +609,7 @@ class TimezoneManager:
 
         if tz_str:
             try:
-                if ZoneInfo:
-                    tz = ZoneInfo(tz_str)
-                else:
-                    tz = pytz.timezone(tz_str)
+                tz = self.get_zone(tz_str)
                 timezone_used = tz_str
             except Exception:
                 tz = pytz.UTC
@@ -325,3 +622,31 @@ class TimezoneManager:
         local_now = utc_now.astimezone(tz)
 
         return local_now, utc_now, timezone_used
+
+
+_timezone_manager: Optional[TimezoneManager] = None
+_timezone_manager_lock = threading.Lock()
+
+
+def get_timezone_manager() -> TimezoneManager:
+    """Return the process-wide ``TimezoneManager``, creating and warming it on first use.
+
+    ``HORARY_TIMEZONE_IN_MEMORY=1`` loads the polygon data into memory and
+    ``HORARY_TIMEZONE_DATA`` selects an alternative TimezoneFinder data
+    directory.  ``HORARY_TIMEZONE_GRID`` (degrees, 0 disables) and
+    ``HORARY_TIMEZONE_CACHE_SIZE`` size the lookup cache.  When gunicorn preloads the app this runs once in the master
+    and the workers share the loaded data.
+    """
+    global _timezone_manager
+    if _timezone_manager is None:
+        with _timezone_manager_lock:
+            if _timezone_manager is None:
+                manager = TimezoneManager(
+                    in_memory=os.environ.get("HORARY_TIMEZONE_IN_MEMORY", "0").lower() in ("1", "true", "yes"),
+                    data_dir=os.environ.get("HORARY_TIMEZONE_DATA") or None,
+                    grid_degrees=float(os.environ.get("HORARY_TIMEZONE_GRID", DEFAULT_TIMEZONE_GRID_DEGREES)),
+                    cache_size=int(os.environ.get("HORARY_TIMEZONE_CACHE_SIZE", DEFAULT_TIMEZONE_CACHE_SIZE)),
+                )
+                manager.warm()
+                _timezone_manager = manager
+    return _timezone_manager
@@ -0,0 +1,140 @@
+"""In-process cache of complete judgment results.
+
+Re-submitted forms, page refreshes and shared links ask the same question
+about the same moment and place again.  ``ResultCache`` keeps the finished
+``judge`` responses in a bounded LRU with a time-to-live, keyed on the
+canonical request (see ``result_cache_key``): the UTC minute of the chart,
+the coordinates rounded to a few metres, the normalized question, the
+override flags and reception weighting, and the judgment profile with its
+configuration hash.
+
+"Now" requests are cached per time bucket: every request in the same
+bucket gets the chart cast at the first one.  Results are copied in and
+out, so callers may annotate the response they are given.
+"""
+
+import copy
+import datetime
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL_SECONDS = 600.0
+DEFAULT_COORDINATE_DECIMALS = 4     # about 11 m
+
+
+def canonical_question(question: str) -> str:
+    """Question text with case and runs of whitespace folded."""
+    return " ".join(question.casefold().split())
+
+
+def result_cache_key(question: str, dt_utc: datetime.datetime, use_current_time: bool,
+                     lat: float, lon: float, location_name: str, timezone_name: str,
+                     override_flags: Tuple[bool, ...], manual_houses: Optional[Sequence[int]],
+                     exaltation_confidence_boost: float, profile: str, config_hash: str,
+                     current_time_bucket: float = 0,
+                     coordinate_decimals: int = DEFAULT_COORDINATE_DECIMALS) -> Optional[Hashable]:
+    """Canonical key of a judgment request, or None if it must not be cached.
+
+    Explicit times are keyed on their UTC minute; "now" requests on the
+    ``current_time_bucket``-second window they fall in (not cached when the
+    bucket is 0).
+    """
+    if use_current_time:
+        if current_time_bucket <= 0:
+            return None
+        moment: Tuple[Any, ...] = ("now", current_time_bucket,
+                                   int(dt_utc.timestamp() // current_time_bucket))
+    else:
+        moment = ("at", dt_utc.astimezone(datetime.timezone.utc)
+                  .replace(second=0, microsecond=0).isoformat())
+    return (
+        moment,
+        round(lat, coordinate_decimals),
+        round(lon, coordinate_decimals),
+        location_name,
+        timezone_name,
+        canonical_question(question),
+        tuple(bool(flag) for flag in override_flags),
+        tuple(manual_houses) if manual_houses else None,
+        exaltation_confidence_boost,
+        profile,
+        config_hash,
+    )
+
+
+class TTLCache:
+    """Thread-safe LRU with a time-to-live; values are stored as given."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl: float = DEFAULT_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Any:
+        """The value stored under ``key``, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[0] >= self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value``, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+            }
+
+
+class ResultCache(TTLCache):
+    """Judgment results, copied in and out."""
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """A copy of the cached result for ``key``, or None."""
+        result = super().get(key)
+        return copy.deepcopy(result) if result is not None else None
+
+    def put(self, key: Hashable, result: Dict[str, Any]) -> None:
+        """Store a copy of ``result``."""
+        super().put(key, copy.deepcopy(result))
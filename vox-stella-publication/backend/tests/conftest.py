@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+LONDON = (51.5074, -0.1278, "London")
+
+
+@pytest.fixture
+def london_geocode(monkeypatch):
+    """Geocode every location to London, without a network lookup."""
+    import horary_engine.engine as engine_module
+    monkeypatch.setattr(engine_module, "safe_geocode", lambda location, timeout=10: LONDON)
+    return LONDON
@@ -0,0 +1,40 @@
+"""Builders and ephemeris checks shared by the test modules."""
+
+import swisseph as swe
+
+from models import Planet, PlanetPosition, Sign
+
+
+PLANET_IDS = {
+    Planet.SUN: swe.SUN,
+    Planet.MOON: swe.MOON,
+    Planet.MERCURY: swe.MERCURY,
+    Planet.VENUS: swe.VENUS,
+    Planet.MARS: swe.MARS,
+    Planet.JUPITER: swe.JUPITER,
+    Planet.SATURN: swe.SATURN,
+}
+
+
+def make_planet_position(planet, lon, speed, retrograde=None):
+    """A position with only longitude and speed set; retrograde follows the speed by default."""
+    return PlanetPosition(
+        planet=planet,
+        longitude=lon,
+        latitude=0.0,
+        house=1,
+        sign=Sign.ARIES,
+        dignity_score=0,
+        retrograde=speed < 0 if retrograde is None else retrograde,
+        speed=speed,
+    )
+
+
+def longitude(jd, body):
+    data, _ = swe.calc_ut(jd, body, swe.FLG_SWIEPH)
+    return data[0]
+
+
+def arc_to(angle, target):
+    """Distance from ``angle`` to ``target`` or its mirror, in degrees."""
+    return min(abs((angle - t + 180) % 360 - 180) for t in (target, -target))
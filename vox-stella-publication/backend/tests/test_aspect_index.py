@@ -0,0 +1,67 @@
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from models import Aspect, AspectInfo, Planet
+from horary_engine.aspect_index import AspectIndex, attach_aspect_index, chart_aspect_index
+
+
+def make_aspect(planet1, planet2, aspect, applying):
+    return AspectInfo(
+        planet1=planet1,
+        planet2=planet2,
+        aspect=aspect,
+        orb=1.0,
+        applying=applying,
+        degrees_to_exact=1.0,
+    )
+
+
+ASPECTS = [
+    make_aspect(Planet.SUN, Planet.MOON, Aspect.TRINE, True),
+    make_aspect(Planet.MOON, Planet.MARS, Aspect.SQUARE, False),
+    make_aspect(Planet.VENUS, Planet.SUN, Aspect.CONJUNCTION, False),
+    make_aspect(Planet.MARS, Planet.SATURN, Aspect.OPPOSITION, True),
+    make_aspect(Planet.JUPITER, Planet.MOON, Aspect.SEXTILE, True),
+]
+
+
+def linear_between(planet1, planet2):
+    for aspect in ASPECTS:
+        if {aspect.planet1, aspect.planet2} == {planet1, planet2}:
+            return aspect
+    return None
+
+
+def test_lookups_match_linear_scans():
+    index = AspectIndex(ASPECTS)
+
+    for planet1 in Planet:
+        for planet2 in Planet:
+            if planet1 == planet2:
+                continue
+            expected = linear_between(planet1, planet2)
+            assert index.between(planet1, planet2) is expected
+            assert index.between(planet1, planet2, applying=True) is (
+                expected if expected is not None and expected.applying else None)
+
+        assert index.involving(planet1) == [
+            a for a in ASPECTS if planet1 in (a.planet1, a.planet2)]
+
+    assert index.applying(Planet.SUN, Planet.MARS) == [ASPECTS[0], ASPECTS[3]]
+    assert index.separating(Planet.MOON) == [ASPECTS[1]]
+    assert index.applying() == [a for a in ASPECTS if a.applying]
+    assert index.involving(Planet.MOON, Planet.VENUS, applying=False) == [ASPECTS[1], ASPECTS[2]]
+
+
+def test_chart_index_follows_replaced_aspects():
+    chart = SimpleNamespace(aspects=list(ASPECTS))
+    index = attach_aspect_index(chart)
+    assert chart_aspect_index(chart) is index
+
+    chart.aspects = ASPECTS[:1]
+    rebuilt = chart_aspect_index(chart)
+    assert rebuilt is not index
+    assert rebuilt.between(Planet.MOON, Planet.MARS) is None
@@ -0,0 +1,65 @@
+import math
+import random
+
+import pytest
+
+from models import Planet
+from horary_engine.aspects import calculate_enhanced_aspects, calculate_enhanced_aspects_batch
+from horary_engine.calculation import aspect_kernel
+from horary_engine.calculation.helpers import days_to_sign_exit
+from helpers import make_planet_position
+
+
+def random_chart(rng):
+    planets = {}
+    for planet in Planet:
+        if rng.random() < 0.2:
+            lon = rng.randrange(12) * 30.0  # exactly on a sign boundary
+        else:
+            lon = rng.uniform(0, 360)
+        speed = rng.choice([0.0, 0.0005, rng.uniform(-1.5, 1.5), rng.uniform(11, 15)])
+        planets[planet] = make_planet_position(planet, lon, speed)
+    return planets
+
+
+def test_batch_matches_single_chart():
+    rng = random.Random(17)
+    charts = [random_chart(rng) for _ in range(300)]
+    jds = [2460000.5 + i * 0.37 for i in range(len(charts))]
+
+    batch = calculate_enhanced_aspects_batch(charts, jds)
+    assert len(batch) == len(charts)
+    assert any(batch)
+    for planets, jd_ut, aspects in zip(charts, jds, batch):
+        assert aspects == calculate_enhanced_aspects(planets, jd_ut)
+
+
+def test_batch_groups_by_planet_set():
+    rng = random.Random(3)
+    full = [random_chart(rng) for _ in range(3)]
+    partial = {p: full[0][p] for p in (Planet.SUN, Planet.MOON, Planet.MARS)}
+    charts = [full[0], partial, full[1], full[2]]
+    jds = [2460000.5] * len(charts)
+
+    batch = calculate_enhanced_aspects_batch(charts, jds)
+    for planets, aspects in zip(charts, batch):
+        assert aspects == calculate_enhanced_aspects(planets, 2460000.5)
+
+    with pytest.raises(ValueError):
+        calculate_enhanced_aspects_batch(charts, jds[:1])
+
+
+def test_days_to_sign_exit_matches_helper():
+    longitudes = [0.0, 29.999, 30.0, 59.5, 330.0, 359.9, 123.4, 240.0]
+    speeds = [1.0, -1.0, 0.0, 13.2, -0.4, 0.0005, -0.002, 0.9]
+    pairs = [(lon, speed) for lon in longitudes for speed in speeds]
+
+    vectorized = aspect_kernel.days_to_sign_exit(
+        [lon for lon, _ in pairs], [speed for _, speed in pairs]
+    )
+    for (lon, speed), days in zip(pairs, vectorized.tolist()):
+        expected = days_to_sign_exit(lon, speed)
+        if expected is None:
+            assert math.isnan(days)
+        else:
+            assert days == expected
@@ -0,0 +1,63 @@
+import datetime
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator
+
+
+UTC = datetime.timezone.utc
+LOCATIONS = [
+    (51.5074, -0.1278, "London"),
+    (40.7128, -74.0060, "New York"),
+    (-33.8688, 151.2093, "Sydney"),
+]
+
+
+def test_fanout_matches_single_chart_path():
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    dt = datetime.datetime(2024, 3, 15, 10, 30, tzinfo=UTC)
+
+    fanned = calculator.calculate_charts_for_instant(dt, dt, "UTC", LOCATIONS)
+    for chart, (lat, lon, name) in zip(fanned, LOCATIONS):
+        single = EnhancedTraditionalAstrologicalCalculator().calculate_chart(dt, dt, "UTC", lat, lon, name)
+        assert repr(chart) == repr(single)
+
+    # Per-location state must not leak between charts
+    assert fanned[0].houses != fanned[2].houses
+    assert fanned[0].planets[next(iter(fanned[0].planets))] is not fanned[1].planets[next(iter(fanned[1].planets))]
+
+
+def test_batch_returns_charts_in_input_order():
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    base = datetime.datetime(2023, 7, 1, 22, 5, tzinfo=UTC)
+    inputs = [
+        (base, 51.5074, -0.1278),
+        (base + datetime.timedelta(days=3), 40.7128, -74.0060),
+        (base, -33.8688, 151.2093),
+    ]
+
+    charts = calculator.calculate_charts(inputs)
+    assert [chart.location for chart in charts] == [(lat, lon) for _, lat, lon in inputs]
+    assert charts[0].julian_day == charts[2].julian_day != charts[1].julian_day
+
+
+def test_batch_matches_single_chart_path():
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    dt = datetime.datetime(2024, 3, 15, 10, 30, tzinfo=UTC)
+    later = datetime.datetime(2024, 3, 15, 18, 45)            # naive: taken as UTC
+    inputs = [
+        (dt, 51.5074, -0.1278),
+        (later, 40.7128, -74.0060),
+        (dt, -33.8688, 151.2093),                              # same instant, elsewhere
+        (dt, 51.5074, -0.1278),                                # repeated input
+    ]
+    names = ["London", "New York", "Sydney", "London"]
+
+    charts = calculator.calculate_charts(inputs, location_names=names)
+    for chart, (when, lat, lon), name in zip(charts, inputs, names):
+        when = when.replace(tzinfo=UTC) if when.tzinfo is None else when
+        single = EnhancedTraditionalAstrologicalCalculator().calculate_chart(when, when, "UTC", lat, lon, name)
+        assert repr(chart) == repr(single)
+    assert charts[0] is not charts[3] and charts[0].planets is not charts[3].planets
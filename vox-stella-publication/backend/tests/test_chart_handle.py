@@ -0,0 +1,63 @@
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import horary_engine.engine as engine_module
+from horary_engine.services.chart_store import chart_handle
+
+
+UTC = datetime.timezone.utc
+SETTINGS = {"location": "London", "date": "2024-03-15", "time": "10:30", "use_current_time": False}
+RUN_SPECIFIC = ("_evaluation_stats", "_rule_trace", "chart_id")
+
+
+@pytest.fixture
+def engine(london_geocode):
+    engine = engine_module.HoraryEngine()
+    engine.result_cache = None
+    return engine
+
+
+def test_handle_is_content_addressed():
+    dt = datetime.datetime(2024, 3, 15, 10, 30, tzinfo=UTC)
+    handle = chart_handle(dt, 51.5074, -0.1278, "London", "Europe/London", "default", "abc")
+    assert handle == chart_handle(dt.astimezone(datetime.timezone(datetime.timedelta(hours=2))),
+                                  51.5074, -0.1278, "London", "Europe/London", "default", "abc")
+    assert handle != chart_handle(dt, 51.5074, -0.1278, "London", "Europe/London", "default", "def")
+    assert handle != chart_handle(dt + datetime.timedelta(minutes=1), 51.5074, -0.1278,
+                                  "London", "Europe/London", "default", "abc")
+
+
+def test_judging_a_handle_matches_a_full_judgment(engine):
+    chart = engine.create_chart(SETTINGS)
+    assert engine.create_chart(SETTINGS)["chart_id"] == chart["chart_id"]
+    assert engine.chart_store.stats()["size"] == 1
+
+    for question, settings in (("Will I get the job?", {}),
+                               ("Will I find my lost keys?", {"ignore_void_moon": True})):
+        via_handle = engine.judge_chart(chart["chart_id"], question, settings)
+        direct = engine.judge(question, dict(SETTINGS, **settings))
+        assert via_handle["chart_id"] == chart["chart_id"]
+        assert ({k: v for k, v in via_handle.items() if k not in RUN_SPECIFIC}
+                == {k: v for k, v in direct.items() if k not in RUN_SPECIFIC})
+
+
+def test_each_judgment_reports_its_own_stats(engine):
+    chart_id = engine.create_chart(SETTINGS)["chart_id"]
+    first = engine.judge_chart(chart_id, "Will I get the job?")["_evaluation_stats"]
+    again = engine.judge_chart(chart_id, "Will I get the job?")["_evaluation_stats"]
+
+    # The void-of-course check was solved when the chart was cast, and the
+    # repeated question finds everything solved; neither count accumulates
+    assert first["void_of_course"]["computed"] == 0
+    assert again["void_of_course"] == first["void_of_course"]
+    assert all(counts["computed"] == 0 for counts in again.values())
+
+
+def test_unknown_handle(engine):
+    result = engine.judge_chart("0" * 24, "Will I get the job?")
+    assert result["error_type"] == "ChartNotFound"
@@ -0,0 +1,45 @@
+import os
+import sys
+
+import pytest
+import swisseph as swe
+
+np = pytest.importorskip("numpy")
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from horary_engine.calculation.chebyshev import ChebyshevEphemeris
+
+
+START = swe.julday(2024, 1, 1, 0.0)
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+@pytest.fixture(scope="module")
+def fitted():
+    return ChebyshevEphemeris.fit(START, START + 128)
+
+
+def test_vectorized_positions_within_documented_bound(fitted):
+    jds = np.linspace(START, START + 127.9, 400)
+    for body in range(7):
+        values = fitted.evaluate(body, jds)
+        reference = np.array([swe.calc_ut(jd, body, FLAGS)[0] for jd in jds])
+        lon_error = np.abs((values[:, 0] - reference[:, 0] + 180) % 360 - 180)
+        assert lon_error.max() * 3600 < 5.0
+        assert np.abs(values[:, 3] - reference[:, 3]).max() < 0.005
+
+
+def test_calc_ut_falls_through_outside_range(fitted):
+    outside = START - 10
+    assert fitted.calc_ut(outside, swe.MARS) == swe.calc_ut(outside, swe.MARS, FLAGS)
+    inside, _ = fitted.calc_ut(START + 3.3, swe.MOON)
+    assert len(inside) == 6
+
+
+def test_round_trip(fitted, tmp_path):
+    path = tmp_path / "cheb.npz"
+    fitted.save(path)
+    loaded = ChebyshevEphemeris.load(path)
+    jds = np.array([START + 1.0, START + 77.7])
+    assert np.array_equal(loaded.evaluate(swe.VENUS, jds), fitted.evaluate(swe.VENUS, jds))
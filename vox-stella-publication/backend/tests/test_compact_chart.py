@@ -0,0 +1,78 @@
+import datetime
+import enum
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from models import Planet
+from horary_engine.compact_chart import CompactChart
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator
+from horary_engine.serialization import serialize_chart_for_frontend
+
+
+UTC = datetime.timezone.utc
+BASE = datetime.datetime(2024, 3, 15, 10, 30, tzinfo=UTC)
+INPUTS = [
+    (BASE, 51.5074, -0.1278),
+    (BASE + datetime.timedelta(days=40), -33.8688, 151.2093),
+]
+
+
+def deep_size(obj, seen=None):
+    """Bytes held by ``obj`` and what it owns; enums and timestamps are shared."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen or isinstance(obj, (enum.Enum, type, datetime.datetime, str)):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(deep_size(item, seen) for item in obj)
+    if hasattr(obj, "__dict__"):
+        size += deep_size(vars(obj), seen)
+    for slot in getattr(type(obj), "__slots__", ()):
+        size += deep_size(getattr(obj, slot, None), seen)
+    return size
+
+
+def test_compact_charts_read_and_expand_like_full_charts():
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    charts = calculator.calculate_charts(INPUTS)
+    compact = calculator.calculate_charts(INPUTS, compact=True)
+
+    for chart, packed in zip(charts, compact):
+        assert isinstance(packed, CompactChart)
+        assert repr(packed.to_chart()) == repr(chart)
+        assert serialize_chart_for_frontend(packed, packed.solar_analyses) == \
+            serialize_chart_for_frontend(chart, chart.solar_analyses)
+
+        mars = packed.planets[Planet.MARS]
+        assert mars == chart.planets[Planet.MARS]
+        assert mars.degree_in_sign == chart.planets[Planet.MARS].longitude % 30
+        assert list(packed.planets) == list(chart.planets)
+        assert packed.aspects == chart.aspects
+        assert packed.house_rulers == chart.house_rulers
+        assert packed.moon_next_aspect == chart.moon_next_aspect
+
+
+def test_compact_chart_is_an_order_of_magnitude_smaller():
+    chart = EnhancedTraditionalAstrologicalCalculator().calculate_charts(INPUTS[:1])[0]
+    packed = CompactChart.from_chart(chart)
+    # Chart fields only: the attached aspect index and lunar timeline are caches
+    fields = {name: value for name, value in vars(chart).items() if not name.startswith("_")}
+
+    assert deep_size(packed) * 10 <= deep_size(fields)
+
+
+def test_fractional_dignities_and_exact_times_survive_packing():
+    chart = EnhancedTraditionalAstrologicalCalculator().calculate_charts(INPUTS[1:])[0]
+    chart.planets[Planet.VENUS].dignity_score = 2.5
+    chart.aspects[0].exact_time = BASE
+
+    packed = CompactChart.from_chart(chart)
+    assert packed.planets[Planet.VENUS].dignity_score == 2.5
+    assert packed.planets[Planet.MARS].dignity_score == chart.planets[Planet.MARS].dignity_score
+    assert packed.aspects[0].exact_time == BASE
+    assert repr(packed.to_chart()) == repr(chart)
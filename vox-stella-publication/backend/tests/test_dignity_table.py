@@ -0,0 +1,80 @@
+import os
+import random
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from horary_config import cfg, compile_config
+from models import Planet, Sign
+from horary_engine.dignity import (
+    DETRIMENT,
+    DOMICILE,
+    EXALTATION,
+    FACE,
+    FALL,
+    RECEPTION_TRIPLICITY,
+    TERM,
+    TRIPLICITY,
+    DignityTable,
+    get_dignity_table,
+)
+
+
+def bound_ruler(table, sign, sign_degree):
+    for bound in getattr(table, sign.sign_name):
+        if bound.start <= sign_degree < bound.end:
+            return Planet[bound.ruler.upper()]
+    return None
+
+
+def sign_of(longitude):
+    return next(s for s in Sign if s.start_degree <= longitude < s.start_degree + 30)
+
+
+def test_flags_match_config_terms_and_faces():
+    table = get_dignity_table()
+    rng = random.Random(7)
+    for _ in range(500):
+        longitude = rng.uniform(0, 360)
+        sign = sign_of(longitude)
+        sign_degree = longitude - sign.start_degree
+        term = bound_ruler(cfg().reception.terms, sign, sign_degree)
+        face = bound_ruler(cfg().reception.faces, sign, sign_degree)
+        for planet in Planet:
+            for is_day in (True, False):
+                flags = table.flags_at(planet, longitude, is_day)
+                assert bool(flags & DOMICILE) == (sign.ruler == planet)
+                assert bool(flags & TERM) == (term == planet)
+                assert bool(flags & FACE) == (face == planet)
+
+
+def test_known_dignities_and_scores():
+    table = get_dignity_table()
+    dignity = cfg().dignity
+
+    assert table.flags_at(Planet.SUN, 10.0, True) & EXALTATION          # Sun in Aries
+    assert table.flags_at(Planet.SATURN, 5.0, True) & FALL               # Saturn in Aries
+    assert table.flags_at(Planet.MARS, 195.0, True) & DETRIMENT          # Mars in Libra
+    assert table.flags_at(Planet.JUPITER, 130.0, False) & TRIPLICITY     # fire by night
+
+    # Scoring and reception disagree on the water triplicity
+    scorpio = 215.0
+    assert table.flags_at(Planet.VENUS, scorpio, True) & TRIPLICITY
+    assert table.flags_at(Planet.MARS, scorpio, True) & RECEPTION_TRIPLICITY
+    assert not table.flags_at(Planet.MARS, scorpio, True) & TRIPLICITY
+
+    assert table.score_at(Planet.MARS, scorpio, False) == dignity.rulership + dignity.triplicity
+    assert table.sign_score(Planet.MARS, Sign.SCORPIO) == dignity.rulership
+    assert table.sign_score(Planet.VENUS, Sign.SCORPIO) == dignity.detriment
+
+
+def test_fractional_bounds_use_arc_minutes():
+    config = cfg().to_dict()
+    config["reception"]["terms"]["Aries"][0]["end"] = 6.5
+    config["reception"]["terms"]["Aries"][1]["start"] = 6.5
+
+    table = DignityTable(compile_config(config))
+    assert table.cells_per_degree == 60
+    assert table.flags_at(Planet.JUPITER, 6.4, True) & TERM
+    assert table.flags_at(Planet.VENUS, 6.6, True) & TERM
+    assert get_dignity_table().cells_per_degree == 1
@@ -0,0 +1,54 @@
+import os
+import sys
+
+import swisseph as swe
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from horary_engine.calculation.ephemeris import EphemerisCache
+from horary_engine.calculation.helpers import (
+    calculate_moon_variable_speed,
+    sun_altitude_at_civil_twilight,
+)
+
+
+JD = swe.julday(2024, 3, 15, 10.5)
+
+
+def test_cache_returns_swiss_ephemeris_results_and_counts():
+    cache = EphemerisCache()
+    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+    assert cache.calc_ut(JD, swe.MARS, flags) == swe.calc_ut(JD, swe.MARS, flags)
+    cache.calc_ut(JD, swe.MARS, flags)
+    cache.calc_ut(JD, swe.MARS, swe.FLG_SWIEPH)
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["size"] == 2
+
+
+def test_cache_evicts_least_recently_used():
+    cache = EphemerisCache(maxsize=2)
+    cache.calc_ut(JD, swe.SUN)
+    cache.calc_ut(JD, swe.MOON)
+    cache.calc_ut(JD, swe.SUN)
+    cache.calc_ut(JD, swe.VENUS)
+
+    cache.calc_ut(JD, swe.SUN)
+    assert cache.hits == 2
+    cache.calc_ut(JD, swe.MOON)
+    assert cache.misses == 4
+
+
+def test_helpers_share_the_cache():
+    cache = EphemerisCache()
+    cache.calc_ut(JD, swe.SUN)
+    cache.calc_ut(JD, swe.MOON)
+
+    sun_altitude_at_civil_twilight(51.5, -0.13, JD, ephemeris=cache)
+    speed = calculate_moon_variable_speed(JD, ephemeris=cache)
+
+    assert speed == abs(swe.calc_ut(JD, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)[0][3])
+    assert cache.hits == 2
+    assert cache.misses == 2
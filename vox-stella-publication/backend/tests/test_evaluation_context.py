@@ -0,0 +1,87 @@
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import horary_engine.engine as engine_module
+from horary_engine.evaluation_context import (
+    attach_evaluation_context,
+    get_evaluation_context,
+    memoize_on_chart,
+)
+
+
+class Evaluator:
+    def __init__(self):
+        self.calls = []
+
+    @memoize_on_chart("pair")
+    def pair(self, chart, first, second):
+        self.calls.append((first, second))
+        return {"pair": (first, second)}
+
+    @memoize_on_chart("analysis", key=repr)
+    def analysis(self, chart, question_analysis):
+        self.calls.append("analysis")
+        return len(question_analysis)
+
+
+def test_results_are_memoized_per_chart_and_key():
+    evaluator = Evaluator()
+    chart, other_chart = SimpleNamespace(), SimpleNamespace()
+
+    first = evaluator.pair(chart, "Sun", "Moon")
+    assert evaluator.pair(chart, "Sun", "Moon") is first
+    evaluator.pair(chart, "Moon", "Sun")
+    evaluator.pair(other_chart, "Sun", "Moon")
+    evaluator.analysis(chart, {"houses": [1, 7]})
+    evaluator.analysis(chart, {"houses": [1, 7]})
+    evaluator.analysis(chart, {"houses": [1, 10]})
+
+    assert evaluator.calls.count(("Sun", "Moon")) == 2
+    assert get_evaluation_context(chart).stats() == {
+        "analysis": {"computed": 2, "reused": 1},
+        "pair": {"computed": 2, "reused": 1},
+    }
+
+
+class SlowEvaluator(Evaluator):
+    @memoize_on_chart("pair")
+    def pair(self, chart, first, second):
+        time.sleep(0.1)
+        self.calls.append((first, second))
+        return {"pair": (first, second)}
+
+
+def test_child_contexts_share_values_and_count_their_own():
+    evaluator = SlowEvaluator()
+    chart = SimpleNamespace()
+    copies = [SimpleNamespace() for _ in range(4)]
+    for copy in copies:
+        attach_evaluation_context(copy, shared_with=get_evaluation_context(chart))
+
+    threads = [threading.Thread(target=evaluator.pair, args=(copy, "Sun", "Moon")) for copy in copies]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert evaluator.calls == [("Sun", "Moon")]
+    counts = sorted(list(get_evaluation_context(copy).stats()["pair"].values()) for copy in copies)
+    assert counts == [[0, 1], [0, 1], [0, 1], [1, 0]]
+    assert get_evaluation_context(chart).stats() == {}
+
+
+def test_judgment_reports_evaluation_stats(london_geocode):
+    result = engine_module.HoraryEngine().judge(
+        "Will I get the job?",
+        {"location": "London", "date": "2024-03-15", "time": "10:30", "use_current_time": False},
+    )
+
+    stats = result["_evaluation_stats"]
+    assert stats["void_of_course"]["computed"] == 1
+    assert stats["void_of_course"]["reused"] >= 2
+    assert stats["significators"]["computed"] == 1
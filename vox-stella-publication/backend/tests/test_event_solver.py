@@ -0,0 +1,47 @@
+import os
+import sys
+
+import swisseph as swe
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from horary_engine.calculation.solver import (
+    EphemerisSampler,
+    find_next_ingress,
+    find_next_station,
+)
+
+
+JD_2024 = swe.julday(2024, 1, 1, 0.0)
+
+
+def speed_at(planet_id, jd):
+    data, _ = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+    return data[3]
+
+
+def test_station_is_bracketed_and_cheap():
+    for planet_id in (swe.MERCURY, swe.VENUS, swe.MARS, swe.JUPITER, swe.SATURN):
+        result = find_next_station(planet_id, JD_2024, 800)
+        assert result.jd is not None
+        assert speed_at(planet_id, result.jd - 0.01) * speed_at(planet_id, result.jd + 0.01) < 0
+        assert result.calls < 300
+
+
+def test_ingress_lands_on_sign_boundary():
+    for planet_id in (swe.SUN, swe.MOON, swe.MERCURY, swe.MARS):
+        result = find_next_ingress(planet_id, JD_2024, 400)
+        assert result.jd is not None
+        before, _ = swe.calc_ut(JD_2024, planet_id, swe.FLG_SWIEPH)
+        after, _ = swe.calc_ut(result.jd + 0.01, planet_id, swe.FLG_SWIEPH)
+        assert int(before[0] // 30) != int(after[0] // 30)
+
+
+def test_sampler_reuses_samples_across_searches():
+    sampler = EphemerisSampler(swe.MERCURY)
+    first = find_next_station(swe.MERCURY, JD_2024, 365, sampler=sampler)
+    repeat = find_next_station(swe.MERCURY, JD_2024, 365, sampler=sampler)
+    assert repeat.jd == first.jd
+    assert first.calls > 0
+    assert repeat.calls == 0
+    assert sampler.calls == first.calls
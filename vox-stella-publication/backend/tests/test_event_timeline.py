@@ -0,0 +1,117 @@
+import datetime
+import os
+import sys
+
+import pytest
+import swisseph as swe
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from models import Aspect, Planet, Sign
+from horary_engine.calculation.stations import StationIndex, search_next_station
+from horary_engine.calculation.tracks import crossings, level_crossings
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+from horary_engine.event_timeline import PERFECTION, build_event_timeline
+from helpers import PLANET_IDS, arc_to, longitude
+
+
+# Mercury stations retrograde on 1 April 2024 and direct on 25 April
+JD = swe.julday(2024, 3, 20, 12.0)
+
+
+@pytest.fixture(scope="module")
+def timeline():
+    return build_event_timeline(JD, PLANET_IDS, 60)
+
+
+def test_perfections_are_exact_on_the_ephemeris(timeline):
+    perfections = [e for e in timeline.events if e.kind == PERFECTION]
+    pairs = {frozenset((e.planet, e.other)) for e in perfections}
+    assert all(frozenset((Planet.MOON, planet)) in pairs for planet in PLANET_IDS if planet != Planet.MOON)
+    for event in perfections:
+        assert 0 < event.days <= 60
+        separation = longitude(event.jd, PLANET_IDS[event.planet]) - longitude(event.jd, PLANET_IDS[event.other])
+        assert arc_to(separation, event.aspect.degrees) < 0.01
+
+    events = timeline.events
+    assert [e.jd for e in events] == sorted(e.jd for e in events)
+
+
+def test_stations_match_ephemeris_search(timeline):
+    stations = timeline.stations(Planet.MERCURY)
+    assert [s.retrograde for s in stations] == [True, False]
+    expected = search_next_station(swe.MERCURY, JD)
+    assert stations[0].jd == pytest.approx(expected, abs=0.05)
+
+    assert timeline.stations(Planet.SUN) == []
+    assert timeline.stations(Planet.MOON) == []
+
+
+def test_stations_come_from_an_index_that_spans_the_horizon(timeline):
+    index = StationIndex.build(JD - 10, JD + 100, [swe.MERCURY])
+    indexed = build_event_timeline(JD, PLANET_IDS, 60, station_index=index)
+    stations = indexed.stations(Planet.MERCURY)
+    assert [s.jd for s in stations] == index.stations_between(swe.MERCURY, JD, JD + 60)
+    assert [s.retrograde for s in stations] == [True, False]
+    for own, sampled in zip(stations, timeline.stations(Planet.MERCURY)):
+        assert own.jd == pytest.approx(sampled.jd, abs=0.05)
+
+    # Venus is not in the index, so its stations are still solved on the track
+    assert indexed.stations(Planet.VENUS) == timeline.stations(Planet.VENUS)
+
+
+def test_ingresses_fall_on_sign_boundaries(timeline):
+    sun = timeline.ingresses(Planet.SUN)
+    assert [e.sign for e in sun] == [Sign.TAURUS]
+    for planet, body in PLANET_IDS.items():
+        for event in timeline.ingresses(planet):
+            in_sign = longitude(event.jd, body) % 30
+            assert min(in_sign, 30 - in_sign) < 0.01
+            assert event.sign.start_degree == int(longitude(event.jd + 0.01, body) // 30) * 30
+
+
+def test_perfection_blocked_by_station(timeline):
+    # Mercury stations retrograde before its conjunction with the Sun on
+    # 11 April; neither leaves Aries first
+    station = timeline.stations(Planet.MERCURY)[0]
+    conjunction = timeline.next_perfection(Planet.SUN, Planet.MERCURY, Aspect.CONJUNCTION)
+    assert station.jd < conjunction.jd < timeline.ingresses(Planet.SUN)[0].jd
+
+    assert timeline.perfects_in_sign(Planet.MERCURY, Planet.SUN, Aspect.CONJUNCTION) is None
+    assert timeline.perfects_in_sign(Planet.MERCURY, Planet.SUN, Aspect.CONJUNCTION,
+                                     allow_station=True) == conjunction
+    assert timeline.first_change([Planet.MERCURY, Planet.SUN]) == station
+    assert timeline.first_change([Planet.MERCURY], station.jd) is None
+
+
+def test_days_to_perfection_beyond_horizon_is_infinite():
+    timeline = build_event_timeline(JD, PLANET_IDS, 2)
+    assert timeline.days_to_perfection(Planet.JUPITER, Planet.SATURN, Aspect.CONJUNCTION) == float("inf")
+    assert timeline.first_change([Planet.SATURN]) is None
+
+
+def test_default_horizon_keeps_slow_perfections():
+    # On 18 February 2000 Jupiter applies to Saturn in Taurus; the
+    # conjunction perfects on 28 May, before either stations or leaves the sign
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    dt = datetime.datetime(2000, 2, 18, 12, tzinfo=datetime.timezone.utc)
+    chart = engine.calculator.calculate_chart(dt, dt, "UTC", 51.5074, -0.1278, "London")
+    jupiter, saturn = chart.planets[Planet.JUPITER], chart.planets[Planet.SATURN]
+
+    assert 60 < engine._days_to_aspect_perfection(chart, Planet.JUPITER, Planet.SATURN,
+                                                  Aspect.CONJUNCTION) < 365
+    assert engine._enhanced_perfects_in_sign(jupiter, saturn, {"aspect": Aspect.CONJUNCTION}, chart)
+
+
+def test_crossings_assign_grid_levels_once():
+    grid = [0.0, 1.0, 2.0, 3.0]
+    rising = [0.0, 10.0, 20.0, 30.0]
+    falling = [30.0, 20.0, 10.0, 0.0]
+
+    assert list(crossings(lambda t: 10 * t, grid, rising, 10.0)) == [pytest.approx(1.0)]
+    assert list(crossings(lambda t: 30 - 10 * t, grid, falling, 10.0)) == [pytest.approx(2.0)]
+    assert [t for t in crossings(lambda t: 10 * t, grid, rising, -355.0, 360)] == [pytest.approx(0.5)]
+
+    hits = list(level_crossings(lambda t: 30 - 10 * t, grid, falling, [5.0, 15.0, 25.0], 360))
+    assert [level for _, level in hits] == [25.0, 15.0, 5.0]
+    assert [t for t, _ in hits] == [pytest.approx(0.5), pytest.approx(1.5), pytest.approx(2.5)]
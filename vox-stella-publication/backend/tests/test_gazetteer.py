@@ -0,0 +1,89 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from horary_engine.services import geolocation
+from horary_engine.services.gazetteer import GazetteerGeocoder, normalize_place_name
+from horary_engine.services.geolocation import LocationError, safe_geocode
+
+
+# geonameid, name, asciiname, alternatenames, lat, lon, class, code, country,
+# cc2, admin1, admin2, admin3, admin4, population, ...
+PLACES = [
+    ("2988507", "Paris", "Paris", "Parigi,Parijs", "48.85341", "2.3488", "P", "PPLC", "FR", "", "11", "", "", "", "2138551"),
+    ("4717560", "Paris", "Paris", "", "33.66094", "-95.55551", "P", "PPLA2", "US", "", "TX", "", "", "", "24171"),
+    ("2643743", "London", "London", "Londres", "51.50853", "-0.12574", "P", "PPLC", "GB", "", "ENG", "", "", "", "8961989"),
+    ("6058560", "London", "London", "", "42.98339", "-81.23304", "P", "PPL", "CA", "", "08", "", "", "", "346765"),
+    ("2950159", "Berlin", "Berlin", "", "52.52437", "13.41053", "P", "PPLC", "DE", "", "16", "", "", "", "3426354"),
+    ("3117735", "Madrid", "Madrid", "", "40.4165", "-3.70256", "P", "PPLC", "ES", "", "29", "", "", "", "3255944"),
+    ("3067696", "Praha", "Praha", "Prague,Prag", "50.08804", "14.42076", "P", "PPLC", "CZ", "", "52", "", "", "", "1165581"),
+    ("2867714", "München", "Muenchen", "Munich", "48.13743", "11.57549", "P", "PPLA", "DE", "", "02", "", "", "", "1260391"),
+]
+ADMIN1 = [
+    ("FR.11", "Île-de-France"),
+    ("US.TX", "Texas"),
+    ("GB.ENG", "England"),
+    ("CA.08", "Ontario"),
+    ("DE.02", "Bavaria"),
+]
+
+
+@pytest.fixture
+def dump(tmp_path):
+    places = tmp_path / "cities.txt"
+    places.write_text("\n".join("\t".join(row) for row in PLACES) + "\n", encoding="utf-8")
+    admin1 = tmp_path / "admin1.txt"
+    admin1.write_text("\n".join(f"{code}\t{name}\t{name}\t0" for code, name in ADMIN1) + "\n", encoding="utf-8")
+    return str(places), str(admin1)
+
+
+def test_normalize_place_name():
+    assert normalize_place_name("  São-Paulo ") == "sao paulo"
+    assert normalize_place_name("MÜNCHEN") == "munchen"
+
+
+def test_lookup_prefers_population_and_honours_qualifiers(dump):
+    places, admin1 = dump
+    gazetteer = GazetteerGeocoder.from_dump(places, admin1_path=admin1)
+
+    lat, lon, address = gazetteer.geocode("Paris")
+    assert (lat, lon) == (48.85341, 2.3488)
+    assert address == "Paris, Île-de-France, France"
+
+    assert gazetteer.geocode("paris, texas")[:2] == (33.66094, -95.55551)
+    assert gazetteer.geocode("Paris, USA")[:2] == (33.66094, -95.55551)
+    assert gazetteer.geocode("London, United Kingdom")[2] == "London, England, Britain (UK)"
+    assert gazetteer.geocode("London, Ontario, Canada")[:2] == (42.98339, -81.23304)
+    assert gazetteer.geocode("Prague, Czech Republic")[:2] == (50.08804, 14.42076)
+    assert gazetteer.geocode("Munchen")[:2] == (48.13743, 11.57549)
+    assert gazetteer.geocode("Paris, Japan") is None
+    assert gazetteer.geocode("Atlantis") is None
+
+
+def test_index_is_reused_from_disk(dump, tmp_path):
+    places, _ = dump
+    db_path = str(tmp_path / "index" / "gazetteer.sqlite3")
+    assert len(GazetteerGeocoder.from_dump(places, db_path=db_path)) == len(PLACES)
+
+    reopened = GazetteerGeocoder.from_dump(str(tmp_path / "missing.txt"), db_path=db_path)
+    assert reopened.geocode("Berlin, Germany")[:2] == (52.52437, 13.41053)
+
+
+def test_safe_geocode_offline(dump, monkeypatch):
+    places, admin1 = dump
+    monkeypatch.setenv("HORARY_GEOCODER", "gazetteer")
+    monkeypatch.setenv("HORARY_GAZETTEER_PATH", places)
+    monkeypatch.setenv("HORARY_GAZETTEER_ADMIN1", admin1)
+    monkeypatch.delenv("HORARY_GAZETTEER_DB", raising=False)
+    geolocation.set_geocoder(None)
+    geolocation.set_geocode_cache(None, enabled=False)
+    try:
+        assert safe_geocode("Madrid, Spain")[:2] == (40.4165, -3.70256)
+        with pytest.raises(LocationError):
+            safe_geocode("Atlantis")
+    finally:
+        geolocation.set_geocoder(None)
+        geolocation.set_geocode_cache(None)
@@ -0,0 +1,83 @@
+import os
+import sys
+import time
+
+import pytest
+from geopy.exc import GeocoderTimedOut
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from horary_engine.services import geolocation
+from horary_engine.services.geocode_cache import GeocodeCache, canonical_location_key
+from horary_engine.services.geolocation import LocationError, safe_geocode
+
+
+LONDON = (51.5074, -0.1278, "London, Greater London, England, United Kingdom")
+
+
+class FakeGeocoder:
+    def __init__(self, places):
+        self.places = places
+        self.calls = 0
+        self.down = False
+
+    def geocode(self, location_string, timeout=None):
+        self.calls += 1
+        if self.down:
+            raise GeocoderTimedOut("timed out")
+        return self.places.get(canonical_location_key(location_string))
+
+
+@pytest.fixture
+def services(tmp_path):
+    geocoder = FakeGeocoder({"london uk": LONDON, "london,uk": LONDON})
+    cache = GeocodeCache(str(tmp_path / "geocode.sqlite3"), ttl=60, negative_ttl=60)
+    geolocation.set_geocoder(geocoder)
+    geolocation.set_geocode_cache(cache)
+    yield geocoder, cache
+    geolocation.set_geocoder(None)
+    geolocation.set_geocode_cache(None)
+
+
+def test_canonical_key():
+    assert canonical_location_key("  LONDON ,  U.K. ") == "london,u k"
+    assert canonical_location_key("London, UK") == canonical_location_key("london ,uk")
+
+
+def test_hits_and_negative_entries(services):
+    geocoder, cache = services
+
+    assert safe_geocode("London, UK") == LONDON
+    assert safe_geocode("london ,  uk") == LONDON
+    assert geocoder.calls == 1
+
+    for _ in range(2):
+        with pytest.raises(LocationError, match="Location not found"):
+            safe_geocode("Atlantis")
+    assert geocoder.calls == 2
+
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["negative_hits"] == 1
+    assert stats["size"] == 2 and stats["negative_entries"] == 1
+
+
+def test_shared_between_connections(services, tmp_path):
+    _, cache = services
+    safe_geocode("London, UK")
+    other_worker = GeocodeCache(cache.path)
+    assert other_worker.get("LONDON, UK") == (LONDON, True)
+
+
+def test_stale_entry_served_when_upstream_times_out(services):
+    geocoder, cache = services
+    safe_geocode("London, UK")
+    cache.ttl = 0
+    time.sleep(0.01)
+
+    geocoder.down = True
+    assert safe_geocode("London, UK") == LONDON
+    assert cache.stats()["stale_served"] == 1
+
+    cache.serve_stale = False
+    with pytest.raises(LocationError, match="unavailable"):
+        safe_geocode("London, UK")
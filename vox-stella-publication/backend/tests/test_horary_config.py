@@ -1,11 +1,15 @@
+import copy
 import os
+import pickle
 import sys
 import logging
 
+import pytest
+
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from horary_config import HoraryConfig
+from horary_config import HoraryConfig, HoraryError, compile_config
 
 
 def test_horary_config_loads_without_unexpected_logs(caplog):
@@ -16,3 +20,41 @@ def test_horary_config_loads_without_unexpected_logs(caplog):
     assert len(caplog.records) == 1
     assert caplog.records[0].message.startswith("Loaded horary configuration")
 
+
+
+def test_config_snapshot_is_frozen():
+    HoraryConfig.reset()
+    config = HoraryConfig().config
+    with pytest.raises(AttributeError):
+        config.orbs.conjunction = 1.0
+    with pytest.raises(AttributeError):
+        config.orbs.new_key = 1.0
+    assert isinstance(config.reception.terms.Aries, tuple)
+    assert copy.deepcopy(config) is config
+    assert pickle.loads(pickle.dumps(config)) == config
+
+
+def test_content_hash_tracks_content():
+    HoraryConfig.reset()
+    config = HoraryConfig().config
+    data = config.to_dict()
+    assert compile_config(data).content_hash == config.content_hash
+    assert HoraryConfig().content_hash == config.content_hash
+
+    data["orbs"]["conjunction"] += 1
+    assert compile_config(data).content_hash != config.content_hash
+
+
+def test_defaults_are_resolved_and_checked():
+    config = compile_config({"orbs": {"moieties": {"Sun": 10.0}}, "moon": {"void_rule": "by_sign"}})
+    assert config.radicality.hour_agreement_mode == "ruler"
+    assert config.moon.void_penalty == 10
+    assert config.moon.void_rule == "by_sign"
+    assert config.orbs.moieties.Sun == 10.0
+    assert config.orbs.moieties.Saturn == 8.0
+    assert compile_config({"orbs": {"conjunction": 8.0}}).orbs.moieties is None
+
+    with pytest.raises(HoraryError):
+        compile_config({"radicality": {"gating": "yes"}})
+    with pytest.raises(HoraryError):
+        compile_config({"orbs": {"to_dict": 1}})
@@ -0,0 +1,80 @@
+import os
+import sys
+
+import pytest
+import swisseph as swe
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from models import Aspect, Planet, Sign
+from horary_engine.aspects import calculate_moon_last_aspect, calculate_moon_next_aspect
+from horary_engine.lunar_timeline import (
+    LunarEvent,
+    LunarTimeline,
+    build_lunar_timeline,
+    chart_lunar_timeline,
+)
+from helpers import PLANET_IDS, arc_to, longitude, make_planet_position
+
+
+JDS = [swe.julday(2024, 1, 1, 0.0) + 37.3 * i for i in range(8)]
+
+
+@pytest.mark.parametrize("jd_ut", JDS)
+def test_events_are_exact_on_the_ephemeris(jd_ut):
+    timeline = build_lunar_timeline(jd_ut, PLANET_IDS)
+
+    assert timeline.ingress_jd <= jd_ut < timeline.egress_jd
+    for boundary in (timeline.ingress_jd, timeline.egress_jd):
+        in_sign = longitude(boundary, swe.MOON) % 30
+        assert min(in_sign, 30 - in_sign) < 0.01
+    assert timeline.sign.start_degree == int(longitude(jd_ut, swe.MOON) // 30) * 30
+
+    assert timeline.events
+    assert [e.jd for e in timeline.events] == sorted(e.jd for e in timeline.events)
+    for event in timeline.events:
+        separation = longitude(event.jd, swe.MOON) - longitude(event.jd, PLANET_IDS[event.planet])
+        assert arc_to(separation, event.aspect.degrees) < 0.01
+        assert event.days == pytest.approx(event.jd - jd_ut)
+
+
+def test_remaining_in_sign_stops_at_egress():
+    timeline = build_lunar_timeline(JDS[0], PLANET_IDS)
+    remaining = timeline.remaining_in_sign()
+
+    assert all(0 < e.days and e.jd < timeline.egress_jd for e in remaining)
+    assert all(int(e.moon_longitude // 30) * 30 == timeline.sign.start_degree for e in remaining)
+    assert remaining == [e for e in timeline.future() if e.jd < timeline.egress_jd]
+
+
+def test_moon_aspects_read_timeline():
+    # Moon 0.2 degrees short of squaring Mars: the 0.1-day probe overshoots
+    # the exact square and calls it separating; the timeline knows better.
+    planets = {
+        Planet.MOON: make_planet_position(Planet.MOON, 100.0, 13.0),
+        Planet.MARS: make_planet_position(Planet.MARS, 10.2, 0.5),
+    }
+    square = LunarEvent(jd=10.016, days=0.016, planet=Planet.MARS,
+                        aspect=Aspect.SQUARE, moon_longitude=100.2)
+    timeline = LunarTimeline(10.0, Sign.CANCER, 9.0, 11.0, [square])
+    get_speed = lambda jd: 13.0
+
+    assert calculate_moon_last_aspect(planets, 10.0, get_speed).aspect == Aspect.SQUARE
+    assert calculate_moon_next_aspect(planets, 10.0, get_speed) is None
+
+    next_aspect = calculate_moon_next_aspect(planets, 10.0, get_speed, timeline)
+    assert next_aspect.aspect == Aspect.SQUARE
+    assert next_aspect.applying
+    assert next_aspect.perfection_eta_days == pytest.approx(0.016)
+    assert calculate_moon_last_aspect(planets, 10.0, get_speed, timeline) is None
+
+
+def test_chart_timeline_is_solved_once():
+    class Chart:
+        julian_day = JDS[0]
+        planets = dict.fromkeys(PLANET_IDS)
+
+    chart = Chart()
+    timeline = chart_lunar_timeline(chart)
+    assert chart_lunar_timeline(chart) is timeline
+    assert timeline.jd_ut == JDS[0]
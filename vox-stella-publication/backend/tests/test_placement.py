@@ -0,0 +1,50 @@
+import os
+import random
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from models import Sign
+from horary_engine.calculation.placement import (
+    HouseTable,
+    _walk_cusps,
+    house_of,
+    sign_indices,
+    sign_of,
+)
+
+# The tenth house runs through 0° Aries
+CUSPS = [95.2, 113.4, 134.8, 165.9, 205.2, 240.6, 275.2, 293.4, 314.8, 345.9, 25.2, 60.6]
+
+
+def test_sign_by_division():
+    assert sign_of(0.0) is Sign.ARIES
+    assert sign_of(29.999) is Sign.ARIES
+    assert sign_of(30.0) is Sign.TAURUS
+    assert sign_of(359.5) is Sign.PISCES
+    assert sign_of(-1e-20) is Sign.PISCES
+    assert sign_of(725.0) is Sign.ARIES
+    assert list(sign_indices([0.0, 45.0, -15.0, 359.999])) == [0, 1, 11, 11]
+
+
+def test_houses_match_cusp_walk():
+    rng = random.Random(7)
+    tables = [CUSPS, [(c + 300.0) % 360 for c in CUSPS], [c + 0.5 for c in CUSPS]]
+    for cusps in tables:
+        table = HouseTable(cusps)
+        longitudes = [rng.uniform(-720, 720) for _ in range(500)] + [c % 360 for c in cusps]
+        expected = [_walk_cusps(lon % 360, cusps) for lon in longitudes]
+        assert [table.house_of(lon) for lon in longitudes] == expected
+        assert list(table.houses_of(longitudes)) == expected
+
+    # A longitude on a cusp belongs to the house it opens
+    assert house_of(CUSPS[10], CUSPS) == 11
+    assert house_of(CUSPS[0] - 1e-9, CUSPS) == 12
+
+
+def test_out_of_order_cusps_fall_back_to_walk():
+    cusps = list(CUSPS)
+    cusps[4], cusps[5] = cusps[5], cusps[4]
+    table = HouseTable(cusps)
+    for lon in range(0, 360, 5):
+        assert table.house_of(lon) == _walk_cusps(lon, cusps)
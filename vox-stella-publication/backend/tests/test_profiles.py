@@ -0,0 +1,103 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import horary_engine.engine as engine_module
+from horary_config import HoraryError, cfg, compile_config
+from horary_engine.profiles import ProfileRegistry, profile_paths, set_profile_registry
+from models import Planet, Sign
+
+
+SETTINGS = {"location": "London", "date": "2024-08-01", "time": "10:30", "use_current_time": False}
+
+
+def heavy_rulership_profile():
+    data = cfg().to_dict()
+    data["dignity"]["rulership"] += 20
+    return compile_config(data)
+
+
+@pytest.fixture
+def registry(london_geocode):
+    registry = ProfileRegistry({"default": cfg(), "heavy": heavy_rulership_profile()})
+    set_profile_registry(registry)
+    yield registry
+    set_profile_registry(None)
+
+
+def test_profile_paths(tmp_path):
+    (tmp_path / "strict.yaml").write_text("orbs: {conjunction: 6.0}\n")
+    (tmp_path / "lenient.yml").write_text("orbs: {conjunction: 10.0}\n")
+    (tmp_path / "notes.txt").write_text("")
+
+    assert profile_paths(str(tmp_path)) == {
+        "lenient": tmp_path / "lenient.yml",
+        "strict": tmp_path / "strict.yaml",
+    }
+    assert profile_paths(f"a={tmp_path}/strict.yaml, b={tmp_path}/lenient.yml") == {
+        "a": tmp_path / "strict.yaml",
+        "b": tmp_path / "lenient.yml",
+    }
+    assert profile_paths("") == {}
+    with pytest.raises(HoraryError):
+        profile_paths("a=")
+
+    registry = ProfileRegistry.from_files(profile_paths(str(tmp_path)))
+    assert registry.names() == ["default", "lenient", "strict"]
+    assert registry.get() is cfg()
+    assert registry.get("strict").orbs.conjunction == 6.0
+    with pytest.raises(HoraryError):
+        registry.get("missing")
+
+
+def test_judge_uses_requested_profile(registry):
+    engine = engine_module.HoraryEngine()
+    default = engine.judge("Will I get the job?", dict(SETTINGS))
+    heavy = engine.judge("Will I get the job?", dict(SETTINGS, profile="heavy"))
+
+    assert default["_profile"] == {"name": "default", "content_hash": cfg().content_hash}
+    assert heavy["_profile"]["content_hash"] == registry.get("heavy").content_hash
+
+    # Planets in their own sign score the heavier rulership only under "heavy"
+    domiciled = 0
+    for planet in Planet:
+        before = default["chart_data"]["planets"][planet.value]
+        after = heavy["chart_data"]["planets"][planet.value]
+        in_domicile = Sign[before["sign"].upper()].ruler == planet
+        domiciled += in_domicile
+        assert after["dignity_score"] - before["dignity_score"] == (20 if in_domicile else 0)
+    assert domiciled
+
+    unknown = engine.judge("Will I get the job?", dict(SETTINGS, profile="missing"))
+    assert unknown["error_type"] == "ProfileError"
+
+
+def test_profiles_judged_concurrently(registry):
+    engine = engine_module.HoraryEngine()
+    expected = {
+        name: engine.judge("Will I get the job?", dict(SETTINGS, profile=name))["chart_data"]["planets"]
+        for name in ("default", "heavy")
+    }
+
+    results, errors = [], []
+
+    def worker(name):
+        try:
+            result = engine.judge("Will I get the job?", dict(SETTINGS, profile=name))
+            results.append((name, result["chart_data"]["planets"]))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(name,)) for name in ("default", "heavy") * 4]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors and len(results) == 8
+    for name, planets in results:
+        assert planets == expected[name]
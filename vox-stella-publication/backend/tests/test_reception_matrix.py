@@ -0,0 +1,101 @@
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from models import Planet, Sign
+from horary_engine.evaluation_context import get_evaluation_context
+from horary_engine.reception import (
+    DOMICILE,
+    EXALTATION,
+    TRIPLICITY,
+    TraditionalReceptionCalculator,
+    dignity_names,
+)
+
+
+def make_chart(longitudes):
+    planets = {}
+    for planet, longitude in longitudes.items():
+        sign = next(s for s in Sign if s.start_degree <= longitude < s.start_degree + 30)
+        planets[planet] = SimpleNamespace(longitude=longitude, sign=sign)
+    # Ascendant at 0 Aries: Sun at 100 (house 4) makes a night chart
+    return SimpleNamespace(planets=planets, houses=[i * 30.0 for i in range(12)])
+
+
+CHART = make_chart({
+    Planet.SUN: 100.0,      # Cancer
+    Planet.MOON: 45.0,      # Taurus
+    Planet.MERCURY: 160.0,  # Virgo
+    Planet.VENUS: 10.0,     # Aries
+    Planet.MARS: 190.0,     # Libra
+    Planet.JUPITER: 250.0,  # Sagittarius
+    Planet.SATURN: 320.0,   # Aquarius
+})
+
+
+def test_masks_and_classification():
+    calculator = TraditionalReceptionCalculator()
+    matrix = calculator.reception_matrix(CHART)
+
+    assert not matrix.is_day
+    assert matrix.mask(Planet.MARS, Planet.VENUS) & DOMICILE
+    assert matrix.mask(Planet.VENUS, Planet.MARS) & DOMICILE
+    assert matrix.mask(Planet.MOON, Planet.MOON) & EXALTATION
+    assert matrix.mask(Planet.MOON, Planet.MERCURY) & TRIPLICITY  # earth by night
+
+    mutual = calculator.calculate_comprehensive_reception(CHART, Planet.VENUS, Planet.MARS)
+    assert mutual["type"] == "mutual_rulership"
+    assert mutual["traditional_strength"] == 10
+    assert mutual["display_text"] == "Venus↔Mars mutual domicile reception"
+
+
+# Dignities each planet holds at each other's position in the night chart
+# above (Egyptian terms, Chaldean faces); pairs not listed have none
+EXPECTED_DIGNITIES = {
+    (Planet.SUN, Planet.VENUS): ["exaltation", "face"],              # 10 Aries
+    (Planet.MOON, Planet.SUN): ["domicile"],                         # 10 Cancer
+    (Planet.MOON, Planet.MOON): ["exaltation", "triplicity", "face"],  # 15 Taurus
+    (Planet.MOON, Planet.MERCURY): ["triplicity"],                   # 10 Virgo
+    (Planet.MOON, Planet.JUPITER): ["face"],                         # 10 Sagittarius
+    (Planet.MOON, Planet.SATURN): ["face"],                          # 20 Aquarius
+    (Planet.MERCURY, Planet.SUN): ["face"],
+    (Planet.MERCURY, Planet.MERCURY): ["domicile", "exaltation"],
+    (Planet.MERCURY, Planet.MARS): ["triplicity", "term"],           # 10 Libra
+    (Planet.MERCURY, Planet.SATURN): ["triplicity"],
+    (Planet.VENUS, Planet.SUN): ["triplicity", "term"],
+    (Planet.VENUS, Planet.MOON): ["domicile"],
+    (Planet.VENUS, Planet.MERCURY): ["term", "face"],
+    (Planet.VENUS, Planet.VENUS): ["term"],
+    (Planet.VENUS, Planet.MARS): ["domicile"],
+    (Planet.MARS, Planet.VENUS): ["domicile"],
+    (Planet.MARS, Planet.SATURN): ["term"],
+    (Planet.JUPITER, Planet.SUN): ["exaltation"],
+    (Planet.JUPITER, Planet.MOON): ["term"],
+    (Planet.JUPITER, Planet.VENUS): ["triplicity"],
+    (Planet.JUPITER, Planet.JUPITER): ["domicile", "triplicity", "term"],
+    (Planet.SATURN, Planet.MARS): ["exaltation", "face"],
+    (Planet.SATURN, Planet.SATURN): ["domicile"],
+}
+
+
+def test_matrix_dignities_match_the_tables():
+    matrix = TraditionalReceptionCalculator().reception_matrix(CHART)
+    for receiving in CHART.planets:
+        for received in CHART.planets:
+            expected = EXPECTED_DIGNITIES.get((receiving, received), [])
+            assert dignity_names(matrix.mask(receiving, received)) == expected
+
+            entry = matrix[receiving, received]
+            assert entry["planet1_receives_planet2"] == expected
+            assert entry["planet2_receives_planet1"] == EXPECTED_DIGNITIES.get((received, receiving), [])
+
+
+def test_matrix_is_built_once_per_chart():
+    calculator = TraditionalReceptionCalculator()
+    chart = make_chart({planet: position.longitude for planet, position in CHART.planets.items()})
+    for _ in range(3):
+        calculator.calculate_comprehensive_reception(chart, Planet.SUN, Planet.SATURN)
+        calculator.calculate_comprehensive_reception(chart, Planet.JUPITER, Planet.MOON)
+    assert get_evaluation_context(chart).stats()["reception_matrix"] == {"computed": 1, "reused": 5}
@@ -0,0 +1,71 @@
+import datetime
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import horary_engine.engine as engine_module
+from horary_engine.services.result_cache import ResultCache, result_cache_key
+
+
+UTC = datetime.timezone.utc
+FLAGS = (False, False, False, False)
+
+
+def key(question="Will I get the job?", dt=datetime.datetime(2024, 3, 15, 10, 30, 5, tzinfo=UTC),
+        now=False, lat=51.50741, bucket=60, flags=FLAGS):
+    return result_cache_key(question, dt, now, lat, -0.1278, "London", "Europe/London",
+                            flags, None, 15.0, "default", "abc", current_time_bucket=bucket)
+
+
+def test_key_canonicalizes_request():
+    assert key() == key("  will i GET the job? ", dt=datetime.datetime(2024, 3, 15, 10, 30, 55, tzinfo=UTC),
+                        lat=51.507412)
+    assert key() != key(dt=datetime.datetime(2024, 3, 15, 10, 31, tzinfo=UTC))
+    assert key() != key(flags=(True, False, False, False))
+
+    # "Now" requests share a bucket, and are not cached without one
+    early = datetime.datetime(2024, 3, 15, 10, 30, 1, tzinfo=UTC)
+    assert key(now=True, dt=early) == key(now=True, dt=early + datetime.timedelta(seconds=50))
+    assert key(now=True, dt=early) != key(now=True, dt=early + datetime.timedelta(seconds=60))
+    assert key(now=True, bucket=0) is None
+
+
+def test_lru_eviction_ttl_and_copies():
+    clock = [0.0]
+    cache = ResultCache(max_entries=2, ttl=10, clock=lambda: clock[0])
+    cache.put("a", {"reasoning": ["x"]})
+    cache.put("b", {})
+    assert cache.get("a") == {"reasoning": ["x"]}
+    cache.put("c", {})                      # evicts "b", the least recently used
+
+    assert cache.get("b") is None
+    cache.get("a")["reasoning"].append("changed by a caller")
+    assert cache.get("a") == {"reasoning": ["x"]}
+
+    clock[0] = 10.0
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["expirations"]) == (3, 2, 1, 1)
+    assert stats["size"] == 1
+
+
+def test_engine_answers_repeats_from_cache(monkeypatch, london_geocode):
+    calls = []
+    engine = engine_module.HoraryEngine()
+    judge_question = engine.engine.judge_question
+    monkeypatch.setattr(engine.engine, "judge_question",
+                        lambda *args, **kwargs: calls.append(1) or judge_question(*args, **kwargs))
+    settings = {"location": "London", "date": "2024-03-15", "time": "10:30", "use_current_time": False}
+
+    first = engine.judge("Will I get the job?", settings)
+    first["calculation_metadata"] = {}
+    again = engine.judge("will I get the job?", settings)
+    assert len(calls) == 1
+    assert again["question"] == "will I get the job?"
+    assert "calculation_metadata" not in again
+    assert again["judgment"] == first["judgment"]
+
+    engine.judge("Will I get the job?", dict(settings, ignore_void_moon=True))
+    assert len(calls) == 2
+    assert engine.result_cache.stats()["hits"] == 1
@@ -0,0 +1,100 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import horary_engine.engine as engine_module
+from horary_engine.rule_pipeline import (
+    COST_EXPENSIVE,
+    JudgmentState,
+    RuleFact,
+    RulePipeline,
+    RuleStage,
+)
+
+
+class Rules:
+    def __init__(self, decide_early):
+        self.decide_early = decide_early
+        self.calls = []
+
+    def _fact_cheap(self, state):
+        self.calls.append("cheap")
+        return 1
+
+    def _fact_costly(self, state):
+        self.calls.append("costly")
+        return 2
+
+    def _stage_gate(self, state):
+        state.reasoning.append(f"gate saw {state.fact('cheap')}")
+        if self.decide_early:
+            return {"result": "NO", "reasoning": state.reasoning}
+        return None
+
+    def _stage_note(self, state):
+        state.reasoning.append("note")
+
+    def _stage_final(self, state):
+        return {"result": "YES", "total": state.fact("cheap") + state.fact("costly")}
+
+
+PIPELINE = RulePipeline(
+    stages=[
+        RuleStage("gate", "_stage_gate", ("cheap",), gating=True),
+        RuleStage("note", "_stage_note", applies=lambda state: state.confidence > 50),
+        RuleStage("final", "_stage_final", ("costly",), gating=True, cost=COST_EXPENSIVE),
+    ],
+    facts=[
+        RuleFact("cheap", "_fact_cheap"),
+        RuleFact("costly", "_fact_costly", COST_EXPENSIVE),
+    ],
+)
+
+
+def make_state(confidence=60):
+    return JudgmentState(chart=None, question_analysis={}, config=None, confidence=confidence)
+
+
+def test_gate_short_circuits_before_expensive_facts():
+    rules = Rules(decide_early=True)
+    verdict = PIPELINE.run(rules, make_state())
+
+    assert verdict["result"] == "NO"
+    assert rules.calls == ["cheap"]
+    trace = verdict["_rule_trace"]
+    assert trace["decided_by"] == "gate"
+    assert [s["stage"] for s in trace["stages"]] == ["gate"]
+    assert [f["fact"] for f in trace["facts"]] == ["cheap"]
+
+
+def test_facts_are_computed_once_and_skips_recorded():
+    rules = Rules(decide_early=False)
+    verdict = PIPELINE.run(rules, make_state(confidence=40))
+
+    assert verdict["total"] == 3
+    assert rules.calls == ["cheap", "costly"]
+    outcomes = {s["stage"]: s["outcome"] for s in verdict["_rule_trace"]["stages"]}
+    assert outcomes == {"gate": "passed", "note": "skipped", "final": "decided"}
+
+
+def test_pipeline_rejects_bad_declarations():
+    with pytest.raises(ValueError):
+        RulePipeline([RuleStage("final", "_stage_final", ("missing",), gating=True)], [])
+    with pytest.raises(ValueError):
+        RulePipeline([RuleStage("note", "_stage_note")], [])
+
+
+def test_judgment_reports_rule_trace(london_geocode):
+    result = engine_module.HoraryEngine().judge(
+        "Will I get the job?",
+        {"location": "London", "date": "2024-03-15", "time": "10:30", "use_current_time": False},
+    )
+
+    trace = result["_rule_trace"]
+    stages = [s["stage"] for s in trace["stages"]]
+    assert stages[0] == "radicality"
+    assert stages[-1] == trace["decided_by"]
+    assert all(s["ms"] >= 0 for s in trace["stages"])
@@ -0,0 +1,122 @@
+import datetime
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from models import Planet
+import horary_engine.engine as engine_module
+from horary_engine.services import geolocation
+from horary_engine.services.singleflight import SingleFlight
+
+
+def run_concurrently(target, count=6):
+    results, errors = [], []
+
+    def worker():
+        try:
+            results.append(target())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    results, errors = run_concurrently(lambda: flight.do("key", slow))
+    assert not errors and len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"executed": 1, "coalesced": 5, "in_flight": 0}
+
+    # Completed calls are not cached
+    flight.do("key", slow)
+    assert len(calls) == 2
+
+
+def test_errors_reach_every_waiter():
+    flight = SingleFlight()
+
+    def failing():
+        time.sleep(0.2)
+        raise ValueError("boom")
+
+    results, errors = run_concurrently(lambda: flight.do("key", failing), count=4)
+    assert not results and len(errors) == 4
+    assert all(isinstance(e, ValueError) for e in errors)
+    assert flight.stats()["in_flight"] == 0
+
+
+class SlowGeocoder:
+    def __init__(self):
+        self.calls = 0
+
+    def geocode(self, location_string, timeout=None):
+        self.calls += 1
+        time.sleep(0.2)
+        return (51.5074, -0.1278, "London, England, United Kingdom")
+
+
+def test_safe_geocode_coalesces_equivalent_queries(monkeypatch):
+    geocoder = SlowGeocoder()
+    monkeypatch.setattr(geolocation, "geocode_flight", SingleFlight("geocode"))
+    geolocation.set_geocoder(geocoder)
+    geolocation.set_geocode_cache(None, enabled=False)
+    try:
+        names = iter(["London, UK", "london ,uk", "LONDON, UK", "London,  UK"])
+        lock = threading.Lock()
+
+        def lookup():
+            with lock:
+                name = next(names)
+            return geolocation.safe_geocode(name)
+
+        results, errors = run_concurrently(lookup, count=4)
+        assert not errors and len(results) == 4
+        assert geocoder.calls == 1
+        assert geolocation.geocode_flight.stats()["coalesced"] == 3
+    finally:
+        geolocation.set_geocoder(None)
+        geolocation.set_geocode_cache(None)
+
+
+def test_concurrent_judgments_share_one_chart_calculation(monkeypatch):
+    monkeypatch.setattr(engine_module, "chart_flight", SingleFlight("chart"))
+    engine = engine_module.EnhancedTraditionalHoraryJudgmentEngine()
+    calculate_chart = engine.calculator.calculate_chart
+    charts = []
+
+    def slow_calculate_chart(*args, **kwargs):
+        time.sleep(0.2)
+        charts.append(calculate_chart(*args, **kwargs))
+        return charts[-1]
+
+    monkeypatch.setattr(engine.calculator, "calculate_chart", slow_calculate_chart)
+    dt = datetime.datetime(2024, 3, 15, 10, 30, tzinfo=datetime.timezone.utc)
+    moment = engine_module.ChartMoment(51.5074, -0.1278, "London", dt, dt, "UTC")
+
+    results, errors = run_concurrently(
+        lambda: engine.judge_question("Will I get the job?", "London", moment=moment), count=4)
+    assert not errors and len(charts) == 1
+    assert engine_module.chart_flight.stats()["coalesced"] == 3
+    assert all(result["judgment"] == results[0]["judgment"] for result in results)
+
+    # Each caller gets a copy with its own positions and aspects
+    chart = engine_module.copy_chart(charts[0])
+    assert chart.planets is not charts[0].planets and chart.aspects is not charts[0].aspects
+    assert chart.planets[Planet.SUN] is not charts[0].planets[Planet.SUN]
+    assert chart.aspects[0] is not charts[0].aspects[0] and chart.aspects[0] == charts[0].aspects[0]
@@ -0,0 +1,44 @@
+import os
+import sys
+
+import swisseph as swe
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from horary_engine.calculation.helpers import calculate_next_station_time
+from horary_engine.calculation.stations import StationIndex, search_next_station
+
+
+JD_2024 = swe.julday(2024, 1, 1, 0.0)
+
+
+def test_index_matches_direct_search():
+    index = StationIndex.build(JD_2024, JD_2024 + 730, planet_ids=[swe.MERCURY, swe.MARS])
+    assert len(index.stations[swe.MERCURY]) >= 10
+
+    for offset in (0.0, 37.5, 190.25, 400.0):
+        jd = JD_2024 + offset
+        for planet_id in (swe.MERCURY, swe.MARS):
+            assert index.covers(planet_id, jd, 200)
+            expected = search_next_station(planet_id, jd, 200)
+            actual = index.next_station(planet_id, jd, 200)
+            if expected is None:
+                assert actual is None
+            else:
+                assert abs(actual - expected) < 0.002
+
+
+def test_index_round_trip_and_coverage(tmp_path):
+    index = StationIndex.build(JD_2024, JD_2024 + 365, planet_ids=[swe.VENUS])
+    path = tmp_path / "stations.json"
+    index.save(path)
+
+    loaded = StationIndex.load(path)
+    assert loaded.stations == index.stations
+    assert not loaded.covers(swe.VENUS, JD_2024 - 10, 30)
+    assert not loaded.covers(swe.SATURN, JD_2024, 30)
+
+
+def test_luminaries_never_station():
+    assert calculate_next_station_time(swe.SUN, JD_2024) is None
+    assert calculate_next_station_time(swe.MOON, JD_2024) is None
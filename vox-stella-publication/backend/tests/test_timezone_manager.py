@@ -0,0 +1,79 @@
+import os
+import sys
+import threading
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from horary_engine.services import geolocation
+from horary_engine.services.geolocation import TimezoneManager, get_timezone_manager
+
+
+def test_shared_manager_is_created_once(monkeypatch):
+    monkeypatch.setattr(geolocation, "_timezone_manager", None)
+    created = []
+    original = TimezoneManager.__init__
+
+    def counting_init(self, *args, **kwargs):
+        created.append(self)
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(TimezoneManager, "__init__", counting_init)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(get_timezone_manager())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(manager is results[0] for manager in results)
+
+
+def test_in_memory_and_file_backed_agree():
+    file_backed = TimezoneManager()
+    in_memory = TimezoneManager(in_memory=True)
+    for lat, lon in [(51.5074, -0.1278), (40.7128, -74.0060), (31.7683, 35.2137), (-33.8688, 151.2093)]:
+        assert in_memory.timezone_at(lat, lon) == file_backed.timezone_at(lat, lon)
+    assert in_memory.get_timezone_for_location(31.7683, 35.2137) == "Asia/Jerusalem"
+
+
+def test_grid_cache_hits_and_border_bypass():
+    manager = TimezoneManager(grid_degrees=0.05)
+
+    assert manager.get_timezone_for_location(51.5074, -0.1278) == "Europe/London"
+    assert manager.get_timezone_for_location(51.5080, -0.1290) == "Europe/London"
+    stats = manager.cache_stats()
+    assert (stats["misses"], stats["hits"]) == (1, 1)
+
+    # Cells straddling a zone border are never answered from the cache:
+    # El Paso (America/Denver) sits across the river from Ciudad Juarez.
+    for lat, lon in [(31.7619, -106.4850), (31.7400, -106.4870), (31.7619, -106.4850)]:
+        assert manager.get_timezone_for_location(lat, lon) == TimezoneManager(grid_degrees=0).get_timezone_for_location(lat, lon)
+    assert manager.cache_stats()["border_bypasses"] >= 1
+
+    # Cells crossing the edge of a validation box bypass too
+    assert manager.get_timezone_for_location(29.48, 34.9) == manager.get_timezone_for_location(29.48, 34.9)
+    assert manager.cache_stats()["border_bypasses"] >= 2
+
+
+def test_enclave_inside_a_cell_bypasses_the_cache(monkeypatch):
+    manager = TimezoneManager(grid_degrees=1.0)
+
+    # An enclave around the centre of the cell (10-11N, 10-11E) that none
+    # of its corners fall in
+    def timezone_at(lat, lon):
+        return "Africa/Douala" if abs(lat - 10.5) < 0.2 and abs(lon - 10.5) < 0.2 else "Africa/Lagos"
+
+    monkeypatch.setattr(manager, "timezone_at", timezone_at)
+    assert manager.get_timezone_for_location(10.1, 10.1) == "Africa/Lagos"
+    assert manager.get_timezone_for_location(10.5, 10.5) == "Africa/Douala"
+    assert manager.cache_stats()["border_bypasses"] == 1
+
+
+def test_zone_objects_are_reused():
+    manager = TimezoneManager()
+    first, _, used = manager.get_current_time_for_location(40.7128, -74.0060)
+    local, utc, _ = manager.parse_datetime_with_timezone("15/03/2024", "10:30", lat=40.7128, lon=-74.0060)
+    assert used == "America/New_York"
+    assert local.tzinfo is first.tzinfo is manager.get_zone("America/New_York")
+    assert utc.hour == 14